@@ -0,0 +1,22 @@
+"""Helpers for loading host modules in benchmarks without starting the host agent."""
+
+import os
+import sys
+import types
+
+HOST_PACKAGE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "host_agent_adk", "host"
+)
+
+
+def register_host_package() -> None:
+    """Registers ``host`` as a bare package so submodules import without running ``host/__init__``.
+
+    ``host/__init__`` builds the ADK root agent; the benchmarks only need the
+    pure matching and caching modules.
+    """
+    if "host" in sys.modules:
+        return
+    package = types.ModuleType("host")
+    package.__path__ = [HOST_PACKAGE_DIR]
+    sys.modules["host"] = package
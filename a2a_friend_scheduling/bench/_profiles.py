@@ -0,0 +1,42 @@
+"""Synthetic student profiles for benchmarks."""
+
+import random
+from typing import List
+
+PHRASES = [
+    "HTML/CSS basics", "JavaScript fundamentals", "React and frontend development",
+    "UI/UX design principles", "Basic responsive design", "Python programming",
+    "API development", "Database design and SQL", "CrewAI framework", "Server administration",
+    "Project management", "Team leadership", "Mentoring junior developers",
+    "Quiet and thoughtful", "Prefers written communication", "Introverted and reserved",
+    "Friendly, enthusiastic, and helpful", "Loves explaining technical concepts clearly",
+    "Confident in technical discussions", "I'm still learning", "Not very confident",
+    "Excellent at time management", "Experienced with code review", "Strong debugging skills",
+    "AI and machine learning", "Web development", "Competitive programming",
+    "Pixel art and digital design", "Working on small personal projects alone",
+    "Pickleball", "Indie video games", "Open source contributions", "Agile methodology",
+]
+
+
+def synthetic_profiles(count: int, seed: int = 7, phrases_per_profile: int = 8) -> List[str]:
+    """Builds ``count`` free-text profiles from a fixed phrase pool."""
+    rng = random.Random(seed)
+    return [
+        "Technical Skills: " + ", ".join(rng.sample(PHRASES, phrases_per_profile))
+        for _ in range(count)
+    ]
+
+
+def synthetic_profile_data(count: int, seed: int = 7, phrases_per_field: int = 4) -> List[dict]:
+    """Builds ``count`` structured profiles in the shape of the ``profile`` skill's DataPart."""
+    rng = random.Random(seed)
+    return [
+        {
+            "technical_skills": rng.sample(PHRASES, phrases_per_field),
+            "interests": rng.sample(PHRASES, phrases_per_field),
+            "personality_traits": rng.sample(PHRASES, phrases_per_field // 2),
+            "communication_style": rng.choice(PHRASES),
+            "learning_style": rng.choice(PHRASES),
+        }
+        for _ in range(count)
+    ]
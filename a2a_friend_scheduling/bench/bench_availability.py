@@ -0,0 +1,106 @@
+"""Compares the host's bitset availability solver with a day-by-day set intersection.
+
+Needs only pydantic. Run from ``a2a_friend_scheduling``::
+
+    python bench/bench_availability.py --students 200 --days 365
+
+Every student gets a random calendar with its own start and horizon, in the
+same shape the ``availability`` skill returns. Random teams are then asked for
+their earliest common slots. Both solvers must give the same answer for every
+team.
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from _host import register_host_package
+
+register_host_package()
+
+from host.availability import Availability, AvailabilitySolver  # noqa: E402
+
+SLOT_TIMES = [f"{h:02}:00" for h in range(8, 21)]
+
+
+def random_availability(rng: random.Random, epoch: date, days: int, free_per_day: int) -> Availability:
+    return Availability(
+        start=epoch + timedelta(days=rng.randrange(-7, 7)),
+        slot_times=SLOT_TIMES,
+        masks=[
+            sum(1 << i for i in rng.sample(range(len(SLOT_TIMES)), free_per_day))
+            for _ in range(days - rng.randrange(days // 4 + 1))
+        ],
+    )
+
+
+def free_sets(availability: dict[str, Availability]) -> dict[str, dict[date, set[str]]]:
+    """Each student's free slot strings per day."""
+    return {
+        name: {
+            a.start + timedelta(days=i): {slot for j, slot in enumerate(a.slot_times) if mask >> j & 1}
+            for i, mask in enumerate(a.masks)
+        }
+        for name, a in availability.items()
+    }
+
+
+def set_earliest(free: dict[str, dict[date, set[str]]], epoch: date, last: date, team: list[str], k: int):
+    """Intersects the team's free sets one day at a time until ``k`` slots are found."""
+    slots = []
+    day = epoch
+    while day < last and len(slots) < k:
+        common = set(SLOT_TIMES)
+        for name in team:
+            common &= free[name].get(day, set())
+        slots.extend((day, slot) for slot in sorted(common)[: k - len(slots)])
+        day += timedelta(days=1)
+    return slots
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=200)
+    parser.add_argument("--days", type=int, default=365, help="calendar horizon")
+    parser.add_argument("--teams", type=int, default=1_000)
+    parser.add_argument("--team-size", type=int, default=4)
+    parser.add_argument("--free-per-day", type=int, default=6, help="free slots in each 13-slot day")
+    parser.add_argument("-k", type=int, default=5, help="earliest common slots per team")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    epoch = date(2026, 1, 5)
+    availability = {
+        f"Student {i}": random_availability(rng, epoch, args.days, args.free_per_day)
+        for i in range(args.students)
+    }
+    names = list(availability)
+    teams = [rng.sample(names, args.team_size) for _ in range(args.teams)]
+
+    start = time.perf_counter()
+    solver = AvailabilitySolver(availability, epoch)
+    build_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    bitset_answers = solver.earliest_for_teams(teams, args.k)
+    bitset_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    free = free_sets(availability)
+    set_build_elapsed = time.perf_counter() - start
+    last = max(a.start + timedelta(days=len(a.masks)) for a in availability.values())
+    start = time.perf_counter()
+    set_answers = [set_earliest(free, epoch, last, team, args.k) for team in teams]
+    set_elapsed = time.perf_counter() - start
+    for team, expected, got in zip(teams, set_answers, bitset_answers):
+        if got != expected:
+            raise SystemExit(f"FAIL: solvers disagree for {team}: {got} vs {expected}")
+    print(f"OK: {args.teams} teams of {args.team_size} agree over a {args.days}-day horizon")
+
+    print(f"{'':8} {'build ms':>9} {'us/team':>9}")
+    print(f"{'sets':8} {set_build_elapsed * 1000:9.1f} {set_elapsed / args.teams * 1e6:9.1f}")
+    print(f"{'bitset':8} {build_elapsed * 1000:9.1f} {bitset_elapsed / args.teams * 1e6:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Compares availability lookups on the original string calendar with the bitmask calendar.
+
+Needs only the standard library. Run from ``a2a_friend_scheduling``::
+
+    python bench/bench_calendar.py --days 365 --queries 2000
+
+The original calendar is a dict from ``YYYY-MM-DD`` strings to lists of slot
+strings, walked day by day with ``strftime``. Both calendars hold the same random
+slots; every query's answers are checked to match before anything is timed.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "nate_agent_crewai"))
+
+from calendar_index import generate_calendar, slot_names  # noqa: E402
+
+
+def legacy_calendar(calendar) -> dict[str, list[str]]:
+    return {
+        day.strftime("%Y-%m-%d"): list(slot_names(mask))
+        for day, mask in calendar.range(calendar.start, calendar.end)
+    }
+
+
+def legacy_query(calendar: dict[str, list[str]], start: date, end: date) -> list[tuple[date, tuple[str, ...]]]:
+    """The original AvailabilityTool walk: one strftime and dict lookup per day."""
+    results = []
+    for i in range((end - start).days + 1):
+        day = start + timedelta(days=i)
+        results.append((day, tuple(calendar.get(day.strftime("%Y-%m-%d"), []))))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=365, help="calendar horizon")
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--max-span", type=int, default=30, help="longest queried range in days")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    calendar = generate_calendar(args.days, rng=rng)
+    legacy = legacy_calendar(calendar)
+    ranges = []
+    for _ in range(args.queries):
+        # Some ranges run past either end of the horizon
+        start = calendar.start + timedelta(days=rng.randrange(-5, args.days))
+        ranges.append((start, start + timedelta(days=rng.randrange(args.max_span))))
+
+    bulk = calendar.query(ranges)
+    for (start, end), days in zip(ranges, bulk):
+        if [(day, slot_names(mask)) for day, mask in days] != legacy_query(legacy, start, end):
+            raise SystemExit(f"FAIL: bitmask calendar disagrees on {start} to {end}")
+    print(f"OK: {args.queries} ranges agree over a {args.days}-day horizon")
+
+    start_time = time.perf_counter()
+    for start, end in ranges:
+        legacy_query(legacy, start, end)
+    legacy_elapsed = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    calendar.query(ranges)
+    bitmask_elapsed = time.perf_counter() - start_time
+
+    print(f"{'':10} {'us/query':>9} {'KiB held':>9}")
+    # Slot strings are shared between days, so only keys and lists count
+    legacy_bytes = sys.getsizeof(legacy) + sum(
+        sys.getsizeof(key) + sys.getsizeof(slots) for key, slots in legacy.items()
+    )
+    print(f"{'dict':10} {legacy_elapsed / args.queries * 1e6:9.1f} {legacy_bytes / 1024:9.1f}")
+    print(f"{'bitmask':10} {bitmask_elapsed / args.queries * 1e6:9.1f} {sys.getsizeof(calendar.masks) / 1024:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
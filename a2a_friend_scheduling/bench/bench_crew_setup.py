@@ -0,0 +1,101 @@
+"""Measures per-request setup cost of Nate's crew: rebuilt per request versus a reused template.
+
+Needs Nate's environment (crewai). Run from ``a2a_friend_scheduling``::
+
+    uv run --project nate_agent_crewai python bench/bench_crew_setup.py --requests 200
+
+A stub LLM answers instantly, so the end-to-end numbers are pure framework overhead.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from datetime import date
+
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "nate_agent_crewai"))
+
+from crewai import Agent, BaseLLM, Crew, Process, Task  # noqa: E402
+
+from agent import AvailabilityTool, SchedulingAgent, SkillsTool  # noqa: E402
+
+
+class StubLLM(BaseLLM):
+    """Answers every prompt immediately with a fixed final answer."""
+
+    def __init__(self):
+        super().__init__(model="stub")
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None):
+        return "Thought: I now know the final answer\nFinal Answer: Hi, I'm Nate and I love Python!"
+
+
+def legacy_invoke(llm: BaseLLM, question: str, kickoff: bool = True) -> str:
+    """The original SchedulingAgent.invoke: a new Agent, Task and verbose Crew per request."""
+    student_agent = Agent(
+        role="Student Representative - Nate",
+        goal="Share information about Nate's skills, interests, and availability as a student.",
+        backstory="You are Nate, a friendly and enthusiastic student.",
+        verbose=True,
+        allow_delegation=False,
+        tools=[AvailabilityTool(), SkillsTool()],
+        llm=llm,
+    )
+    response_task = Task(
+        description=(
+            f"Answer the user's question about Nate. The user asked: '{question}'. "
+            f"Today's date is {date.today().strftime('%Y-%m-%d')}. "
+        ),
+        expected_output="A friendly and informative response about Nate.",
+        agent=student_agent,
+    )
+    crew = Crew(
+        agents=[student_agent],
+        tasks=[response_task],
+        process=Process.sequential,
+        verbose=True,
+    )
+    return str(crew.kickoff()) if kickoff else ""
+
+
+def per_request_ms(run, requests: int) -> float:
+    # Verbose crews print every step; swallow it so only the formatting cost is timed
+    with contextlib.redirect_stdout(io.StringIO()):
+        run(0)
+        start = time.perf_counter()
+        for i in range(requests):
+            run(i)
+        return (time.perf_counter() - start) * 1000 / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    llm = StubLLM()
+    quiet = SchedulingAgent(llm=llm, verbose=False)
+    verbose = SchedulingAgent(llm=llm, verbose=True)
+
+    answers = {quiet.invoke(f"question {i}") for i in range(3)}
+    if answers != {"Hi, I'm Nate and I love Python!"}:
+        raise SystemExit(f"FAIL: reused crew returned {answers}")
+
+    print(f"{'':32} {'ms/request':>10}")
+    rows = [
+        ("setup: rebuild crew", lambda i: legacy_invoke(llm, f"q{i}", kickoff=False)),
+        ("setup: reuse template", lambda i: quiet.crew),
+        ("end-to-end: rebuild + verbose", lambda i: legacy_invoke(llm, f"q{i}")),
+        ("end-to-end: template + verbose", lambda i: verbose.invoke(f"q{i}")),
+        ("end-to-end: template, quiet", lambda i: quiet.invoke(f"q{i}")),
+    ]
+    for label, run in rows:
+        print(f"{label:32} {per_request_ms(run, args.requests):10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compares cached profile feature extraction against uncached per-keyword substring scans.
+
+Run from ``a2a_friend_scheduling``::
+
+    python bench/bench_feature_cache.py --profiles 200 --repeat 20
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from _host import register_host_package
+from _profiles import synthetic_profiles
+
+register_host_package()
+
+from host.compatibility_scoring import (  # noqa: E402
+    FEATURE_KEYWORDS,
+    CompatibilityScorer,
+    extract_features,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20, help="profile length multiplier (verbose LLM prose)")
+    args = parser.parse_args()
+
+    scorer = CompatibilityScorer()
+    keyword_count = sum(len(keywords) for keywords in FEATURE_KEYWORDS.values())
+    print(f"{keyword_count} keywords in {len(FEATURE_KEYWORDS)} features")
+
+    for repeat in (1, args.repeat):
+        profiles = [" ".join([profile] * repeat) for profile in synthetic_profiles(args.profiles)]
+        average_length = sum(map(len, profiles)) // len(profiles)
+
+        start = time.perf_counter()
+        reference = [extract_features(profile) for profile in profiles]
+        scan_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        first_pass = [scorer.features(profile) for profile in profiles]
+        first_pass_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for profile in profiles:
+            scorer.features(profile)
+        cached_seconds = time.perf_counter() - start
+
+        if not all(np.array_equal(a, b) for a, b in zip(reference, first_pass)):
+            raise SystemExit("FAIL: scorer features differ from the substring scans")
+
+        print(f"\n{len(profiles)} profiles, ~{average_length} chars each: features match")
+        print(f"per-keyword scans : {scan_seconds * 1000:8.2f} ms")
+        print(f"scorer, uncached  : {first_pass_seconds * 1000:8.2f} ms")
+        print(f"cached (by hash)  : {cached_seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
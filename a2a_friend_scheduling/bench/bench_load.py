@@ -0,0 +1,239 @@
+"""Drives the host's send_message and find_best_teammate against an in-process roster of student agents.
+
+Needs the host's environment (ADK, a2a-sdk, uvicorn). Runs offline from ``a2a_friend_scheduling``::
+
+    uv run --project host_agent_adk python bench/bench_load.py --rosters 10 50 200 --concurrency 1 8 32
+
+Every synthetic student is a real A2A server (mounted side by side on one local
+uvicorn server in this process), so requests go through the host's connection
+pool, the A2A client and server, the task store and streaming. The model behind
+each student is a deterministic stub that answers after ``--llm-latency``
+seconds. The structured ``profile`` skill answers without it, as in the real
+agents; ``--text-profiles`` turns that skill off so profiles go through the stub
+model too.
+
+Each row reports per-call latency percentiles, calls per second and the
+process's resident memory after the run.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import io
+import os
+import random
+import resource
+import socket
+import statistics
+import sys
+import tempfile
+import time
+import types
+
+# Keep the benchmark's skill index out of the real one
+os.environ.setdefault("HOST_SKILL_INDEX_DIR", tempfile.mkdtemp(prefix="bench_skill_index_"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "host_agent_adk"))
+
+import uvicorn  # noqa: E402
+from a2a.server.agent_execution import AgentExecutor, RequestContext  # noqa: E402
+from a2a.server.apps import A2AStarletteApplication  # noqa: E402
+from a2a.server.events import EventQueue  # noqa: E402
+from a2a.server.request_handlers import DefaultRequestHandler  # noqa: E402
+from a2a.server.tasks import InMemoryTaskStore, TaskUpdater  # noqa: E402
+from a2a.types import (  # noqa: E402
+    AgentCapabilities,
+    AgentCard,
+    AgentSkill,
+    DataPart,
+    Part,
+    TaskState,
+    TextPart,
+)
+from starlette.applications import Starlette  # noqa: E402
+from scheduling_common.skills import PROFILE_SKILL_ID, is_profile_request  # noqa: E402
+from starlette.routing import Mount  # noqa: E402
+
+from _profiles import synthetic_profile_data  # noqa: E402
+
+with contextlib.redirect_stdout(io.StringIO()):
+    # Importing the host builds its module-level root agent, which prints progress
+    from host.agent import HostAgent  # noqa: E402
+
+class StubLLM:
+    """Deterministic stand-in for the students' model clients.
+
+    Answers after a fixed latency, with text chosen from the student's profile
+    by a hash of the prompt, so repeated runs produce identical replies.
+    """
+
+    def __init__(self, profile: dict, latency: float):
+        self.profile = profile
+        self.latency = latency
+
+    async def generate(self, prompt: str) -> str:
+        await asyncio.sleep(self.latency)
+        skills = self.profile["technical_skills"]
+        pick = int.from_bytes(hashlib.blake2b(prompt.encode(), digest_size=2).digest(), "big")
+        return (
+            f"I'm good at {', '.join(skills)}, and lately mostly {skills[pick % len(skills)]}. "
+            f"I'm into {', '.join(self.profile['interests'])}. "
+            f"My communication style: {self.profile['communication_style']}."
+        )
+
+
+class StubStudentExecutor(AgentExecutor):
+    """Answers like the real student executors: the profile skill from data, everything else from the model."""
+
+    def __init__(self, profile: dict, llm: StubLLM):
+        self.profile = profile
+        self.llm = llm
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        updater = TaskUpdater(event_queue, context.task_id, context.context_id)
+        if not context.current_task:
+            await updater.submit()
+        await updater.start_work()
+        if is_profile_request(context.message):
+            await updater.add_artifact([Part(root=DataPart(data=self.profile))], name="profile")
+        else:
+            answer = await self.llm.generate(context.get_user_input())
+            await updater.add_artifact([Part(root=TextPart(text=answer))], name="answer")
+        await updater.complete()
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        """Publishes the canceled status; the request handler stops the running execute()."""
+        updater = TaskUpdater(event_queue, context.task_id, context.context_id)
+        await updater.update_status(TaskState.canceled, final=True)
+
+
+def build_roster_app(base_url: str, size: int, llm_latency: float, text_profiles: bool) -> Starlette:
+    """Mounts ``size`` synthetic student agents at ``/student-<i>/``."""
+    mounts = []
+    for i, profile in enumerate(synthetic_profile_data(size)):
+        skills = [AgentSkill(id="student_assistant", name="Student Assistant", description="Chat", tags=["student"])]
+        if not text_profiles:
+            skills.append(
+                AgentSkill(id=PROFILE_SKILL_ID, name="Structured Profile", description="Profile", tags=["profile"])
+            )
+        card = AgentCard(
+            name=f"Student {i}",
+            description=f"Synthetic student {i}",
+            url=f"{base_url}/student-{i}/",
+            version="1.0.0",
+            defaultInputModes=["text/plain"],
+            defaultOutputModes=["text/plain"],
+            capabilities=AgentCapabilities(streaming=True),
+            skills=skills,
+        )
+        handler = DefaultRequestHandler(
+            agent_executor=StubStudentExecutor(profile, StubLLM(profile, llm_latency)),
+            task_store=InMemoryTaskStore(),
+        )
+        mounts.append(Mount(f"/student-{i}", app=A2AStarletteApplication(card, handler).build()))
+    return Starlette(routes=mounts)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_mib() -> float:
+    """Current resident set size on Linux, else the peak."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+
+async def measure(call, concurrency: int, calls: int) -> tuple[list[float], float]:
+    """Runs ``calls`` calls from ``concurrency`` loops; returns latencies and elapsed seconds."""
+    latencies: list[float] = []
+    remaining = iter(range(calls))
+
+    async def loop():
+        for i in remaining:
+            start = time.perf_counter()
+            await call(i)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        await asyncio.gather(*(loop() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - start
+
+
+def report(label: str, roster: int, concurrency: int, latencies: list[float], elapsed: float) -> None:
+    cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    print(
+        f"{label:24} {roster:6} {concurrency:5}"
+        f" {cuts[49] * 1000:8.1f} {cuts[94] * 1000:8.1f} {cuts[98] * 1000:8.1f}"
+        f" {len(latencies) / elapsed:8.1f} {rss_mib():8.1f}"
+    )
+
+
+async def run_roster(args, size: int) -> None:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    app = build_roster_app(base_url, size, args.llm_latency, args.text_profiles)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    addresses = [f"{base_url}/student-{i}/" for i in range(size)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        host = HostAgent(remote_agent_addresses=addresses)
+        failed = await host._async_init_components(addresses)
+    if failed:
+        raise SystemExit(f"FAIL: {len(failed)} synthetic agents were not discovered")
+    names = sorted(host.remote_agent_connections)
+    rng = random.Random(size)
+    tool_context = types.SimpleNamespace(state={})
+
+    async def send(i: int):
+        parts = await host.send_message(rng.choice(names), "What are your skills?", tool_context)
+        if not parts:
+            raise SystemExit("FAIL: send_message returned no answer")
+
+    async def match(i: int, cold: bool):
+        if cold:
+            host.profile_cache.clear()
+        result = await host.find_best_teammate(rng.choice(names), tool_context, k=3)
+        if "Best Teammate Recommendation" not in result:
+            raise SystemExit(f"FAIL: find_best_teammate returned {result[:200]!r}")
+
+    try:
+        for concurrency in args.concurrency:
+            report("send_message", size, concurrency, *await measure(send, concurrency, args.calls))
+        for concurrency in args.concurrency:
+            latencies, elapsed = await measure(lambda i: match(i, cold=True), concurrency, args.calls)
+            report("find_best_teammate cold", size, concurrency, latencies, elapsed)
+            latencies, elapsed = await measure(lambda i: match(i, cold=False), concurrency, args.calls)
+            report("find_best_teammate warm", size, concurrency, latencies, elapsed)
+    finally:
+        await host.aclose()
+        server.should_exit = True
+        await serving
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rosters", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--calls", type=int, default=64, help="calls per row")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="stub model latency in seconds")
+    parser.add_argument("--text-profiles", action="store_true", help="do not advertise the profile skill")
+    args = parser.parse_args()
+
+    print(f"stub model latency {args.llm_latency * 1000:.0f} ms, {args.calls} calls per row")
+    print(f"{'':24} {'roster':>6} {'conc':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'calls/s':>8} {'rss MiB':>8}")
+    for size in args.rosters:
+        await run_roster(args, size)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
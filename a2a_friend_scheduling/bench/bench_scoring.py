@@ -0,0 +1,133 @@
+"""Checks the vectorized scorer against the original per-pair rules and times both.
+
+Run from ``a2a_friend_scheduling``::
+
+    python bench/bench_scoring.py --students 200
+"""
+
+import argparse
+import time
+from typing import Tuple
+
+from _host import register_host_package
+from _profiles import synthetic_profiles
+
+register_host_package()
+
+from host.compatibility_scoring import CompatibilityScorer  # noqa: E402
+
+
+def legacy_analyze_compatibility(requester_profile: str, candidate_profile: str) -> Tuple[float, str]:
+    """The original TeammateMatchingEngine.analyze_compatibility, kept as the reference."""
+    req_profile = requester_profile.lower()
+    cand_profile = candidate_profile.lower()
+
+    compatibility_score = 0.0
+    reasoning_points = []
+
+    frontend_skills = ['html', 'css', 'javascript', 'react', 'ui', 'ux', 'frontend', 'design', 'responsive']
+    backend_skills = ['python', 'api', 'backend', 'database', 'sql', 'server', 'crewai']
+    leadership_skills = ['leadership', 'project management', 'team', 'organize', 'mentor', 'lead']
+    communication_styles = {
+        'introvert': ['introvert', 'quiet', 'reserved', 'shy', 'thoughtful', 'prefer written'],
+        'extrovert': ['extrovert', 'enthusiastic', 'outgoing', 'friendly', 'loves explaining', 'confident']
+    }
+    experience_levels = {
+        'beginner': ['basic', 'learning', 'beginner', 'still learning', 'not confident', 'improving'],
+        'advanced': ['expert', 'experienced', 'advanced', 'confident', 'strong', 'excellent']
+    }
+
+    req_frontend = any(skill in req_profile for skill in frontend_skills)
+    req_backend = any(skill in req_profile for skill in backend_skills)
+    req_leadership = any(skill in req_profile for skill in leadership_skills)
+
+    cand_frontend = any(skill in cand_profile for skill in frontend_skills)
+    cand_backend = any(skill in cand_profile for skill in backend_skills)
+    cand_leadership = any(skill in cand_profile for skill in leadership_skills)
+
+    if req_frontend and cand_backend:
+        compatibility_score += 30
+        reasoning_points.append("Frontend + Backend skill complementarity")
+    elif req_backend and cand_frontend:
+        compatibility_score += 30
+        reasoning_points.append("Backend + Frontend skill complementarity")
+
+    if req_leadership and not cand_leadership:
+        compatibility_score += 20
+        reasoning_points.append("Leadership + Technical collaboration")
+    elif not req_leadership and cand_leadership:
+        compatibility_score += 20
+        reasoning_points.append("Technical + Leadership collaboration")
+
+    req_introvert = any(word in req_profile for word in communication_styles['introvert'])
+    req_extrovert = any(word in req_profile for word in communication_styles['extrovert'])
+    cand_introvert = any(word in cand_profile for word in communication_styles['introvert'])
+    cand_extrovert = any(word in cand_profile for word in communication_styles['extrovert'])
+
+    if (req_introvert and cand_extrovert) or (req_extrovert and cand_introvert):
+        compatibility_score += 25
+        reasoning_points.append("Balanced introvert-extrovert communication styles")
+
+    req_beginner = any(word in req_profile for word in experience_levels['beginner'])
+    req_advanced = any(word in req_profile for word in experience_levels['advanced'])
+    cand_beginner = any(word in cand_profile for word in experience_levels['beginner'])
+    cand_advanced = any(word in cand_profile for word in experience_levels['advanced'])
+
+    if (req_beginner and cand_advanced) or (req_advanced and cand_beginner):
+        compatibility_score += 15
+        reasoning_points.append("Mentor-learner experience balance")
+
+    common_interests = []
+    interest_keywords = ['ai', 'machine learning', 'web development', 'programming', 'design', 'projects']
+    for interest in interest_keywords:
+        if interest in req_profile and interest in cand_profile:
+            common_interests.append(interest)
+
+    if common_interests:
+        compatibility_score += 10
+        reasoning_points.append(f"Shared interests: {', '.join(common_interests)}")
+
+    if reasoning_points:
+        reasoning = "Strong compatibility due to: " + "; ".join(reasoning_points)
+    else:
+        reasoning = "Basic compatibility - could work well together with some shared foundation"
+        compatibility_score += 5
+
+    return compatibility_score, reasoning
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    profiles = synthetic_profiles(args.students, seed=args.seed) + ["Profile unavailable", ""]
+
+    start = time.perf_counter()
+    legacy = [[legacy_analyze_compatibility(a, b) for b in profiles] for a in profiles]
+    legacy_seconds = time.perf_counter() - start
+
+    scorer = CompatibilityScorer()
+    start = time.perf_counter()
+    matrix = scorer.pairwise_scores(profiles)
+    vectorized_seconds = time.perf_counter() - start
+
+    mismatches = 0
+    for i, requester in enumerate(profiles):
+        for j, candidate in enumerate(profiles):
+            score, reasoning = legacy[i][j]
+            if matrix[i, j] != score or scorer.explain(requester, candidate) != reasoning:
+                mismatches += 1
+    if mismatches:
+        raise SystemExit(f"FAIL: {mismatches} of {len(profiles) ** 2} pairs differ from the legacy rules")
+
+    pairs = len(profiles) ** 2
+    print(f"{len(profiles)} profiles, {pairs} pairs: scores and reasoning match the legacy rules")
+    print(f"legacy per-pair scans : {legacy_seconds * 1000:9.1f} ms")
+    print(f"vectorized matrix     : {vectorized_seconds * 1000:9.1f} ms "
+          f"({legacy_seconds / max(vectorized_seconds, 1e-9):.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
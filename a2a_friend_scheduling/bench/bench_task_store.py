@@ -0,0 +1,86 @@
+"""Soaks the A2A task stores with task lifecycles and tracks how much memory each one holds.
+
+Needs any student agent's environment (a2a-sdk). Run from ``a2a_friend_scheduling``::
+
+    uv run --project karley_agent_adk python bench/bench_task_store.py --tasks 20000
+
+Each task is saved as submitted, working and then completed with a text artifact,
+the way ``DefaultRequestHandler`` saves it.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+from a2a.server.tasks import InMemoryTaskStore, TaskStore
+from a2a.types import Artifact, Part, Task, TaskState, TaskStatus, TextPart
+from scheduling_common.task_store import BoundedTaskStore, SqliteTaskStore
+
+SAMPLES = 5
+
+
+async def run_lifecycle(store: TaskStore, answer: str) -> None:
+    task = Task(
+        id=str(uuid.uuid4()),
+        contextId=str(uuid.uuid4()),
+        status=TaskStatus(state=TaskState.submitted),
+    )
+    await store.save(task)
+    task.status = TaskStatus(state=TaskState.working)
+    await store.save(task)
+    task.status = TaskStatus(state=TaskState.completed)
+    task.artifacts = [Artifact(artifactId=str(uuid.uuid4()), parts=[Part(root=TextPart(text=answer))])]
+    await store.save(task)
+    if await store.get(task.id) is None:
+        raise SystemExit(f"FAIL: {type(store).__name__} lost task {task.id}")
+
+
+async def soak(store: TaskStore, tasks: int, answer: str) -> tuple[list[float], float]:
+    """Returns the traced memory (MiB) after each fifth of the run, and tasks per second."""
+    tracemalloc.start()
+    samples = []
+    start = time.perf_counter()
+    for i in range(1, tasks + 1):
+        await run_lifecycle(store, answer)
+        if i % (tasks // SAMPLES) == 0:
+            samples.append(tracemalloc.get_traced_memory()[0] / 2**20)
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+    return samples, tasks / elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=20_000)
+    parser.add_argument("--max-tasks", type=int, default=1_000)
+    parser.add_argument("--answer-bytes", type=int, default=2_000)
+    args = parser.parse_args()
+
+    answer = "x" * args.answer_bytes
+    with tempfile.TemporaryDirectory() as tmp:
+        stores = [
+            ("InMemoryTaskStore", InMemoryTaskStore()),
+            ("BoundedTaskStore", BoundedTaskStore(max_tasks=args.max_tasks)),
+            ("SqliteTaskStore", SqliteTaskStore(os.path.join(tmp, "tasks.sqlite"), max_tasks=args.max_tasks)),
+        ]
+        header = " ".join(f"{f'{(i + 1) * 100 // SAMPLES}% MiB':>9}" for i in range(SAMPLES))
+        print(f"{'':18} {header} {'tasks/s':>9} {'kept':>7}")
+        for label, store in stores:
+            samples, rate = await soak(store, args.tasks, answer)
+            kept = len(store.tasks) if hasattr(store, "tasks") else store.stats()["tasks"]
+            # The SQLite store only prunes every prune_interval saves
+            limit = args.max_tasks + getattr(store, "prune_interval", 0)
+            if not isinstance(store, InMemoryTaskStore) and kept > limit:
+                raise SystemExit(f"FAIL: {label} kept {kept} tasks, limit {args.max_tasks}")
+            row = " ".join(f"{sample:9.2f}" for sample in samples)
+            print(f"{label:18} {row} {rate:9.0f} {kept:7}")
+            if isinstance(store, SqliteTaskStore):
+                store.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
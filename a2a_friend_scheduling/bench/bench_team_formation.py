@@ -0,0 +1,67 @@
+"""Checks that whole-class team formation places every student, then times it.
+
+Run from ``a2a_friend_scheduling``::
+
+    python bench/bench_team_formation.py --max-students 60 --sizes 1000
+
+Every roster size up to ``--max-students`` is split at every team size from 2 to
+``--max-team-size``, including rosters with more leftover students than teams
+(e.g. 5 students in teams of 3). Each student must land in exactly one team and
+team sizes must differ by at most one.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from _host import register_host_package
+
+register_host_package()
+
+from host.team_formation import partition_into_teams, team_score, team_sizes  # noqa: E402
+
+
+def random_scores(n: int, rng: np.random.Generator) -> np.ndarray:
+    scores = rng.uniform(0, 100, (n, n))
+    return (scores + scores.T) / 2
+
+
+def check(scores: np.ndarray, team_size: int) -> None:
+    n = scores.shape[0]
+    teams = partition_into_teams(scores, team_size)
+    placed = sorted(student for team in teams for student in team)
+    if placed != list(range(n)):
+        raise SystemExit(f"FAIL: {n} students in teams of {team_size} placed as {teams}")
+    sizes = sorted((len(team) for team in teams), reverse=True)
+    if sizes != team_sizes(n, team_size):
+        raise SystemExit(f"FAIL: {n} students in teams of {team_size} got sizes {sizes}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-students", type=int, default=60)
+    parser.add_argument("--max-team-size", type=int, default=8)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1_000], help="rosters to time")
+    parser.add_argument("--team-size", type=int, default=4, help="team size for the timed rosters")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(3)
+    for n in range(1, args.max_students + 1):
+        scores = random_scores(n, rng)
+        for team_size in range(2, args.max_team_size + 1):
+            check(scores, team_size)
+    print(f"OK: every roster up to {args.max_students} students splits into balanced teams of 2-{args.max_team_size}")
+
+    print(f"{'roster':>8} {'teams':>6} {'ms':>9} {'avg team score':>15}")
+    for n in args.sizes:
+        scores = random_scores(n, rng)
+        start = time.perf_counter()
+        teams = partition_into_teams(scores, args.team_size)
+        elapsed = time.perf_counter() - start
+        average = sum(team_score(scores, team) for team in teams) / len(teams)
+        print(f"{n:8} {len(teams):6} {elapsed * 1000:9.1f} {average:15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Compares top-K retrieval from the roster index against scoring and sorting everyone.
+
+Run from ``a2a_friend_scheduling``::
+
+    python bench/bench_topk.py --k 3 --queries 200
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from _host import register_host_package
+
+register_host_package()
+
+from host.compatibility_scoring import NUM_FEATURES, score_against  # noqa: E402
+from host.teammate_ranking import RosterIndex  # noqa: E402
+
+
+def random_features(count: int, rng: np.random.Generator) -> np.ndarray:
+    """Sparse feature bits, roughly like keyword hits in real profiles."""
+    return rng.random((count, NUM_FEATURES)) < 0.3
+
+
+def check_ties(rng: np.random.Generator, rounds: int = 300) -> None:
+    """Checks top_k against sorted(...)[:k] on small rosters where most scores tie.
+
+    Candidates move between groups and leave the roster as the rounds go on, and
+    queries exclude names or restrict the candidates, as ``find_best_teammate`` does.
+    """
+    roster = RosterIndex()
+    # Insertion order of the reference roster: moving to a new group re-adds a name
+    features_of = {}
+    for round_number in range(rounds):
+        for _ in range(8):
+            name = f"student-{rng.integers(60)}"
+            if rng.random() < 0.15:
+                roster.remove(name)
+                features_of.pop(name, None)
+                continue
+            # Few distinct features, so whole groups share a score
+            features = np.zeros(NUM_FEATURES, dtype=bool)
+            features[rng.choice(4, size=rng.integers(3), replace=False)] = True
+            if name in features_of and not np.array_equal(features_of[name], features):
+                del features_of[name]
+            roster.update(name, features)
+            features_of.setdefault(name, features)
+        requester = random_features(1, rng)[0]
+        k = int(rng.integers(1, 6))
+        names = list(features_of)
+        exclude = set(rng.choice(names, size=min(2, len(names)), replace=False)) if names else set()
+        candidates = {name for name in names if rng.random() < 0.7} if round_number % 2 else None
+        scores = {name: float(score_against(requester, features_of[name])[0]) for name in names}
+        expected = sorted(
+            (name for name in names if name not in exclude and (candidates is None or name in candidates)),
+            key=lambda name: -scores[name],
+        )[:k]
+        got = roster.top_k(requester, k, exclude=exclude, candidates=candidates)
+        if [(name, scores[name]) for name in expected] != [tuple(candidate) for candidate in got]:
+            raise SystemExit(f"FAIL: top-{k} with tied scores differs from sorted(...)[:{k}] in round {round_number}")
+    print(f"tied scores: top_k matches sorted(...)[:k] over {rounds} rounds")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    check_ties(rng)
+    print(f"{'roster':>8} {'full sort ms/q':>15} {'top-k ms/q':>11} {'groups scored/q':>16}")
+    for size in args.sizes:
+        roster_features = random_features(size, rng)
+        names = [f"student-{i}" for i in range(size)]
+        roster = RosterIndex()
+        for name, features in zip(names, roster_features):
+            roster.update(name, features)
+        requesters = random_features(args.queries, rng)
+
+        start = time.perf_counter()
+        full = []
+        for requester in requesters:
+            scores = score_against(requester, roster_features)
+            order = np.argsort(-scores, kind="stable")[: args.k]
+            full.append([(names[i], float(scores[i])) for i in order])
+        full_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        groups_scored = 0
+        top = []
+        for requester in requesters:
+            top.append([tuple(candidate) for candidate in roster.top_k(requester, args.k)])
+            groups_scored += roster.last_groups_scored
+        top_seconds = time.perf_counter() - start
+
+        if top != full:
+            raise SystemExit(f"FAIL: top-{args.k} differs from the full sort at roster size {size}")
+        print(
+            f"{size:>8} {full_seconds * 1000 / args.queries:>15.3f} "
+            f"{top_seconds * 1000 / args.queries:>11.3f} {groups_scored / args.queries:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
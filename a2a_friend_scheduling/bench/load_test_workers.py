@@ -0,0 +1,147 @@
+"""Load-tests a student agent server at several worker counts and reports throughput.
+
+Run from ``a2a_friend_scheduling`` with the agent's own environment, e.g.::
+
+    uv run --project nate_agent_crewai python bench/load_test_workers.py --agent nate --workers 1 2 4
+
+For each worker count the server is started with ``<AGENT>_WORKERS``, with its
+tasks (and sessions) in a fresh SQLite file, as in a multi-worker deployment.
+It is then driven with ``profile`` skill requests, which go through the A2A
+request handling, JSON validation and the task store but never call a model, so
+no API key is needed. Throughput should scale with workers up to the number of cores.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# agent -> (directory, launch arguments, environment prefix)
+AGENTS = {
+    "nate": ("nate_agent_crewai", ["."], "NATE"),
+    "karley": ("karley_agent_adk", ["."], "KARLEY"),
+    "kaitlynn": ("kaitlynn_agent_langgraph", ["-m", "app"], "KAITLYNN"),
+}
+STARTUP_TIMEOUT = 120.0
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def profile_request() -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": str(uuid.uuid4()),
+        "method": "message/send",
+        "params": {
+            "message": {
+                "role": "user",
+                "messageId": uuid.uuid4().hex,
+                "parts": [{"kind": "data", "data": {"skill": "profile"}}],
+            }
+        },
+    }
+
+
+def start_server(agent: str, workers: int, port: int, state_dir: str) -> subprocess.Popen:
+    directory, launch, prefix = AGENTS[agent]
+    env = dict(os.environ)
+    env.setdefault("GOOGLE_API_KEY", "load-test")
+    env.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+    env.setdefault("OTEL_SDK_DISABLED", "true")
+    env.update(
+        {
+            f"{prefix}_WORKERS": str(workers),
+            f"{prefix}_HOST": "127.0.0.1",
+            f"{prefix}_PORT": str(port),
+            f"{prefix}_TASK_DB": os.path.join(state_dir, "tasks.sqlite"),
+            f"{prefix}_SESSION_DB": os.path.join(state_dir, "sessions.sqlite"),
+        }
+    )
+    return subprocess.Popen(
+        [sys.executable, *launch],
+        cwd=os.path.join(ROOT, directory),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_until_ready(client: httpx.AsyncClient, url: str, server: subprocess.Popen) -> None:
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f"FAIL: server exited with code {server.returncode}")
+        try:
+            if (await client.get(f"{url}.well-known/agent.json")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.5)
+    raise SystemExit("FAIL: server did not start in time")
+
+
+async def drive(client: httpx.AsyncClient, url: str, concurrency: int, duration: float) -> list[float]:
+    """Sends profile requests from ``concurrency`` loops for ``duration`` seconds; returns latencies."""
+    latencies: list[float] = []
+    deadline = time.perf_counter() + duration
+
+    async def loop():
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            response = await client.post(url, json=profile_request())
+            body = response.json()
+            if "error" in body or body["result"]["status"]["state"] != "completed":
+                raise SystemExit(f"FAIL: unexpected response {body}")
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(loop() for _ in range(concurrency)))
+    return latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agent", choices=sorted(AGENTS), default="nate")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    print(f"{args.agent}: {os.cpu_count()} cores, {args.concurrency} concurrent clients")
+    print(f"{'workers':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    for workers in args.workers:
+        port = free_port()
+        url = f"http://127.0.0.1:{port}/"
+        with tempfile.TemporaryDirectory() as state_dir:
+            server = start_server(args.agent, workers, port, state_dir)
+            try:
+                async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+                    await wait_until_ready(client, url, server)
+                    await drive(client, url, args.concurrency, 1.0)  # warm up every worker
+                    latencies = await drive(client, url, args.concurrency, args.duration)
+            finally:
+                server.terminate()
+                server.wait()
+        cuts = statistics.quantiles(latencies, n=20)
+        print(
+            f"{workers:7} {len(latencies) / args.duration:9.0f}"
+            f" {cuts[9] * 1000:8.1f} {cuts[18] * 1000:8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,3 @@
+"""
+Stores Shared by the Scheduling Agents
+"""
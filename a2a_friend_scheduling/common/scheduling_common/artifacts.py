@@ -0,0 +1,31 @@
+"""
+Streamed Answer Artifacts Published by the Student Agents
+"""
+
+from a2a.server.tasks import TaskUpdater
+from a2a.types import Artifact, Part, TaskArtifactUpdateEvent
+
+
+async def add_artifact_chunk(
+    updater: TaskUpdater,
+    parts: list[Part],
+    artifact_id: str,
+    name: str,
+    append: bool,
+    last_chunk: bool,
+) -> None:
+    """Publishes one chunk of a streamed artifact (``TaskUpdater.add_artifact`` cannot append).
+
+    A chunk without parts carries nothing for the client and is not published.
+    """
+    if not parts:
+        return
+    await updater.event_queue.enqueue_event(
+        TaskArtifactUpdateEvent(
+            taskId=updater.task_id,
+            contextId=updater.context_id,
+            artifact=Artifact(artifactId=artifact_id, name=name, parts=parts),
+            append=append,
+            lastChunk=last_chunk,
+        )
+    )
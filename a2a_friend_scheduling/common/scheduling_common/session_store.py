@@ -0,0 +1,173 @@
+"""
+Bounded ADK Session Store for the Host's and Karley's Runners
+"""
+
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.events import Event
+from google.adk.sessions import (
+    BaseSessionService,
+    DatabaseSessionService,
+    InMemorySessionService,
+    Session,
+)
+from google.adk.sessions.base_session_service import GetSessionConfig
+
+DEFAULT_MAX_SESSIONS = 1000
+DEFAULT_SESSION_TTL_SECONDS = 3600.0
+
+SessionKey = Tuple[str, str, str]
+
+
+class BoundedSessionService(InMemorySessionService):
+    """In-memory session service that evicts idle sessions.
+
+    - At most ``max_sessions`` sessions are kept; the least recently used one is
+      evicted first.
+    - Sessions untouched for longer than ``ttl_seconds`` are dropped.
+    - When an ``artifact_service`` is given, an evicted session's in-memory
+      artifacts are dropped with it.
+
+    App and user state are shared across sessions and are left alone.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        ttl_seconds: Optional[float] = DEFAULT_SESSION_TTL_SECONDS,
+        artifact_service: Optional[InMemoryArtifactService] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        super().__init__()
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.artifact_service = artifact_service
+        self._clock = clock
+        # (app_name, user_id, session_id) -> last access time, least recently used first
+        self._last_access: "OrderedDict[SessionKey, float]" = OrderedDict()
+        self.evicted_sessions = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _create_session_impl(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        self._evict_expired()
+        session = super()._create_session_impl(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+        self._touch((app_name, user_id, session.id))
+        while len(self._last_access) > self.max_sessions:
+            self._evict(next(iter(self._last_access)))
+        return session
+
+    def _get_session_impl(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        self._evict_expired()
+        session = super()._get_session_impl(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+        if session is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touch((app_name, user_id, session_id))
+        return session
+
+    def _delete_session_impl(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        key = (app_name, user_id, session_id)
+        self._last_access.pop(key, None)
+        users = self.sessions.get(app_name, {})
+        sessions = users.get(user_id, {})
+        if sessions.pop(session_id, None) is None:
+            return
+        # Drop empty containers so evicted users do not accumulate
+        if not sessions:
+            users.pop(user_id, None)
+        if not users:
+            self.sessions.pop(app_name, None)
+        if self.artifact_service is not None:
+            prefix = f"{app_name}/{user_id}/{session_id}/"
+            for path in [path for path in self.artifact_service.artifacts if path.startswith(prefix)]:
+                del self.artifact_service.artifacts[path]
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session=session, event=event)
+        key = (session.app_name, session.user_id, session.id)
+        if key in self._last_access:
+            self._touch(key)
+        return event
+
+    def stats(self) -> Dict[str, int]:
+        """Returns how many sessions and events are held and how many were evicted."""
+        return {
+            "sessions": len(self._last_access),
+            "events": sum(
+                len(session.events)
+                for users in self.sessions.values()
+                for sessions in users.values()
+                for session in sessions.values()
+            ),
+            "artifacts": len(self.artifact_service.artifacts) if self.artifact_service else 0,
+            "evicted_sessions": self.evicted_sessions,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _touch(self, key: SessionKey) -> None:
+        self._last_access[key] = self._clock()
+        self._last_access.move_to_end(key)
+
+    def _evict(self, key: SessionKey) -> None:
+        app_name, user_id, session_id = key
+        self._delete_session_impl(app_name=app_name, user_id=user_id, session_id=session_id)
+        self.evicted_sessions += 1
+
+    def _evict_expired(self) -> None:
+        if self.ttl_seconds is None:
+            return
+        deadline = self._clock() - self.ttl_seconds
+        while self._last_access:
+            key, last_access = next(iter(self._last_access.items()))
+            if last_access > deadline:
+                break
+            self._evict(key)
+
+
+def create_session_service(
+    prefix: str,
+    artifact_service: Optional[InMemoryArtifactService] = None,
+) -> BaseSessionService:
+    """Builds the session service configured by ``<prefix>_SESSION_*`` variables.
+
+    ``<prefix>_SESSION_DB`` selects a SQLite file (or any SQLAlchemy URL) that
+    keeps sessions on disk across restarts; otherwise sessions stay in memory,
+    bounded by ``<prefix>_MAX_SESSIONS`` and ``<prefix>_SESSION_TTL_SECONDS``.
+    """
+    db = os.getenv(f"{prefix}_SESSION_DB")
+    if db:
+        return DatabaseSessionService(db if "://" in db else f"sqlite:///{db}")
+
+    ttl_seconds = float(os.getenv(f"{prefix}_SESSION_TTL_SECONDS", DEFAULT_SESSION_TTL_SECONDS))
+    return BoundedSessionService(
+        max_sessions=int(os.getenv(f"{prefix}_MAX_SESSIONS", DEFAULT_MAX_SESSIONS)),
+        ttl_seconds=ttl_seconds if ttl_seconds > 0 else None,
+        artifact_service=artifact_service,
+    )
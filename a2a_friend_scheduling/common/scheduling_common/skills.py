@@ -0,0 +1,23 @@
+"""
+Structured Skill Requests Answered by the Student Agents
+"""
+
+from typing import Optional
+
+from a2a.types import DataPart, Message
+
+# AgentSkill id of the structured profile, answered without running the model
+PROFILE_SKILL_ID = "profile"
+
+
+def skill_request(message: Message, skill_id: str) -> Optional[dict]:
+    """The data part asking for structured skill ``skill_id``, if the message has one."""
+    for part in message.parts:
+        if isinstance(part.root, DataPart) and part.root.data.get("skill") == skill_id:
+            return part.root.data
+    return None
+
+
+def is_profile_request(message: Message) -> bool:
+    """True when the message asks for the structured profile skill."""
+    return skill_request(message, PROFILE_SKILL_ID) is not None
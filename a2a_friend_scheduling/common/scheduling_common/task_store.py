@@ -0,0 +1,227 @@
+"""
+Bounded A2A Task Stores for the Student Agent Servers
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from a2a.server.tasks import TaskStore
+from a2a.types import Task, TaskState
+
+DEFAULT_MAX_TASKS = 1000
+DEFAULT_TASK_TTL_SECONDS = 600.0
+# The SQLite store applies its retention policy once every this many saves
+DEFAULT_PRUNE_INTERVAL = 64
+
+TERMINAL_STATES = frozenset(
+    {TaskState.completed, TaskState.canceled, TaskState.failed, TaskState.rejected}
+)
+
+
+def is_terminal(task: Task) -> bool:
+    return task.status.state in TERMINAL_STATES
+
+
+class BoundedTaskStore(TaskStore):
+    """In-memory task store with a retention policy.
+
+    - Finished tasks (completed, canceled, failed or rejected) are dropped
+      ``ttl_seconds`` after they finished, leaving clients that window to fetch
+      the result.
+    - At most ``max_tasks`` tasks are kept. Past that, the oldest finished task
+      is evicted first, then the least recently used unfinished one.
+    """
+
+    def __init__(
+        self,
+        max_tasks: int = DEFAULT_MAX_TASKS,
+        ttl_seconds: Optional[float] = DEFAULT_TASK_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_tasks < 1:
+            raise ValueError("max_tasks must be at least 1")
+        self.max_tasks = max_tasks
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # task_id -> task, least recently used first
+        self.tasks: "OrderedDict[str, Task]" = OrderedDict()
+        # task_id -> time it reached a terminal state, oldest first
+        self._finished_at: "OrderedDict[str, float]" = OrderedDict()
+        self.lock = asyncio.Lock()
+        self.evicted_tasks = 0
+
+    async def save(self, task: Task) -> None:
+        async with self.lock:
+            self.tasks[task.id] = task
+            self.tasks.move_to_end(task.id)
+            if is_terminal(task):
+                self._finished_at.setdefault(task.id, self._clock())
+            else:
+                self._finished_at.pop(task.id, None)
+            self._evict_expired()
+            while len(self.tasks) > self.max_tasks:
+                if self._finished_at:
+                    self._evict(next(iter(self._finished_at)))
+                else:
+                    self._evict(next(iter(self.tasks)))
+
+    async def get(self, task_id: str) -> Optional[Task]:
+        async with self.lock:
+            self._evict_expired()
+            task = self.tasks.get(task_id)
+            if task is not None:
+                self.tasks.move_to_end(task_id)
+            return task
+
+    async def delete(self, task_id: str) -> None:
+        async with self.lock:
+            self.tasks.pop(task_id, None)
+            self._finished_at.pop(task_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns how many tasks are held and how many have been evicted."""
+        return {
+            "tasks": len(self.tasks),
+            "finished_tasks": len(self._finished_at),
+            "evicted_tasks": self.evicted_tasks,
+        }
+
+    def _evict(self, task_id: str) -> None:
+        self.tasks.pop(task_id, None)
+        self._finished_at.pop(task_id, None)
+        self.evicted_tasks += 1
+
+    def _evict_expired(self) -> None:
+        if self.ttl_seconds is None:
+            return
+        deadline = self._clock() - self.ttl_seconds
+        while self._finished_at:
+            task_id, finished_at = next(iter(self._finished_at.items()))
+            if finished_at > deadline:
+                break
+            self._evict(task_id)
+
+
+class SqliteTaskStore(TaskStore):
+    """Task store kept in a SQLite file, so tasks survive restarts and can be
+    shared by several server processes on one machine.
+
+    Tasks are stored as their JSON form. The same retention policy as
+    ``BoundedTaskStore`` is applied every ``prune_interval`` saves, so the file
+    stays bounded too. Queries run on a worker thread to keep the event loop free.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_tasks: int = DEFAULT_MAX_TASKS,
+        ttl_seconds: Optional[float] = DEFAULT_TASK_TTL_SECONDS,
+        prune_interval: int = DEFAULT_PRUNE_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ):
+        if max_tasks < 1:
+            raise ValueError("max_tasks must be at least 1")
+        self.path = path
+        self.max_tasks = max_tasks
+        self.ttl_seconds = ttl_seconds
+        self.prune_interval = max(1, prune_interval)
+        # Wall-clock time, since timestamps are shared across processes and restarts
+        self._clock = clock
+        self._saves = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tasks ("
+                " id TEXT PRIMARY KEY,"
+                " updated_at REAL NOT NULL,"
+                " finished_at REAL,"
+                " data TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS tasks_updated ON tasks (updated_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS tasks_finished ON tasks (finished_at)")
+
+    async def save(self, task: Task) -> None:
+        await asyncio.to_thread(self._save, task.id, task.model_dump_json(), is_terminal(task))
+
+    async def get(self, task_id: str) -> Optional[Task]:
+        row = await asyncio.to_thread(self._fetch, task_id)
+        return Task.model_validate_json(row) if row is not None else None
+
+    async def delete(self, task_id: str) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM tasks WHERE id = ?", (task_id,))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            tasks, finished = self._conn.execute(
+                "SELECT COUNT(*), COUNT(finished_at) FROM tasks"
+            ).fetchone()
+        return {"tasks": tasks, "finished_tasks": finished}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _save(self, task_id: str, data: str, terminal: bool) -> None:
+        now = self._clock()
+        with self._lock, self._conn:
+            # Keep the first finish time when a finished task is saved again
+            self._conn.execute(
+                "INSERT INTO tasks (id, updated_at, finished_at, data) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(id) DO UPDATE SET updated_at = excluded.updated_at,"
+                " finished_at = CASE WHEN excluded.finished_at IS NULL THEN NULL"
+                " ELSE COALESCE(tasks.finished_at, excluded.finished_at) END,"
+                " data = excluded.data",
+                (task_id, now, now if terminal else None, data),
+            )
+            self._saves += 1
+            if self._saves % self.prune_interval == 0:
+                self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        if self.ttl_seconds is not None:
+            self._conn.execute(
+                "DELETE FROM tasks WHERE finished_at <= ?", (now - self.ttl_seconds,)
+            )
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()
+        excess = count - self.max_tasks
+        if excess > 0:
+            # Finished tasks go first (NULLs sort last), oldest first within each group
+            self._conn.execute(
+                "DELETE FROM tasks WHERE id IN (SELECT id FROM tasks"
+                " ORDER BY finished_at IS NULL, COALESCE(finished_at, updated_at) LIMIT ?)",
+                (excess,),
+            )
+
+    def _fetch(self, task_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return row[0] if row is not None else None
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(sql, params)
+
+
+def create_task_store(prefix: str) -> TaskStore:
+    """Builds the task store configured by ``<prefix>_TASK_*`` variables.
+
+    ``<prefix>_TASK_DB`` selects a SQLite file that keeps tasks on disk;
+    otherwise they stay in memory. Either way, at most ``<prefix>_MAX_TASKS`` are
+    kept and finished ones are dropped after ``<prefix>_TASK_TTL_SECONDS``.
+    """
+    max_tasks = int(os.getenv(f"{prefix}_MAX_TASKS", DEFAULT_MAX_TASKS))
+    ttl_seconds = float(os.getenv(f"{prefix}_TASK_TTL_SECONDS", DEFAULT_TASK_TTL_SECONDS))
+    ttl_seconds = ttl_seconds if ttl_seconds > 0 else None
+
+    path = os.getenv(f"{prefix}_TASK_DB")
+    if path:
+        return SqliteTaskStore(path, max_tasks=max_tasks, ttl_seconds=ttl_seconds)
+    return BoundedTaskStore(max_tasks=max_tasks, ttl_seconds=ttl_seconds)
@@ -1,8 +1,9 @@
 import asyncio
 import json
+import os
 import uuid
 from datetime import datetime
-from typing import Any, AsyncIterable, List
+from typing import Any, AsyncIterable, List, Optional
 
 import httpx
 import nest_asyncio
@@ -14,59 +15,150 @@ from a2a.types import (
     SendMessageResponse,
     SendMessageSuccessResponse,
     Task,
+    TaskStatusUpdateEvent,
 )
 from dotenv import load_dotenv
 from google.adk import Agent
+from google.adk.agents.callback_context import CallbackContext
 from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.artifacts import InMemoryArtifactService
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
+from google.adk.tools import BaseTool, FunctionTool
+from google.adk.tools.base_toolset import BaseToolset
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
+from scheduling_common.session_store import create_session_service
 
 
-from .remote_agent_connection import RemoteAgentConnections
-from .teammate_matching_tools import initialize_teammate_engine, find_best_teammate_tool
+from .connection_pool import ConnectionPoolManager
+from .profile_cache import ProfileCache
+from .remote_agent_connection import (
+    RemoteAgentConnections,
+    TaskCallbackArg,
+)
+from .skill_index import SkillIndex
+from .teammate_matching_tools import (
+    initialize_teammate_engine,
+    find_best_teammate_tool,
+    find_common_times_tool,
+    form_teams_tool,
+)
 
 load_dotenv()
 nest_asyncio.apply()
 
+# Where the persistent skill index lives between host restarts
+SKILL_INDEX_DIR = os.getenv(
+    "HOST_SKILL_INDEX_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "a2a_friend_scheduling", "skill_index"),
+)
+# Shared HTTP pool used for card discovery and every remote agent connection
+HTTP_MAX_CONNECTIONS = int(os.getenv("HOST_HTTP_MAX_CONNECTIONS", "200"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HOST_HTTP_MAX_KEEPALIVE", "50"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HOST_HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_PER_HOST_LIMIT = int(os.getenv("HOST_HTTP_PER_HOST_LIMIT", "8"))
+HTTP2_ENABLED = os.getenv("HOST_HTTP2", "true").lower() in ("1", "true", "yes")
+# Agent card discovery: parallel lookups, per-address timeout and retry backoff (seconds)
+CARD_DISCOVERY_CONCURRENCY = 16
+CARD_RESOLVE_TIMEOUT = 5.0
+CARD_RETRY_INITIAL_DELAY = 2.0
+CARD_RETRY_MAX_DELAY = 60.0
+# How long the first conversation turn waits for discovery before answering anyway
+DISCOVERY_GRACE_SECONDS = 2.0
+
 
 class HostAgent:
     """The Host agent."""
 
     def __init__(
         self,
+        remote_agent_addresses: Optional[List[str]] = None,
     ):
         self.remote_agent_connections: dict[str, RemoteAgentConnections] = {}
         self.cards: dict[str, AgentCard] = {}
-        self.agents: str = ""
+        self.agents: str = "No friends found"
+        self.profile_cache = ProfileCache()
+        # Index entries expire with the cached profiles, so changed profiles get re-indexed
+        self.skill_index = SkillIndex(SKILL_INDEX_DIR, max_age_seconds=self.profile_cache.ttl_seconds)
+        self.connection_pool = ConnectionPoolManager(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            per_host_limit=HTTP_PER_HOST_LIMIT,
+            http2=HTTP2_ENABLED,
+        )
+        self._remote_agent_addresses = list(remote_agent_addresses or [])
+        self._discovery_task: Optional[asyncio.Task] = None
         self._agent = self.create_agent()
         self._user_id = "host_agent"
+        artifact_service = InMemoryArtifactService()
+        # Bounded in memory, or SQLite-backed when HOST_SESSION_DB is set
+        self.session_service = create_session_service("HOST", artifact_service=artifact_service)
         self._runner = Runner(
             app_name=self._agent.name,
             agent=self._agent,
-            artifact_service=InMemoryArtifactService(),
-            session_service=InMemorySessionService(),
+            artifact_service=artifact_service,
+            session_service=self.session_service,
             memory_service=InMemoryMemoryService(),
         )
 
-    async def _async_init_components(self, remote_agent_addresses: List[str]):
-        async with httpx.AsyncClient(timeout=30) as client:
-            for address in remote_agent_addresses:
-                card_resolver = A2ACardResolver(client, address)
-                try:
-                    card = await card_resolver.get_agent_card()
-                    remote_connection = RemoteAgentConnections(
-                        agent_card=card, agent_url=address
-                    )
-                    self.remote_agent_connections[card.name] = remote_connection
-                    self.cards[card.name] = card
-                except httpx.ConnectError as e:
-                    print(f"ERROR: Failed to get agent card from {address}: {e}")
-                except Exception as e:
-                    print(f"ERROR: Failed to initialize connection for {address}: {e}")
+        # The engine shares the connections dict, so agents discovered later show up automatically
+        initialize_teammate_engine(
+            self.remote_agent_connections,
+            profile_cache=self.profile_cache,
+            skill_index=self.skill_index,
+        )
+
+    async def _async_init_components(self, remote_agent_addresses: List[str]) -> List[str]:
+        """Resolves agent cards concurrently and registers each one as soon as it arrives.
+
+        Returns the addresses that could not be resolved.
+        """
+        semaphore = asyncio.Semaphore(CARD_DISCOVERY_CONCURRENCY)
+        failed: List[str] = []
+
+        client = self.connection_pool.client()
+
+        async def _discover(address: str):
+            async with semaphore:
+                card = await self._resolve_card(client, address)
+            if card is None:
+                failed.append(address)
+            else:
+                self._register_agent(card, address)
+
+        await asyncio.gather(*(_discover(address) for address in remote_agent_addresses))
+        return failed
+
+    async def _resolve_card(
+        self, client: httpx.AsyncClient, address: str
+    ) -> Optional[AgentCard]:
+        card_resolver = A2ACardResolver(client, address)
+        try:
+            return await asyncio.wait_for(
+                card_resolver.get_agent_card(), timeout=CARD_RESOLVE_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            print(f"ERROR: Timed out getting agent card from {address}")
+        except httpx.ConnectError as e:
+            print(f"ERROR: Failed to get agent card from {address}: {e}")
+        except Exception as e:
+            print(f"ERROR: Failed to initialize connection for {address}: {e}")
+        return None
+
+    def _register_agent(self, card: AgentCard, address: str):
+        try:
+            remote_connection = RemoteAgentConnections(
+                agent_card=card,
+                agent_url=address,
+                httpx_client=self.connection_pool.client(),
+            )
+        except Exception as e:
+            print(f"ERROR: Failed to initialize connection for {address}: {e}")
+            return
+        self.remote_agent_connections[card.name] = remote_connection
+        self.cards[card.name] = card
 
         agent_info = [
             json.dumps({"name": card.name, "description": card.description})
@@ -74,15 +166,50 @@ class HostAgent:
         ]
         print("agent_info:", agent_info)
         self.agents = "\n".join(agent_info) if agent_info else "No friends found"
-        
-        # Initialize the teammate matching engine
-        initialize_teammate_engine(self.remote_agent_connections)
+
+    async def _discover_in_background(self, remote_agent_addresses: List[str]):
+        """Keeps retrying unreachable addresses with capped exponential backoff."""
+        pending = remote_agent_addresses
+        delay = CARD_RETRY_INITIAL_DELAY
+        while pending:
+            pending = await self._async_init_components(pending)
+            if pending:
+                print(f"Retrying agent card discovery for {pending} in {delay:.0f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, CARD_RETRY_MAX_DELAY)
+
+    def start_discovery(self) -> Optional[asyncio.Task]:
+        """Starts background card discovery on the running event loop (once)."""
+        if self._discovery_task is None and self._remote_agent_addresses:
+            self._discovery_task = asyncio.get_running_loop().create_task(
+                self._discover_in_background(self._remote_agent_addresses)
+            )
+        return self._discovery_task
+
+    async def before_agent_callback(self, callback_context: CallbackContext):
+        """Starts discovery on the serving loop; the first turn waits briefly for cards."""
+        task = self.start_discovery()
+        if task is not None and not task.done() and not self.cards:
+            await asyncio.wait({task}, timeout=DISCOVERY_GRACE_SECONDS)
+        return None
+
+    async def aclose(self):
+        """Stops discovery, waits for pending task cancellations and closes the shared connection pool."""
+        if self._discovery_task is not None and not self._discovery_task.done():
+            self._discovery_task.cancel()
+            await asyncio.gather(self._discovery_task, return_exceptions=True)
+        self._discovery_task = None
+        await asyncio.gather(
+            *(connection.aclose() for connection in self.remote_agent_connections.values())
+        )
+        await self.connection_pool.aclose()
 
     @classmethod
     async def create(
         cls,
         remote_agent_addresses: List[str],
     ):
+        """Creates a HostAgent and waits for one concurrent discovery pass."""
         instance = cls()
         await instance._async_init_components(remote_agent_addresses)
         return instance
@@ -93,10 +220,8 @@ class HostAgent:
             name="Host_Agent",
             instruction=self.root_instruction,
             description="This Host agent facilitates communication with student agents to discover their skills.",
-            tools=[
-                self.send_message,
-                self.find_best_teammate,
-            ],
+            before_agent_callback=self.before_agent_callback,
+            tools=[HostToolset(self)],
         )
 
     def root_instruction(self, context: ReadonlyContext) -> str:
@@ -112,6 +237,16 @@ class HostAgent:
         *   Students will say things like "I am [Name], who would be my best teammate?" 
         *   Analyze their profile against all other students dynamically
         *   Recommend the most compatible match based on skill complementarity and communication balance
+        *   Pass `k` to get a longer ranked list when the student wants more options (default 3)
+    
+    *   **Team Formation:** Use the `form_teams` tool when asked to split the whole class (or all students) into teams.
+        *   Pass the requested team size (use 2 if no size is given)
+        *   Present each team with its score and the reasoning behind it
+    
+    *   **Scheduling:** Use the `find_common_times` tool to find when a proposed team can meet.
+        *   After `find_best_teammate`, offer to check when the student and their recommended partner are both free
+        *   Pass the exact agent names of every team member; `k` sets how many of the earliest slots to return (default 5)
+        *   Mention any student whose availability could not be checked
     
     *   **Helpful Assistant:** Act as a friendly, knowledgeable assistant who:
         *   Helps students discover information about their classmates
@@ -122,6 +257,8 @@ class HostAgent:
     **Available Actions:**
     *   Answer questions about specific students' skills and profiles
     *   Find the best teammate match for any requesting student
+    *   Split the whole class into balanced teams of a given size
+    *   Find the earliest times a team is all free
     *   Explain compatibility reasoning and team dynamics
     
     **Today's Date (YYYY-MM-DD):** {datetime.now().strftime("%Y-%m-%d")}
@@ -201,7 +338,9 @@ class HostAgent:
         message_request = SendMessageRequest(
             id=message_id, params=MessageSendParams.model_validate(payload)
         )
-        send_response: SendMessageResponse = await client.send_message(message_request)
+        send_response: SendMessageResponse = await client.send_message(
+            message_request, task_callback=self.task_callback
+        )
         print("send_response", send_response)
 
         if not isinstance(
@@ -220,40 +359,67 @@ class HostAgent:
                     resp.extend(artifact["parts"])
         return resp
 
-    async def find_best_teammate(self, requester_name: str, tool_context: ToolContext):
-        """Finds the best teammate for a specific student - wrapper for the tool function."""
-        return await find_best_teammate_tool(requester_name, self.send_message, tool_context)
+    def task_callback(self, event: TaskCallbackArg, agent_card: AgentCard) -> None:
+        """Logs a student agent's task state as it changes; streamed artifact chunks are not logged."""
+        if isinstance(event, Task):
+            print(f"[{agent_card.name}] task {event.id}: {event.status.state.value}")
+        elif isinstance(event, TaskStatusUpdateEvent):
+            print(f"[{agent_card.name}] task {event.taskId}: {event.status.state.value}")
 
+    async def find_best_teammate(self, requester_name: str, tool_context: ToolContext, k: int = 3):
+        """Finds the k best teammates for a specific student, best first - wrapper for the tool function."""
+        return await find_best_teammate_tool(requester_name, self.send_message, tool_context, k)
 
-def _get_initialized_host_agent_sync():
-    """Synchronously creates and initializes the HostAgent."""
-
-    async def _async_main():
-        # Hardcoded URLs for the friend agents
-        friend_agent_urls = [
-            "http://localhost:10002",  # Karley's Agent
-            "http://localhost:10003",  # Nate's Agent
-            "http://localhost:10004",  # Kaitlynn's Agent
+    async def form_teams(self, team_size: int, tool_context: ToolContext):
+        """Splits all students into teams of the given size - wrapper for the tool function."""
+        return await form_teams_tool(team_size, self.send_message, tool_context)
+
+    async def find_common_times(self, student_names: list[str], tool_context: ToolContext, k: int = 5):
+        """Finds the k earliest times every listed student is free - wrapper for the tool function."""
+        return await find_common_times_tool(student_names, k)
+
+
+class HostToolset(BaseToolset):
+    """The host's tools, bundled so the server's shutdown reaches the host.
+
+    ADK closes every toolset of the root agent when the web server stops; closing
+    this one closes the host's connections.
+    """
+
+    def __init__(self, host: HostAgent):
+        super().__init__()
+        self._host = host
+        self._tools = [
+            FunctionTool(host.send_message),
+            FunctionTool(host.find_best_teammate),
+            FunctionTool(host.form_teams),
+            FunctionTool(host.find_common_times),
         ]
 
-        print("initializing host agent")
-        hosting_agent_instance = await HostAgent.create(
-            remote_agent_addresses=friend_agent_urls
-        )
-        print("HostAgent initialized")
-        return hosting_agent_instance.create_agent()
-
-    try:
-        return asyncio.run(_async_main())
-    except RuntimeError as e:
-        if "asyncio.run() cannot be called from a running event loop" in str(e):
-            print(
-                f"Warning: Could not initialize HostAgent with asyncio.run(): {e}. "
-                "This can happen if an event loop is already running (e.g., in Jupyter). "
-                "Consider initializing HostAgent within an async function in your application."
-            )
-        else:
-            raise
+    async def get_tools(self, readonly_context: Optional[ReadonlyContext] = None) -> List[BaseTool]:
+        return self._tools
+
+    async def close(self) -> None:
+        await self._host.aclose()
+
+
+def _get_initialized_host_agent_sync():
+    """Creates the HostAgent without blocking on the network.
+
+    Agent cards are discovered concurrently in the background once the host starts
+    serving, and each student agent becomes available as soon as its card arrives.
+    """
+    # Hardcoded URLs for the friend agents
+    friend_agent_urls = [
+        "http://localhost:10002",  # Karley's Agent
+        "http://localhost:10003",  # Nate's Agent
+        "http://localhost:10004",  # Kaitlynn's Agent
+    ]
+
+    print("initializing host agent")
+    hosting_agent_instance = HostAgent(remote_agent_addresses=friend_agent_urls)
+    print("HostAgent initialized")
+    return hosting_agent_instance.create_agent()
 
 
 root_agent = _get_initialized_host_agent_sync()
@@ -0,0 +1,102 @@
+"""
+Common Availability Solver for Student Teams
+"""
+
+from bisect import bisect_left
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field, NonNegativeInt
+
+# AgentSkill id of the structured availability lookup that student agents answer without a model call
+AVAILABILITY_SKILL_ID = "availability"
+
+Slot = Tuple[date, str]
+
+
+class Availability(BaseModel):
+    """Free slots a student agent returns from its ``availability`` skill.
+
+    ``masks[i]`` covers the day ``start + i``: bit j is set when ``slot_times[j]``
+    is free. Days outside the masks count as busy.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    start: date
+    slot_times: List[str]
+    masks: List[NonNegativeInt] = Field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not any(self.masks)
+
+
+def pack_bitset(availability: Availability, epoch: date, slot_times: Sequence[str]) -> int:
+    """Packs a calendar into one integer: bit ``day * len(slot_times) + slot``, days counted from ``epoch``.
+
+    Slots the agent does not list are busy; days before ``epoch`` are dropped.
+    """
+    width = len(slot_times)
+    own_width = len(availability.slot_times)
+    masks = [mask & ((1 << own_width) - 1) for mask in availability.masks]
+    if list(availability.slot_times) != list(slot_times):
+        positions = [slot_times.index(slot) for slot in availability.slot_times]
+        remapped: Dict[int, int] = {}
+        for i, mask in enumerate(masks):
+            if mask not in remapped:
+                remapped[mask] = sum(1 << positions[j] for j in range(own_width) if mask >> j & 1)
+            masks[i] = remapped[mask]
+    if not masks:
+        return 0
+    # One binary string, latest day first, parses into the whole bitset in linear time
+    bits = int("".join(format(mask, f"0{width}b") for mask in reversed(masks)), 2)
+    offset = (availability.start - epoch).days * width
+    return bits << offset if offset >= 0 else bits >> -offset
+
+
+class AvailabilitySolver:
+    """Finds the slots every member of a team is free for.
+
+    Each student's calendar is packed once into an integer bitset over a shared
+    grid of days from ``epoch`` and the union of everyone's slot times. A team's
+    common slots are then the AND of its members' bitsets, and the earliest ones
+    are its lowest set bits, so checking many teams over long horizons costs a few
+    big-integer operations per team rather than a walk over days.
+    """
+
+    def __init__(self, availability: Dict[str, Availability], epoch: date, not_before: str = ""):
+        self.epoch = epoch
+        # "HH:MM" strings sort chronologically
+        self.slot_times = sorted({slot for a in availability.values() for slot in a.slot_times})
+        # Slots on the epoch day that start before ``not_before`` are never offered
+        self._past = (1 << bisect_left(self.slot_times, not_before)) - 1
+        self.bitsets = {
+            name: pack_bitset(a, epoch, self.slot_times) for name, a in availability.items()
+        }
+
+    def common(self, members: Iterable[str]) -> int:
+        """The bitset of slots every one of ``members`` is free for."""
+        members = list(members)
+        if not members:
+            return 0
+        bits = self.bitsets[members[0]]
+        for name in members[1:]:
+            bits &= self.bitsets[name]
+        return bits
+
+    def earliest(self, members: Iterable[str], k: int) -> List[Slot]:
+        """The ``k`` earliest slots every one of ``members`` is free for."""
+        bits = self.common(members) & ~self._past
+        width = len(self.slot_times)
+        slots = []
+        while bits and len(slots) < k:
+            lowest = bits & -bits
+            index = lowest.bit_length() - 1
+            day, slot = divmod(index, width)
+            slots.append((self.epoch + timedelta(days=day), self.slot_times[slot]))
+            bits ^= lowest
+        return slots
+
+    def earliest_for_teams(self, teams: Iterable[Sequence[str]], k: int) -> List[List[Slot]]:
+        """``earliest`` for several teams, reusing every member's bitset."""
+        return [self.earliest(team, k) for team in teams]
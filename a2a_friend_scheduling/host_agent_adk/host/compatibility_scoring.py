@@ -0,0 +1,241 @@
+"""
+Vectorized Compatibility Scoring for Student Profiles
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+from .student_profile import StudentProfile
+
+# A profile is either a typed StudentProfile or free text from an agent that answers in prose
+Profile = Union[StudentProfile, str]
+
+# Keyword lists used to derive profile features (matched as lowercase substrings)
+FRONTEND_SKILLS = ['html', 'css', 'javascript', 'react', 'ui', 'ux', 'frontend', 'design', 'responsive']
+BACKEND_SKILLS = ['python', 'api', 'backend', 'database', 'sql', 'server', 'crewai']
+LEADERSHIP_SKILLS = ['leadership', 'project management', 'team', 'organize', 'mentor', 'lead']
+COMMUNICATION_STYLES = {
+    'introvert': ['introvert', 'quiet', 'reserved', 'shy', 'thoughtful', 'prefer written'],
+    'extrovert': ['extrovert', 'enthusiastic', 'outgoing', 'friendly', 'loves explaining', 'confident']
+}
+EXPERIENCE_LEVELS = {
+    'beginner': ['basic', 'learning', 'beginner', 'still learning', 'not confident', 'improving'],
+    'advanced': ['expert', 'experienced', 'advanced', 'confident', 'strong', 'excellent']
+}
+INTEREST_KEYWORDS = ['ai', 'machine learning', 'web development', 'programming', 'design', 'projects']
+
+# Column layout of a profile feature vector
+FRONTEND, BACKEND, LEADERSHIP, INTROVERT, EXTROVERT, BEGINNER, ADVANCED = range(7)
+INTEREST_OFFSET = 7
+NUM_FEATURES = INTEREST_OFFSET + len(INTEREST_KEYWORDS)
+
+FEATURE_KEYWORDS: Dict[int, List[str]] = {
+    FRONTEND: FRONTEND_SKILLS,
+    BACKEND: BACKEND_SKILLS,
+    LEADERSHIP: LEADERSHIP_SKILLS,
+    INTROVERT: COMMUNICATION_STYLES['introvert'],
+    EXTROVERT: COMMUNICATION_STYLES['extrovert'],
+    BEGINNER: EXPERIENCE_LEVELS['beginner'],
+    ADVANCED: EXPERIENCE_LEVELS['advanced'],
+}
+for _offset, _interest in enumerate(INTEREST_KEYWORDS):
+    FEATURE_KEYWORDS[INTEREST_OFFSET + _offset] = [_interest]
+
+# Stable token name for each feature column (used by the on-disk skill index)
+FEATURE_NAMES = ['frontend', 'backend', 'leadership', 'introvert', 'extrovert', 'beginner', 'advanced'] + [
+    f"interest:{interest}" for interest in INTEREST_KEYWORDS
+]
+
+# Feature columns each StudentProfile field may set; free-text ``summary`` feeds every column
+PROFILE_FIELD_COLUMNS: Dict[str, List[int]] = {
+    'technical_skills': [FRONTEND, BACKEND, LEADERSHIP, BEGINNER, ADVANCED],
+    'interests': list(range(INTEREST_OFFSET, NUM_FEATURES)),
+    'personality_traits': [LEADERSHIP, INTROVERT, EXTROVERT, BEGINNER, ADVANCED],
+    'communication_style': [INTROVERT, EXTROVERT, BEGINNER, ADVANCED],
+    'learning_style': [BEGINNER, ADVANCED],
+    'summary': list(range(NUM_FEATURES)),
+}
+
+# Points awarded by each compatibility rule
+SKILL_COMPLEMENT_POINTS = 30
+LEADERSHIP_BALANCE_POINTS = 20
+COMMUNICATION_BALANCE_POINTS = 25
+EXPERIENCE_BALANCE_POINTS = 15
+SHARED_INTEREST_POINTS = 10
+BASE_POINTS = 5
+
+# Number of distinct profiles (by content hash) whose feature vectors are kept
+DEFAULT_FEATURE_CACHE_SIZE = 4096
+
+
+def extract_features(profile: str) -> np.ndarray:
+    """Turns a free-text profile into a boolean feature vector (one scan per keyword).
+
+    ``CompatibilityScorer`` caches the vectors this yields by profile content hash.
+    """
+    text = profile.lower()
+    features = np.zeros(NUM_FEATURES, dtype=bool)
+    for column, keywords in FEATURE_KEYWORDS.items():
+        features[column] = any(keyword in text for keyword in keywords)
+    return features
+
+
+def profile_digest(profile: Profile) -> bytes:
+    """Returns a compact content hash used to key cached feature vectors."""
+    if isinstance(profile, StudentProfile):
+        return profile.digest()
+    return hashlib.blake2b(profile.encode("utf-8"), digest_size=16).digest()
+
+
+def score_against(requester: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """Scores one requester feature vector against an (N, F) candidate matrix."""
+    candidates = np.atleast_2d(candidates)
+    complement = (
+        (requester[FRONTEND] & candidates[:, BACKEND])
+        | (requester[BACKEND] & candidates[:, FRONTEND])
+    )
+    leadership = requester[LEADERSHIP] ^ candidates[:, LEADERSHIP]
+    communication = (
+        (requester[INTROVERT] & candidates[:, EXTROVERT])
+        | (requester[EXTROVERT] & candidates[:, INTROVERT])
+    )
+    experience = (
+        (requester[BEGINNER] & candidates[:, ADVANCED])
+        | (requester[ADVANCED] & candidates[:, BEGINNER])
+    )
+    shared = (candidates[:, INTEREST_OFFSET:] & requester[INTEREST_OFFSET:]).any(axis=1)
+    return _combine(complement, leadership, communication, experience, shared)
+
+
+def score_matrix(features: np.ndarray) -> np.ndarray:
+    """Scores every pair of an (N, F) feature matrix at once, returning an (N, N) matrix.
+
+    The rules are symmetric, so ``scores[i, j] == scores[j, i]``. The diagonal scores
+    each profile against itself and should be ignored by callers.
+    """
+    features = np.atleast_2d(features)
+    column = lambda index: features[:, index]
+    complement = (
+        np.outer(column(FRONTEND), column(BACKEND))
+        | np.outer(column(BACKEND), column(FRONTEND))
+    )
+    leadership = column(LEADERSHIP)[:, None] ^ column(LEADERSHIP)[None, :]
+    communication = (
+        np.outer(column(INTROVERT), column(EXTROVERT))
+        | np.outer(column(EXTROVERT), column(INTROVERT))
+    )
+    experience = (
+        np.outer(column(BEGINNER), column(ADVANCED))
+        | np.outer(column(ADVANCED), column(BEGINNER))
+    )
+    interests = features[:, INTEREST_OFFSET:].astype(np.int32)
+    shared = (interests @ interests.T) > 0
+    return _combine(complement, leadership, communication, experience, shared)
+
+
+def _combine(complement, leadership, communication, experience, shared) -> np.ndarray:
+    scores = (
+        SKILL_COMPLEMENT_POINTS * complement.astype(np.float64)
+        + LEADERSHIP_BALANCE_POINTS * leadership
+        + COMMUNICATION_BALANCE_POINTS * communication
+        + EXPERIENCE_BALANCE_POINTS * experience
+        + SHARED_INTEREST_POINTS * shared
+    )
+    scores[scores == 0] = BASE_POINTS
+    return scores
+
+
+def explain(requester: np.ndarray, candidate: np.ndarray) -> str:
+    """Builds the human-readable reasoning for a single scored pair."""
+    reasoning_points = []
+    if requester[FRONTEND] and candidate[BACKEND]:
+        reasoning_points.append("Frontend + Backend skill complementarity")
+    elif requester[BACKEND] and candidate[FRONTEND]:
+        reasoning_points.append("Backend + Frontend skill complementarity")
+
+    if requester[LEADERSHIP] and not candidate[LEADERSHIP]:
+        reasoning_points.append("Leadership + Technical collaboration")
+    elif not requester[LEADERSHIP] and candidate[LEADERSHIP]:
+        reasoning_points.append("Technical + Leadership collaboration")
+
+    if (requester[INTROVERT] and candidate[EXTROVERT]) or (requester[EXTROVERT] and candidate[INTROVERT]):
+        reasoning_points.append("Balanced introvert-extrovert communication styles")
+
+    if (requester[BEGINNER] and candidate[ADVANCED]) or (requester[ADVANCED] and candidate[BEGINNER]):
+        reasoning_points.append("Mentor-learner experience balance")
+
+    common_interests = [
+        interest
+        for offset, interest in enumerate(INTEREST_KEYWORDS)
+        if requester[INTEREST_OFFSET + offset] and candidate[INTEREST_OFFSET + offset]
+    ]
+    if common_interests:
+        reasoning_points.append(f"Shared interests: {', '.join(common_interests)}")
+
+    if reasoning_points:
+        return "Strong compatibility due to: " + "; ".join(reasoning_points)
+    return "Basic compatibility - could work well together with some shared foundation"
+
+
+class CompatibilityScorer:
+    """Caches profile feature vectors and scores profiles in bulk.
+
+    Features are extracted with ``extract_features`` and cached by the profile's
+    content hash, so a profile scored again costs one hash instead of a scan per
+    keyword. A ``StudentProfile`` is read field by field, and each field only sets
+    the columns listed for it in ``PROFILE_FIELD_COLUMNS``.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_FEATURE_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._field_masks = {}
+        for field, columns in PROFILE_FIELD_COLUMNS.items():
+            mask = np.zeros(NUM_FEATURES, dtype=bool)
+            mask[columns] = True
+            self._field_masks[field] = mask
+        self._features: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+
+    def features(self, profile: Profile) -> np.ndarray:
+        """Returns the feature vector for a profile, extracting it only once."""
+        digest = profile_digest(profile)
+        cached = self._features.get(digest)
+        if cached is not None:
+            self._features.move_to_end(digest)
+            return cached
+        if isinstance(profile, StudentProfile):
+            vector = np.zeros(NUM_FEATURES, dtype=bool)
+            for field, mask in self._field_masks.items():
+                value = getattr(profile, field)
+                if not value:
+                    continue
+                text = "\n".join(value) if isinstance(value, list) else value
+                vector |= extract_features(text) & mask
+        else:
+            vector = extract_features(profile)
+        vector.setflags(write=False)
+        self._features[digest] = vector
+        if len(self._features) > self.cache_size:
+            self._features.popitem(last=False)
+        return vector
+
+    def feature_matrix(self, profiles: Sequence[Profile]) -> np.ndarray:
+        """Stacks the feature vectors of several profiles into an (N, F) matrix."""
+        if not profiles:
+            return np.zeros((0, NUM_FEATURES), dtype=bool)
+        return np.vstack([self.features(profile) for profile in profiles])
+
+    def score_candidates(self, requester_profile: Profile, candidate_profiles: Sequence[Profile]) -> np.ndarray:
+        """Scores a requester against many candidates in one vectorized pass."""
+        if not candidate_profiles:
+            return np.zeros(0)
+        return score_against(self.features(requester_profile), self.feature_matrix(candidate_profiles))
+
+    def pairwise_scores(self, profiles: Sequence[Profile]) -> np.ndarray:
+        """Builds the full (N, N) compatibility matrix for a roster."""
+        return score_matrix(self.feature_matrix(profiles))
+
+    def explain(self, requester_profile: Profile, candidate_profile: Profile) -> str:
+        return explain(self.features(requester_profile), self.features(candidate_profile))
@@ -0,0 +1,126 @@
+"""
+Shared HTTP Connection Pool for Remote Agent Connections
+"""
+
+import asyncio
+import importlib.util
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+DEFAULT_MAX_CONNECTIONS = 200
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 50
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_PER_HOST_LIMIT = 8
+DEFAULT_TIMEOUT = 30.0
+
+
+def http2_available() -> bool:
+    """HTTP/2 needs the optional ``h2`` package (``pip install httpx[http2]``)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that gives the per-host slot back once it is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, semaphore: asyncio.Semaphore):
+        self._stream = stream
+        self._semaphore = semaphore
+        self._released = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._semaphore.release()
+
+
+class _PerHostLimitTransport(httpx.AsyncBaseTransport):
+    """Caps in-flight requests per host on top of the pool's global limits.
+
+    A slot is held from sending the request until the response body is closed, so
+    streamed responses count against their host for as long as they are open.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, per_host_limit: int):
+        self._transport = transport
+        self._per_host_limit = per_host_limit
+        self._semaphores: Dict[Tuple[bytes, bytes, int], asyncio.Semaphore] = {}
+
+    def _semaphore_for(self, url: httpx.URL) -> asyncio.Semaphore:
+        key = (url.raw_scheme, url.raw_host, url.port or 0)
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._semaphores[key] = asyncio.Semaphore(self._per_host_limit)
+        return semaphore
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphore_for(request.url)
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        response.stream = _ReleasingStream(response.stream, semaphore)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class ConnectionPoolManager:
+    """Owns the one ``httpx.AsyncClient`` shared by every remote agent connection.
+
+    All connections reuse the same keep-alive pool (and HTTP/2 multiplexing when
+    ``h2`` is installed) instead of opening one pool per agent. The client is created
+    lazily on first use, so it binds to the event loop that actually serves
+    requests. ``aclose`` is final: connections hold on to the client they were
+    given, so the pool is closed once, when the host shuts down.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+        timeout: float = DEFAULT_TIMEOUT,
+        http2: bool = True,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.http2 = http2 and http2_available()
+        if http2 and not self.http2:
+            print("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+        self._client: Optional[httpx.AsyncClient] = None
+        self._closed = False
+
+    def client(self) -> httpx.AsyncClient:
+        """Returns the shared client, creating it on first use."""
+        if self._closed:
+            raise RuntimeError("The connection pool has been closed")
+        if self._client is None:
+            transport = httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+            if self.per_host_limit:
+                transport = _PerHostLimitTransport(transport, self.per_host_limit)
+            self._client = httpx.AsyncClient(transport=transport, timeout=self.timeout)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Closes every pooled connection; ``client()`` raises afterwards."""
+        self._closed = True
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
@@ -0,0 +1,140 @@
+"""
+Profile Cache for Student Agent Profiles
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+# How long a fetched profile stays fresh before the agent is asked again
+DEFAULT_TTL_SECONDS = 600.0
+# Number of (agent, card version) entries kept before the least recently used is dropped
+DEFAULT_MAX_ENTRIES = 1024
+
+CacheKey = Tuple[str, str]
+
+
+class ProfileCache:
+    """LRU + TTL cache of student profiles keyed by agent name and agent card version.
+
+    Concurrent misses for the same key share a single in-flight fetch, so a burst of
+    match requests results in one round-trip per student agent. Publishing a new
+    ``AgentCard.version`` invalidates that agent's previous entry.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[CacheKey, asyncio.Task] = {}
+        # In-flight fetch -> number of callers still awaiting it
+        self._waiters: Dict[asyncio.Task, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.abandoned = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, agent_name: str, version: str) -> Optional[Any]:
+        """Returns the cached profile, or None when it is missing or expired."""
+        key = (agent_name, version)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, profile = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.evictions += 1
+            return None
+        self._entries.move_to_end(key)
+        return profile
+
+    def put(self, agent_name: str, version: str, profile: Any) -> None:
+        """Stores a profile, dropping stale versions of the same agent and LRU overflow."""
+        self.invalidate(agent_name, keep_version=version)
+        key = (agent_name, version)
+        self._entries[key] = (self._clock() + self.ttl_seconds, profile)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, agent_name: str, keep_version: Optional[str] = None) -> None:
+        """Drops every cached entry for an agent, optionally keeping one version."""
+        for key in [k for k in self._entries if k[0] == agent_name and k[1] != keep_version]:
+            del self._entries[key]
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_fetch(
+        self, agent_name: str, version: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Returns the cached profile or fetches it, coalescing concurrent misses.
+
+        The fetch runs as its own task, so a caller that gives up (for example on a
+        fan-out deadline) does not cancel it for the other waiters. Once every waiter
+        has given up, the fetch itself is cancelled, which cancels the remote task
+        behind it. Empty results are returned but never cached.
+        """
+        profile = self.get(agent_name, version)
+        if profile is not None:
+            self.hits += 1
+            return profile
+
+        key = (agent_name, version)
+        task = self._in_flight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(fetch())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t, key=key: self._on_fetch_done(key, t))
+        else:
+            self.coalesced += 1
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters[task] == 1 and not task.done():
+                task.cancel()
+                self.abandoned += 1
+            raise
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+
+    def _on_fetch_done(self, key: CacheKey, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        profile = task.result()
+        if profile:
+            self.put(key[0], key[1], profile)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit/miss counters and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "abandoned": self.abandoned,
+            "size": len(self._entries),
+            "in_flight": len(self._in_flight),
+        }
@@ -1,40 +1,202 @@
-from typing import Callable
+
+import asyncio
+import uuid
+from typing import Callable, Optional
 
 import httpx
-from a2a.client import A2AClient
+from a2a.client import A2AClient, A2AClientHTTPError
 from a2a.types import (
     AgentCard,
+    CancelTaskRequest,
+    JSONRPCErrorResponse,
+    Message,
+    Part,
     SendMessageRequest,
     SendMessageResponse,
+    SendMessageSuccessResponse,
+    SendStreamingMessageRequest,
     Task,
     TaskArtifactUpdateEvent,
+    TaskIdParams,
+    TaskState,
+    TaskStatus,
     TaskStatusUpdateEvent,
+    TextPart,
 )
 from dotenv import load_dotenv
 
 load_dotenv()
 
 TaskCallbackArg = Task | TaskStatusUpdateEvent | TaskArtifactUpdateEvent
-TaskUpdateCallback = Callable[[TaskCallbackArg, AgentCard], Task]
+TaskUpdateCallback = Callable[[TaskCallbackArg, AgentCard], None]
+
+
+def merge_task_event(task: Optional[Task], event: TaskCallbackArg) -> Task:
+    """Folds one streamed event into the task being assembled on the client side."""
+    if isinstance(event, Task):
+        return event.model_copy(deep=True)
+    if task is None:
+        task = Task(
+            id=event.taskId,
+            contextId=event.contextId,
+            status=TaskStatus(state=TaskState.submitted),
+        )
+    if isinstance(event, TaskStatusUpdateEvent):
+        task.status = event.status
+        return task
+
+    # Copy the artifact so several trackers can fold the same event independently
+    artifact = event.artifact.model_copy(deep=True)
+    artifacts = task.artifacts if task.artifacts is not None else []
+    task.artifacts = artifacts
+    for index, existing in enumerate(artifacts):
+        if existing.artifactId == artifact.artifactId:
+            if event.append:
+                _append_parts(existing.parts, artifact.parts)
+            else:
+                artifacts[index] = artifact
+            return task
+    artifacts.append(artifact)
+    return task
+
+
+def _append_parts(parts: list[Part], chunk: list[Part]) -> None:
+    """Appends a streamed chunk, joining text that continues the previous text part.
+
+    Models split text at arbitrary points, even mid-word, so consecutive text
+    chunks are kept as one part rather than as fragments.
+    """
+    for part in chunk:
+        if parts and isinstance(part.root, TextPart) and isinstance(parts[-1].root, TextPart):
+            previous = parts[-1].root
+            parts[-1] = Part(root=previous.model_copy(update={"text": previous.text + part.root.text}))
+        else:
+            parts.append(part)
 
 
 class RemoteAgentConnections:
     """A class to hold the connections to the remote agents."""
 
-    def __init__(self, agent_card: AgentCard, agent_url: str):
+    def __init__(
+        self,
+        agent_card: AgentCard,
+        agent_url: str,
+        httpx_client: Optional[httpx.AsyncClient] = None,
+    ):
         print(f"agent_card: {agent_card}")
         print(f"agent_url: {agent_url}")
-        self._httpx_client = httpx.AsyncClient(timeout=30)
+        # A shared (pooled) client is owned by the caller; only a private one is closed here
+        self._owns_client = httpx_client is None
+        self._httpx_client = httpx_client or httpx.AsyncClient(timeout=30)
         self.agent_client = A2AClient(self._httpx_client, agent_card, url=agent_url)
         self.card = agent_card
         self.conversation_name = None
         self.conversation = None
         self.pending_tasks = set()
+        # Cancel requests still in flight for calls the caller gave up on
+        self._cancellations: set[asyncio.Task] = set()
 
     def get_agent(self) -> AgentCard:
         return self.card
 
+    @property
+    def supports_streaming(self) -> bool:
+        capabilities = self.card.capabilities
+        return bool(capabilities and capabilities.streaming)
+
     async def send_message(
-        self, message_request: SendMessageRequest
+        self,
+        message_request: SendMessageRequest,
+        task_callback: Optional[TaskUpdateCallback] = None,
     ) -> SendMessageResponse:
-        return await self.agent_client.send_message(message_request)
+        """Sends a message, streaming it when the agent card advertises streaming.
+
+        Streamed events are passed to ``task_callback`` as they arrive and merged
+        into one ``Task``, so callers get the same response shape either way.
+
+        If the caller stops waiting (for example a fan-out deadline cancels it),
+        the remote task is cancelled too, so the agent stops spending model calls
+        on an answer nobody will read.
+        """
+        message = message_request.params.message
+        if not message.taskId:
+            # Name the task up front so it can be cancelled before any reply arrives
+            message.taskId = str(uuid.uuid4())
+        try:
+            if self.supports_streaming:
+                try:
+                    return await self._send_streaming(message_request, task_callback)
+                except _StreamUnavailable as e:
+                    print(f"Streaming unavailable for {self.card.name}, falling back: {e}")
+            return await self.agent_client.send_message(message_request)
+        except asyncio.CancelledError:
+            cancellation = asyncio.create_task(self.cancel_task(message.taskId))
+            self._cancellations.add(cancellation)
+            cancellation.add_done_callback(self._cancellations.discard)
+            raise
+
+    async def cancel_task(self, task_id: str) -> bool:
+        """Asks the agent to cancel a task; returns whether it reports it canceled."""
+        self.pending_tasks.discard(task_id)
+        request = CancelTaskRequest(id=str(uuid.uuid4()), params=TaskIdParams(id=task_id))
+        try:
+            response = await self.agent_client.cancel_task(request)
+        except Exception as e:
+            print(f"Could not cancel task {task_id} on {self.card.name}: {e}")
+            return False
+        if isinstance(response.root, JSONRPCErrorResponse):
+            # Usually the task finished (or never started) before the cancel arrived
+            print(f"{self.card.name} did not cancel task {task_id}: {response.root.error.message}")
+            return False
+        return True
+
+    async def _send_streaming(
+        self,
+        message_request: SendMessageRequest,
+        task_callback: Optional[TaskUpdateCallback],
+    ) -> SendMessageResponse:
+        stream_request = SendStreamingMessageRequest(
+            id=message_request.id, params=message_request.params
+        )
+        # The task is assembled here, per call, so a stream that is cut off or
+        # errors leaves nothing behind
+        task: Optional[Task] = None
+        message: Optional[Message] = None
+        received = False
+        try:
+            async for response in self.agent_client.send_message_streaming(stream_request):
+                received = True
+                if isinstance(response.root, JSONRPCErrorResponse):
+                    return SendMessageResponse(root=response.root)
+                event = response.root.result
+                if isinstance(event, Message):
+                    message = event
+                    continue
+                task = merge_task_event(task, event)
+                self.pending_tasks.add(task.id)
+                if task_callback:
+                    task_callback(event, self.card)
+        except A2AClientHTTPError as e:
+            if not received:
+                raise _StreamUnavailable(str(e)) from e
+            raise
+        finally:
+            if task is not None:
+                self.pending_tasks.discard(task.id)
+
+        result = task if task is not None else message
+        if result is None:
+            raise _StreamUnavailable("stream ended without a task or message")
+        return SendMessageResponse(
+            root=SendMessageSuccessResponse(id=message_request.id, result=result)
+        )
+
+    async def aclose(self) -> None:
+        if self._cancellations:
+            await asyncio.gather(*self._cancellations, return_exceptions=True)
+        if self._owns_client:
+            await self._httpx_client.aclose()
+
+
+class _StreamUnavailable(Exception):
+    """The agent could not be streamed from before any event arrived."""
@@ -0,0 +1,246 @@
+"""
+Persistent Inverted Index of Student Skills, Interests and Traits
+"""
+
+import json
+import os
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from .compatibility_scoring import (
+    ADVANCED,
+    BACKEND,
+    BEGINNER,
+    EXTROVERT,
+    FEATURE_NAMES,
+    FRONTEND,
+    INTEREST_OFFSET,
+    INTROVERT,
+    LEADERSHIP,
+    NUM_FEATURES,
+)
+
+INDEX_FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+POSTINGS_FILE = "postings.bin"
+
+
+class IndexEntry(NamedTuple):
+    version: str
+    digest: str
+    # Wall-clock time the profile was last seen, since the index outlives the process
+    indexed_at: float = 0.0
+
+
+class SkillIndex:
+    """Inverted index from feature token (skill, interest or trait) to agent names.
+
+    Postings are stored as one packed bitmap per token over agent slots, so the
+    union of several postings is a bitwise OR. On disk the index is a small JSON
+    manifest (tokens and agent slots with card version and profile digest) plus a
+    raw ``(tokens, slots / 8)`` uint8 bitmap file that is memory-mapped on load.
+    Updates are applied in memory and written back atomically by ``flush``.
+
+    Card versions rarely change when a profile does, so an entry also expires
+    ``max_age_seconds`` after its profile was last seen (None keeps it until the
+    version changes). An expired agent is no longer filtered out, and is fetched
+    and re-indexed on its next match.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_age_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.directory = directory
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._names: List[Optional[str]] = []
+        self._slots: Dict[str, int] = {}
+        self._entries: Dict[str, IndexEntry] = {}
+        self._free: List[int] = []
+        self._bitmaps: np.ndarray = np.zeros((NUM_FEATURES, 0), dtype=np.uint8)
+        self._dirty = False
+        if directory:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, agent_name: str) -> bool:
+        return agent_name in self._slots
+
+    def load(self) -> None:
+        """Loads the manifest and memory-maps the postings; a mismatched index is ignored."""
+        manifest_path = os.path.join(self.directory, MANIFEST_FILE)
+        postings_path = os.path.join(self.directory, POSTINGS_FILE)
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            return
+        if manifest.get("format_version") != INDEX_FORMAT_VERSION or manifest.get("tokens") != FEATURE_NAMES:
+            print(f"Ignoring skill index at {self.directory}: built for a different feature set")
+            return
+
+        agents = manifest.get("agents", [])
+        row_bytes = (len(agents) + 7) // 8
+        if row_bytes:
+            try:
+                bitmaps = np.memmap(postings_path, dtype=np.uint8, mode="r", shape=(NUM_FEATURES, row_bytes))
+            except (OSError, ValueError) as e:
+                print(f"Ignoring skill index at {self.directory}: {e}")
+                return
+        else:
+            bitmaps = np.zeros((NUM_FEATURES, 0), dtype=np.uint8)
+
+        self._names = []
+        self._slots = {}
+        self._entries = {}
+        self._free = []
+        for slot, agent in enumerate(agents):
+            if agent is None:
+                self._names.append(None)
+                self._free.append(slot)
+                continue
+            self._names.append(agent["name"])
+            self._slots[agent["name"]] = slot
+            # Entries written before indexed_at existed count as expired
+            self._entries[agent["name"]] = IndexEntry(
+                agent["version"], agent["digest"], agent.get("indexed_at", 0.0)
+            )
+        self._bitmaps = bitmaps
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Writes pending changes to disk, replacing the previous files atomically."""
+        if not self._dirty or not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        postings_path = os.path.join(self.directory, POSTINGS_FILE)
+        manifest_path = os.path.join(self.directory, MANIFEST_FILE)
+
+        np.ascontiguousarray(self._bitmaps[:, : self._row_bytes()]).tofile(postings_path + ".tmp")
+        manifest = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "tokens": FEATURE_NAMES,
+            "agents": [
+                None if name is None else {"name": name, **self._entries[name]._asdict()}
+                for name in self._names
+            ],
+        }
+        with open(manifest_path + ".tmp", "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file)
+        os.replace(postings_path + ".tmp", postings_path)
+        os.replace(manifest_path + ".tmp", manifest_path)
+        self._dirty = False
+
+    def is_current(self, agent_name: str, version: str) -> bool:
+        """True when the agent is indexed for this AgentCard version and its entry has not expired."""
+        entry = self._entries.get(agent_name)
+        if entry is None or entry.version != version:
+            return False
+        return self.max_age_seconds is None or self._clock() - entry.indexed_at < self.max_age_seconds
+
+    def features_of(self, agent_name: str) -> Optional[np.ndarray]:
+        """Reads an indexed agent's feature vector back out of the postings."""
+        slot = self._slots.get(agent_name)
+        if slot is None:
+            return None
+        return (self._bitmaps[:, slot >> 3] >> (slot & 7) & 1).astype(bool)
+
+    def update(self, agent_name: str, version: str, digest: str, features: np.ndarray) -> bool:
+        """Indexes (or re-indexes) an agent's features; returns False when they did not change.
+
+        Either way the entry's ``indexed_at`` is renewed. An unchanged entry is only
+        rewritten to disk once it is half way to expiring.
+        """
+        now = self._clock()
+        entry = self._entries.get(agent_name)
+        if entry is not None and entry[:2] == (version, digest):
+            if self.max_age_seconds is not None and now - entry.indexed_at >= self.max_age_seconds / 2:
+                self._entries[agent_name] = entry._replace(indexed_at=now)
+                self._dirty = True
+            return False
+        slot = self._slots.get(agent_name)
+        if slot is None:
+            slot = self._allocate(agent_name)
+        self._set_bits(slot, np.asarray(features, dtype=bool))
+        self._entries[agent_name] = IndexEntry(version, digest, now)
+        self._dirty = True
+        return True
+
+    def remove(self, agent_name: str) -> None:
+        slot = self._slots.pop(agent_name, None)
+        if slot is None:
+            return
+        self._set_bits(slot, np.zeros(NUM_FEATURES, dtype=bool))
+        self._names[slot] = None
+        del self._entries[agent_name]
+        self._free.append(slot)
+        self._dirty = True
+
+    def complementary_candidates(self, requester: np.ndarray) -> List[str]:
+        """Returns indexed agents that can score above the base points with the requester.
+
+        Every compatibility rule needs a specific bit on the candidate side (for
+        example backend for a frontend requester), so the union of those postings
+        holds every candidate that can score above the base points. Everyone else
+        would only get the base score.
+        """
+        bitmaps = self._bitmaps[:, : self._row_bytes()]
+        wanted = np.zeros(bitmaps.shape[1], dtype=np.uint8)
+        complements = (
+            (FRONTEND, BACKEND),
+            (BACKEND, FRONTEND),
+            (INTROVERT, EXTROVERT),
+            (EXTROVERT, INTROVERT),
+            (BEGINNER, ADVANCED),
+            (ADVANCED, BEGINNER),
+        )
+        for requester_bit, candidate_bit in complements:
+            if requester[requester_bit]:
+                wanted |= bitmaps[candidate_bit]
+        for column in range(INTEREST_OFFSET, NUM_FEATURES):
+            if requester[column]:
+                wanted |= bitmaps[column]
+        leaders = bitmaps[LEADERSHIP]
+        wanted |= ~leaders & self._occupied() if requester[LEADERSHIP] else leaders
+        return self._names_in(wanted)
+
+    def _row_bytes(self) -> int:
+        return (len(self._names) + 7) // 8
+
+    def _occupied(self) -> np.ndarray:
+        occupied = np.array([name is not None for name in self._names], dtype=bool)
+        return np.packbits(occupied, bitorder="little")
+
+    def _names_in(self, bitmap: np.ndarray) -> List[str]:
+        bits = np.unpackbits(np.asarray(bitmap)[: self._row_bytes()], bitorder="little")[: len(self._names)]
+        return [self._names[slot] for slot in np.flatnonzero(bits) if self._names[slot] is not None]
+
+    def _allocate(self, agent_name: str) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self._names[slot] = agent_name
+        else:
+            slot = len(self._names)
+            self._names.append(agent_name)
+            needed = self._row_bytes()
+            if needed > self._bitmaps.shape[1]:
+                grown = np.zeros((NUM_FEATURES, max(needed, 2 * self._bitmaps.shape[1])), dtype=np.uint8)
+                grown[:, : self._bitmaps.shape[1]] = self._bitmaps
+                self._bitmaps = grown
+        self._slots[agent_name] = slot
+        return slot
+
+    def _set_bits(self, slot: int, features: np.ndarray) -> None:
+        if not self._bitmaps.flags.writeable:
+            # Copy-on-write: the loaded file stays mapped read-only until the first change
+            self._bitmaps = np.array(self._bitmaps)
+        byte, mask = slot >> 3, np.uint8(1 << (slot & 7))
+        self._bitmaps[features, byte] |= mask
+        self._bitmaps[~features, byte] &= ~mask
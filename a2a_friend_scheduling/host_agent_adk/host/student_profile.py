@@ -0,0 +1,54 @@
+"""
+Typed Student Profile Exchanged as a JSON DataPart
+"""
+
+import hashlib
+from typing import List
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Personalizes the content hash so a structured profile never shares a key with raw text
+_DIGEST_PERSON = b"student-profile"
+
+
+class StudentProfile(BaseModel):
+    """Structured profile a student agent returns from its ``profile`` skill.
+
+    Field names match the skills dicts the student agents already keep, so their
+    DataPart payload validates as-is; unknown fields are ignored and missing ones
+    stay empty. ``summary`` holds free text from agents that only answer in prose.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    technical_skills: List[str] = Field(default_factory=list)
+    interests: List[str] = Field(default_factory=list)
+    personality_traits: List[str] = Field(default_factory=list)
+    communication_style: str = ""
+    learning_style: str = ""
+    summary: str = ""
+
+    @classmethod
+    def from_text(cls, text: str) -> "StudentProfile":
+        return cls(summary=text)
+
+    def is_empty(self) -> bool:
+        return not any(getattr(self, field) for field in type(self).model_fields)
+
+    def digest(self) -> bytes:
+        """Returns a compact content hash of the canonical JSON form."""
+        canonical = self.model_dump_json().encode("utf-8")
+        return hashlib.blake2b(canonical, digest_size=16, person=_DIGEST_PERSON).digest()
+
+    def render(self) -> str:
+        """Renders the profile as labelled lines, e.g. "Technical Skills: a, b"."""
+        lines = []
+        for field in type(self).model_fields:
+            value = getattr(self, field)
+            if not value:
+                continue
+            if isinstance(value, list):
+                value = ", ".join(value)
+            label = "Profile" if field == "summary" else field.replace("_", " ").title()
+            lines.append(f"{label}: {value}")
+        return "\n".join(lines)
@@ -0,0 +1,174 @@
+"""
+Whole-Class Team Formation over a Pairwise Compatibility Matrix
+"""
+
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+# Rosters up to this size are paired exactly (bitmask DP); larger ones use local search
+EXACT_PAIRING_LIMIT = 14
+# Safety cap on local-search improvement rounds
+DEFAULT_MAX_ROUNDS = 50
+
+
+def team_score(scores: np.ndarray, members: List[int]) -> float:
+    """Sum of pairwise compatibility over every pair inside a team."""
+    if len(members) < 2:
+        return 0.0
+    block = scores[np.ix_(members, members)]
+    return float((block.sum() - np.trace(block)) / 2)
+
+
+def partition_into_teams(
+    scores: np.ndarray, team_size: int, max_rounds: int = DEFAULT_MAX_ROUNDS
+) -> List[List[int]]:
+    """Splits a roster into teams that maximize total within-team compatibility.
+
+    ``scores`` is a symmetric (N, N) matrix. Every student is placed and team sizes
+    differ by at most one (see ``team_sizes``): leftover students join existing
+    teams when there are enough teams to take them, otherwise one more, smaller
+    team is formed. Even rosters of up to
+    ``EXACT_PAIRING_LIMIT`` students are paired exactly when ``team_size`` is 2.
+    Everything else is seeded greedily and then improved by swap/move local search.
+    """
+    if team_size < 2:
+        raise ValueError("team_size must be at least 2")
+    n = scores.shape[0]
+    if n == 0:
+        return []
+    if n <= team_size:
+        return [list(range(n))]
+
+    scores = np.array(scores, dtype=np.float64)
+    np.fill_diagonal(scores, 0.0)
+
+    if team_size == 2 and n % 2 == 0 and n <= EXACT_PAIRING_LIMIT:
+        return _exact_pairs(scores)
+
+    sizes = team_sizes(n, team_size)
+    teams = _greedy_teams(scores, sizes)
+    return _improve(scores, teams, min(sizes), max_rounds)
+
+
+def team_sizes(n: int, team_size: int) -> List[int]:
+    """Sizes of the teams a roster of ``n`` is split into, largest first.
+
+    With ``n // team_size`` teams the leftovers are spread one per team, giving
+    ``team_size`` or ``team_size + 1`` members. When there are more leftovers than
+    teams, one more team is formed and the roster is spread evenly over all of
+    them, so teams get ``team_size`` or fewer members.
+    """
+    if n <= team_size:
+        return [n] if n else []
+    team_count, leftover = divmod(n, team_size)
+    if leftover > team_count:
+        team_count += 1
+    base, extra = divmod(n, team_count)
+    return [base + 1] * extra + [base] * (team_count - extra)
+
+
+def _exact_pairs(scores: np.ndarray) -> List[List[int]]:
+    """Maximum-weight perfect matching by DP over subsets (small rosters only)."""
+    n = scores.shape[0]
+    weights = scores.tolist()
+    full = (1 << n) - 1
+
+    @lru_cache(maxsize=None)
+    def best(mask: int) -> Tuple[float, Tuple[Tuple[int, int], ...]]:
+        if mask == full:
+            return 0.0, ()
+        first = next(i for i in range(n) if not mask >> i & 1)
+        best_total, best_pairs = -1.0, ()
+        for partner in range(first + 1, n):
+            if mask >> partner & 1:
+                continue
+            total, pairs = best(mask | 1 << first | 1 << partner)
+            total += weights[first][partner]
+            if total > best_total:
+                best_total, best_pairs = total, ((first, partner),) + pairs
+        return best_total, best_pairs
+
+    _, pairs = best(0)
+    return [list(pair) for pair in pairs]
+
+
+def _greedy_teams(scores: np.ndarray, sizes: List[int]) -> List[List[int]]:
+    """Seeds each team with the best-connected free student and grows it by marginal gain."""
+    n = scores.shape[0]
+    free = np.ones(n, dtype=bool)
+    connectivity = scores.sum(axis=1)
+    teams: List[List[int]] = []
+
+    for size in sizes:
+        seed = int(np.argmax(np.where(free, connectivity, -np.inf)))
+        team = [seed]
+        free[seed] = False
+        gain = scores[seed].copy()
+        while len(team) < size:
+            member = int(np.argmax(np.where(free, gain, -np.inf)))
+            team.append(member)
+            free[member] = False
+            gain += scores[member]
+        teams.append(team)
+    return teams
+
+
+def _improve(
+    scores: np.ndarray, teams: List[List[int]], base_size: int, max_rounds: int
+) -> List[List[int]]:
+    """Swap/move local search until no single change improves the total.
+
+    Teams have ``base_size`` or ``base_size + 1`` members, and moves keep them so.
+    """
+    n = scores.shape[0]
+    assignment = np.empty(n, dtype=np.int64)
+    for t, team in enumerate(teams):
+        assignment[team] = t
+    sizes = np.array([len(team) for team in teams])
+    membership = np.zeros((n, len(teams)))
+    membership[np.arange(n), assignment] = 1.0
+    # affinity[i, t] = total compatibility of student i with the members of team t
+    affinity = scores @ membership
+    students = np.arange(n)
+
+    for _ in range(max_rounds):
+        improved = False
+        for a in range(n):
+            team_a = assignment[a]
+            own = affinity[a, team_a]
+            # Swap a with every student b in another team, all at once
+            gains = (
+                affinity[a, assignment] - scores[a] - own
+                + affinity[students, team_a] - scores[:, a] - affinity[students, assignment]
+            )
+            gains[assignment == team_a] = 0.0
+            # Move a on its own when that keeps team sizes within {k, k + 1}
+            move_gains = affinity[a] - own
+            movable = (sizes == base_size) & (sizes[team_a] == base_size + 1)
+            move_gains[~movable] = 0.0
+
+            b = int(np.argmax(gains))
+            target = int(np.argmax(move_gains))
+            if max(gains[b], move_gains[target]) <= 1e-9:
+                continue
+            improved = True
+            if gains[b] >= move_gains[target]:
+                team_b = assignment[b]
+                affinity[:, team_a] += scores[:, b] - scores[:, a]
+                affinity[:, team_b] += scores[:, a] - scores[:, b]
+                assignment[a], assignment[b] = team_b, team_a
+            else:
+                affinity[:, team_a] -= scores[:, a]
+                affinity[:, target] += scores[:, a]
+                sizes[team_a] -= 1
+                sizes[target] += 1
+                assignment[a] = target
+        if not improved:
+            break
+
+    result: List[List[int]] = [[] for _ in teams]
+    for student, t in enumerate(assignment.tolist()):
+        result[t].append(student)
+    return [team for team in result if team]
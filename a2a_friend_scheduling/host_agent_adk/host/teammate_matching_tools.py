@@ -2,105 +2,114 @@
 Teammate Matching Tools for Student Agent Compatibility Analysis
 """
 
-from typing import Dict, List, Tuple, Any
+import asyncio
+import uuid
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from a2a.types import (
+    DataPart,
+    Message,
+    MessageSendParams,
+    Part,
+    Role,
+    SendMessageRequest,
+    Task,
+)
 from google.adk.tools.tool_context import ToolContext
 
+from pydantic import ValidationError
+from scheduling_common.skills import PROFILE_SKILL_ID
+
+from .availability import AVAILABILITY_SKILL_ID, Availability, AvailabilitySolver
+from .compatibility_scoring import CompatibilityScorer
+from .compatibility_scoring import profile_digest
+from .profile_cache import ProfileCache
+from .skill_index import SkillIndex
+from .student_profile import StudentProfile
+from .team_formation import partition_into_teams, team_score
+from .teammate_ranking import RosterIndex
+
+# Upper bound on profile requests in flight at once during a fan-out
+DEFAULT_MAX_CONCURRENCY = 8
+# Seconds each student agent gets to answer before it is left out of the match
+DEFAULT_PROFILE_TIMEOUT = 20.0
+# Calendars change more often than profiles, so fetched availability goes stale sooner
+DEFAULT_AVAILABILITY_TTL = 60.0
+
+
 
 class TeammateMatchingEngine:
     """Engine for analyzing student compatibility and finding optimal teammates."""
     
-    def __init__(self, remote_agent_connections: Dict[str, Any]):
+    def __init__(
+        self,
+        remote_agent_connections: Dict[str, Any],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        profile_timeout: float = DEFAULT_PROFILE_TIMEOUT,
+        profile_cache: Optional[ProfileCache] = None,
+        skill_index: Optional[SkillIndex] = None,
+        availability_cache: Optional[ProfileCache] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
         self.remote_agent_connections = remote_agent_connections
+        self.max_concurrency = max_concurrency
+        self.profile_timeout = profile_timeout
+        self.profile_cache = profile_cache if profile_cache is not None else ProfileCache()
+        self.availability_cache = (
+            availability_cache
+            if availability_cache is not None
+            else ProfileCache(ttl_seconds=DEFAULT_AVAILABILITY_TTL)
+        )
+        self.scorer = CompatibilityScorer()
+        self.roster = RosterIndex()
+        self.skill_index = (
+            skill_index
+            if skill_index is not None
+            else SkillIndex(max_age_seconds=self.profile_cache.ttl_seconds)
+        )
+        # agent_name -> the profile object last added to the roster, compared by identity
+        self._indexed_profiles: Dict[str, StudentProfile] = {}
     
-    def analyze_compatibility(self, requester_profile: str, candidate_profile: str) -> Tuple[float, str]:
+    def analyze_compatibility(
+        self, requester_profile: StudentProfile, candidate_profile: StudentProfile
+    ) -> Tuple[float, str]:
         """Analyzes compatibility between two student profiles and returns a score with reasoning."""
-        
-        # Convert profiles to lowercase for analysis
-        req_profile = requester_profile.lower()
-        cand_profile = candidate_profile.lower()
-        
-        compatibility_score = 0.0
-        reasoning_points = []
-        
-        # Define skill categories and keywords
-        frontend_skills = ['html', 'css', 'javascript', 'react', 'ui', 'ux', 'frontend', 'design', 'responsive']
-        backend_skills = ['python', 'api', 'backend', 'database', 'sql', 'server', 'crewai']
-        leadership_skills = ['leadership', 'project management', 'team', 'organize', 'mentor', 'lead']
-        communication_styles = {
-            'introvert': ['introvert', 'quiet', 'reserved', 'shy', 'thoughtful', 'prefer written'],
-            'extrovert': ['extrovert', 'enthusiastic', 'outgoing', 'friendly', 'loves explaining', 'confident']
-        }
-        experience_levels = {
-            'beginner': ['basic', 'learning', 'beginner', 'still learning', 'not confident', 'improving'],
-            'advanced': ['expert', 'experienced', 'advanced', 'confident', 'strong', 'excellent']
-        }
-        
-        # Analyze skill complementarity
-        req_frontend = any(skill in req_profile for skill in frontend_skills)
-        req_backend = any(skill in req_profile for skill in backend_skills)
-        req_leadership = any(skill in req_profile for skill in leadership_skills)
-        
-        cand_frontend = any(skill in cand_profile for skill in frontend_skills)
-        cand_backend = any(skill in cand_profile for skill in backend_skills)
-        cand_leadership = any(skill in cand_profile for skill in leadership_skills)
-        
-        # Skill complementarity scoring
-        if req_frontend and cand_backend:
-            compatibility_score += 30
-            reasoning_points.append("Frontend + Backend skill complementarity")
-        elif req_backend and cand_frontend:
-            compatibility_score += 30
-            reasoning_points.append("Backend + Frontend skill complementarity")
-        
-        if req_leadership and not cand_leadership:
-            compatibility_score += 20
-            reasoning_points.append("Leadership + Technical collaboration")
-        elif not req_leadership and cand_leadership:
-            compatibility_score += 20
-            reasoning_points.append("Technical + Leadership collaboration")
-        
-        # Communication style balance
-        req_introvert = any(word in req_profile for word in communication_styles['introvert'])
-        req_extrovert = any(word in req_profile for word in communication_styles['extrovert'])
-        cand_introvert = any(word in cand_profile for word in communication_styles['introvert'])
-        cand_extrovert = any(word in cand_profile for word in communication_styles['extrovert'])
-        
-        if (req_introvert and cand_extrovert) or (req_extrovert and cand_introvert):
-            compatibility_score += 25
-            reasoning_points.append("Balanced introvert-extrovert communication styles")
-        
-        # Experience level balance
-        req_beginner = any(word in req_profile for word in experience_levels['beginner'])
-        req_advanced = any(word in req_profile for word in experience_levels['advanced'])
-        cand_beginner = any(word in cand_profile for word in experience_levels['beginner'])
-        cand_advanced = any(word in cand_profile for word in experience_levels['advanced'])
-        
-        if (req_beginner and cand_advanced) or (req_advanced and cand_beginner):
-            compatibility_score += 15
-            reasoning_points.append("Mentor-learner experience balance")
-        
-        # Interest overlap (small bonus for shared interests)
-        common_interests = []
-        interest_keywords = ['ai', 'machine learning', 'web development', 'programming', 'design', 'projects']
-        for interest in interest_keywords:
-            if interest in req_profile and interest in cand_profile:
-                common_interests.append(interest)
-        
-        if common_interests:
-            compatibility_score += 10
-            reasoning_points.append(f"Shared interests: {', '.join(common_interests)}")
-        
-        # Create reasoning string
-        if reasoning_points:
-            reasoning = "Strong compatibility due to: " + "; ".join(reasoning_points)
-        else:
-            reasoning = "Basic compatibility - could work well together with some shared foundation"
-            compatibility_score += 5  # Base compatibility score
-        
-        return compatibility_score, reasoning
+        score = self.scorer.score_candidates(requester_profile, [candidate_profile])[0]
+        return float(score), self.scorer.explain(requester_profile, candidate_profile)
 
-    async def get_student_profile(self, agent_name: str, send_message_func, tool_context: ToolContext) -> str:
-        """Gets a student's complete profile using the send_message function."""
+    def _card_version(self, agent_name: str) -> str:
+        """Returns the advertised AgentCard version used to key cached profiles."""
+        card = getattr(self.remote_agent_connections.get(agent_name), "card", None)
+        return getattr(card, "version", None) or ""
+
+    async def get_student_profile(
+        self, agent_name: str, send_message_func, tool_context: ToolContext
+    ) -> Optional[StudentProfile]:
+        """Gets a student's complete profile, served from the profile cache while it is fresh."""
+        return await self.profile_cache.get_or_fetch(
+            agent_name,
+            self._card_version(agent_name),
+            lambda: self._request_student_profile(agent_name, send_message_func, tool_context),
+        )
+
+    def _advertises_skill(self, agent_name: str, skill_id: str) -> bool:
+        card = getattr(self.remote_agent_connections.get(agent_name), "card", None)
+        return any(skill.id == skill_id for skill in getattr(card, "skills", None) or [])
+
+    async def _request_student_profile(
+        self, agent_name: str, send_message_func, tool_context: ToolContext
+    ) -> Optional[StudentProfile]:
+        """Asks a student agent for its complete profile.
+
+        Agents that advertise the ``profile`` skill answer a structured request
+        directly from their data; everyone else is asked in natural language and
+        the reply is kept as the profile's free-text summary.
+        """
+        if self._advertises_skill(agent_name, PROFILE_SKILL_ID):
+            profile = await self._request_structured_profile(agent_name)
+            if profile:
+                return profile
         try:
             response = await send_message_func(
                 agent_name,
@@ -112,88 +121,372 @@ class TeammateMatchingEngine:
                 for part in response:
                     if isinstance(part, dict) and "text" in part:
                         profile_text += part["text"] + " "
-                return profile_text.strip()
+                if profile_text.strip():
+                    return StudentProfile.from_text(profile_text.strip())
         except Exception as e:
             print(f"Error getting profile from {agent_name}: {e}")
-        return ""
+        return None
+
+    async def _request_structured_profile(self, agent_name: str) -> Optional[StudentProfile]:
+        """Requests the ``profile`` skill and validates the returned DataPart."""
+        data = await self._request_skill_data(agent_name, {"skill": PROFILE_SKILL_ID})
+        if data is None:
+            return None
+        try:
+            profile = StudentProfile.model_validate(data)
+        except ValidationError as e:
+            print(f"Invalid structured profile from {agent_name}: {e}")
+            return None
+        return None if profile.is_empty() else profile
+
+    async def _request_skill_data(self, agent_name: str, request_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Sends a structured skill request as a DataPart and returns the first DataPart of the answer."""
+        message_id = str(uuid.uuid4())
+        request = SendMessageRequest(
+            id=message_id,
+            params=MessageSendParams(
+                message=Message(
+                    role=Role.user,
+                    parts=[Part(root=DataPart(data=request_data))],
+                    messageId=message_id,
+                )
+            ),
+        )
+        try:
+            response = await self.remote_agent_connections[agent_name].send_message(request)
+        except Exception as e:
+            print(f"Error getting {request_data['skill']} data from {agent_name}: {e}")
+            return None
+        result = getattr(response.root, "result", None)
+        if isinstance(result, Task):
+            for artifact in result.artifacts or []:
+                for part in artifact.parts:
+                    if isinstance(part.root, DataPart):
+                        return part.root.data
+        return None
+
+    async def get_availability(self, agent_name: str) -> Optional[Availability]:
+        """Gets a student's free slots from today on, served from the availability cache while fresh.
+
+        Only agents that advertise the ``availability`` skill are asked; others map to None.
+        """
+        if not self._advertises_skill(agent_name, AVAILABILITY_SKILL_ID):
+            return None
+        today = date.today()
+        return await self.availability_cache.get_or_fetch(
+            agent_name,
+            # The answer starts today, so it is keyed by the day as well as the card version
+            f"{self._card_version(agent_name)}@{today.isoformat()}",
+            lambda: self._request_availability(agent_name, today),
+        )
+
+    async def _request_availability(self, agent_name: str, start: date) -> Optional[Availability]:
+        """Requests the ``availability`` skill from ``start`` on and validates the returned DataPart."""
+        data = await self._request_skill_data(
+            agent_name, {"skill": AVAILABILITY_SKILL_ID, "start": start.isoformat()}
+        )
+        if data is None:
+            return None
+        try:
+            return Availability.model_validate(data)
+        except ValidationError as e:
+            print(f"Invalid availability from {agent_name}: {e}")
+            return None
+
+    async def fetch_profiles(
+        self, agent_names: Iterable[str], send_message_func, tool_context: ToolContext
+    ) -> Dict[str, Optional[StudentProfile]]:
+        """Fetches several student profiles concurrently.
+
+        At most ``max_concurrency`` requests are in flight at once and each agent
+        gets ``profile_timeout`` seconds to answer. Agents that fail or miss the
+        deadline map to None so callers can work with partial results.
+        """
+        return await self._fan_out(
+            agent_names,
+            lambda agent_name: self.get_student_profile(agent_name, send_message_func, tool_context),
+            "profile",
+        )
+
+    async def fetch_availability(self, agent_names: Iterable[str]) -> Dict[str, Optional[Availability]]:
+        """Fetches several students' availability concurrently, with the same limits as ``fetch_profiles``."""
+        return await self._fan_out(agent_names, self.get_availability, "availability")
+
+    async def _fan_out(
+        self, agent_names: Iterable[str], fetch: Callable[[str], Awaitable[Any]], what: str
+    ) -> Dict[str, Any]:
+        """Runs ``fetch`` for each agent, bounded by ``max_concurrency`` and ``profile_timeout``."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _fetch(agent_name: str) -> Tuple[str, Any]:
+            async with semaphore:
+                try:
+                    result = await asyncio.wait_for(fetch(agent_name), timeout=self.profile_timeout)
+                except asyncio.TimeoutError:
+                    print(f"Timed out getting {what} from {agent_name} after {self.profile_timeout}s")
+                    result = None
+                return agent_name, result
+
+        results = await asyncio.gather(*(_fetch(name) for name in dict.fromkeys(agent_names)))
+        return dict(results)
 
-    async def find_best_teammate(self, requester_name: str, send_message_func, tool_context: ToolContext) -> str:
-        """Finds the best teammate for a specific student based on dynamic profile analysis."""
+    def _refresh_roster(self, profiles: Dict[str, StudentProfile]) -> None:
+        """Re-indexes only the candidates whose profile object changed since last time."""
+        for agent_name, profile in profiles.items():
+            if self._indexed_profiles.get(agent_name) is not profile:
+                self.roster.update(agent_name, self.scorer.features(profile))
+                self._indexed_profiles[agent_name] = profile
+
+    def _index_profiles(self, profiles: Dict[str, Optional[StudentProfile]]) -> None:
+        """Records freshly fetched profiles in the skill index and persists any changes."""
+        for agent_name, profile in profiles.items():
+            if profile:
+                self.skill_index.update(
+                    agent_name,
+                    self._card_version(agent_name),
+                    profile_digest(profile).hex(),
+                    self.scorer.features(profile),
+                )
+        self.skill_index.flush()
+
+    def _candidates_for(self, requester_name: str, k: int) -> List[str]:
+        """Picks the candidates worth fetching for a requester using the skill index.
+
+        When the requester's index entry is current, only agents that complement it
+        (plus agents whose entry is missing or expired) are returned; the rest could
+        only score the base points. Only current complementary agents count toward
+        k, since the others may turn out not to score; with fewer than k of them
+        everyone is returned.
+        """
+        everyone = [name for name in self.remote_agent_connections.keys() if name != requester_name]
+        if not self.skill_index.is_current(requester_name, self._card_version(requester_name)):
+            return everyone
+        complementary = set(self.skill_index.complementary_candidates(self.skill_index.features_of(requester_name)))
+        selected = []
+        known_complements = 0
+        for name in everyone:
+            if not self.skill_index.is_current(name, self._card_version(name)):
+                selected.append(name)
+            elif name in complementary:
+                selected.append(name)
+                known_complements += 1
+        return selected if known_complements >= k else everyone
+
+    async def find_best_teammate(self, requester_name: str, send_message_func, tool_context: ToolContext, k: int = 3) -> str:
+        """Finds the best teammates for a specific student, returning a ranked list of up to ``k``."""
         print(f"Finding best teammate for {requester_name}...")
         
-        # Step 1: Get the requester's profile
-        requester_profile = ""
-        if requester_name in self.remote_agent_connections:
-            requester_profile = await self.get_student_profile(requester_name, send_message_func, tool_context)
-        else:
+        if requester_name not in self.remote_agent_connections:
             return f"Sorry, I couldn't find a student named '{requester_name}'. Available students: {', '.join(self.remote_agent_connections.keys())}"
         
+        # Step 1: Fetch the requester and the complementary candidates in a single fan-out
+        candidate_names = self._candidates_for(requester_name, max(k, 1))
+        profiles = await self.fetch_profiles([requester_name, *candidate_names], send_message_func, tool_context)
+        self._index_profiles(profiles)
+        
+        requester_profile = profiles.get(requester_name)
         if not requester_profile:
             return f"Unable to get profile information for {requester_name}"
         
-        # Step 2: Get profiles of all other students
+        # Candidates that did not answer leave the ranking short; top up from the agents the index filtered out
+        if sum(1 for name in candidate_names if profiles.get(name)) < max(k, 1):
+            remaining = [
+                name for name in self.remote_agent_connections.keys()
+                if name != requester_name and name not in profiles
+            ]
+            if remaining:
+                extra = await self.fetch_profiles(remaining, send_message_func, tool_context)
+                self._index_profiles(extra)
+                profiles.update(extra)
+                candidate_names = [*candidate_names, *remaining]
+        
+        # Step 2: Keep whatever arrived in time; slow or failing agents are left out of the ranking
         other_students = {}
-        for agent_name in self.remote_agent_connections.keys():
-            if agent_name != requester_name:  # Don't include the requester
-                profile = await self.get_student_profile(agent_name, send_message_func, tool_context)
-                if profile:
-                    other_students[agent_name] = profile
-                else:
-                    other_students[agent_name] = "Profile unavailable"
+        unavailable = []
+        for agent_name in candidate_names:
+            profile = profiles.get(agent_name)
+            if profile:
+                other_students[agent_name] = profile
+            else:
+                unavailable.append(agent_name)
         
         if not other_students:
             return "No other students available for matching."
         
-        # Step 3: Analyze compatibility with each potential teammate
-        best_match = None
-        highest_score = 0
-        best_reasoning = ""
-        all_matches = []
-        
-        for candidate_name, candidate_profile in other_students.items():
-            score, reasoning = self.analyze_compatibility(requester_profile, candidate_profile)
-            all_matches.append((candidate_name, score, reasoning))
-            
-            if score > highest_score:
-                highest_score = score
-                best_match = candidate_name
-                best_reasoning = reasoning
+        # Step 3: Bounded top-K scan over the roster index
+        self._refresh_roster(other_students)
+        ranked = self.roster.top_k(
+            self.scorer.features(requester_profile),
+            max(k, 1),
+            exclude=[requester_name],
+            candidates=other_students,
+        )
         
         # Step 4: Format the response
-        if best_match:
+        if ranked:
+            best_match, highest_score = ranked[0]
+            best_reasoning = self.scorer.explain(requester_profile, other_students[best_match])
             result = f"## 🎯 Best Teammate Recommendation for {requester_name}\n\n"
             result += f"**Recommended Partner:** {best_match}\n"
             result += f"**Compatibility Score:** {highest_score:.1f}/100\n"
             result += f"**Why this match works:** {best_reasoning}\n\n"
             
-            result += f"**Your Profile Summary:**\n{requester_profile[:300]}...\n\n"
-            result += f"**{best_match}'s Profile Summary:**\n{other_students[best_match][:300]}...\n\n"
+            result += f"**Your Profile Summary:**\n{requester_profile.render()[:300]}...\n\n"
+            result += f"**{best_match}'s Profile Summary:**\n{other_students[best_match].render()[:300]}...\n\n"
             
-            # Show other potential matches
-            if len(all_matches) > 1:
+            # Show the rest of the ranked list
+            if len(ranked) > 1:
                 result += "**Other Potential Matches:**\n"
-                sorted_matches = sorted(all_matches, key=lambda x: x[1], reverse=True)
-                for name, score, reasoning in sorted_matches[1:3]:  # Show top 2 alternatives
-                    result += f"- **{name}** (Score: {score:.1f}) - {reasoning[:100]}...\n"
+                for rank, (name, score) in enumerate(ranked[1:], start=2):
+                    reasoning = self.scorer.explain(requester_profile, other_students[name])
+                    result += f"{rank}. **{name}** (Score: {score:.1f}) - {reasoning[:100]}...\n"
+            
+            if unavailable:
+                result += f"\n_No profile received in time from: {', '.join(unavailable)}_\n"
             
             return result
         else:
             return "Unable to find a suitable teammate match."
 
+    def build_teams(self, profiles: Dict[str, StudentProfile], team_size: int) -> List[Tuple[List[str], float]]:
+        """Partitions students into teams from their profiles, best-scoring teams first.
+
+        The pairwise score matrix is computed once for the whole roster and handed to
+        the team formation solver.
+        """
+        names = list(profiles.keys())
+        scores = self.scorer.pairwise_scores([profiles[name] for name in names])
+        teams = [
+            ([names[i] for i in members], team_score(scores, members))
+            for members in partition_into_teams(scores, team_size)
+        ]
+        return sorted(teams, key=lambda team: team[1], reverse=True)
+
+    async def form_teams(self, team_size: int, send_message_func, tool_context: ToolContext) -> str:
+        """Splits every known student into teams of ``team_size`` in one batch."""
+        print(f"Forming teams of {team_size} for the whole class...")
+        
+        if team_size < 2:
+            return "Team size must be at least 2."
+        
+        # Step 1: Fetch every profile in a single fan-out
+        profiles = await self.fetch_profiles(self.remote_agent_connections.keys(), send_message_func, tool_context)
+        self._index_profiles(profiles)
+        available = {name: profile for name, profile in profiles.items() if profile}
+        unavailable = [name for name, profile in profiles.items() if not profile]
+        
+        if len(available) < 2:
+            return "Not enough student profiles available to form teams."
+        
+        # Step 2: Score all pairs once and partition the class
+        teams = self.build_teams(available, team_size)
+        
+        # Step 3: Format the response
+        sizes = sorted({len(members) for members, _ in teams})
+        size_label = str(sizes[0]) if len(sizes) == 1 else f"{sizes[0]}-{sizes[-1]}"
+        result = f"## 👥 Team Plan ({len(teams)} teams of {size_label})\n\n"
+        for index, (members, score) in enumerate(teams, start=1):
+            pair_count = len(members) * (len(members) - 1) / 2
+            result += f"**Team {index}:** {', '.join(members)} "
+            result += f"(Team Score: {score:.1f}, avg {score / pair_count:.1f} per pair)\n"
+            if len(members) == 2:
+                result += f"- {self.scorer.explain(available[members[0]], available[members[1]])}\n"
+        
+        if unavailable:
+            result += f"\n_No profile received in time from: {', '.join(unavailable)}_\n"
+        
+        return result
+
+
+    async def common_availability(
+        self, teams: Iterable[Sequence[str]], k: int
+    ) -> Tuple[List[List[Tuple[date, str]]], List[str]]:
+        """Finds the ``k`` earliest slots each team is all free for.
+
+        Availability is fetched once per distinct student in a single fan-out and
+        packed into bitsets, so many teams cost little more than one. Teams with a
+        member who has no free slots skip the solver. Students without structured
+        availability are left out of their team's check and returned as the second
+        item.
+        """
+        teams = [list(dict.fromkeys(team)) for team in teams]
+        fetched = await self.fetch_availability(name for team in teams for name in team)
+        known = {name: availability for name, availability in fetched.items() if availability}
+        missing = [name for name in fetched if name not in known]
+        checked = [[name for name in team if name in known] for team in teams]
+        # A member with no free slots at all leaves the team no common time
+        open_teams = [
+            i for i, team in enumerate(checked) if not any(known[name].is_empty() for name in team)
+        ]
+        slots: List[List[Tuple[date, str]]] = [[] for _ in checked]
+        if not open_teams:
+            return slots, missing
+        now = datetime.now()
+        solver = AvailabilitySolver(
+            {name: known[name] for i in open_teams for name in checked[i]},
+            now.date(),
+            not_before=now.strftime("%H:%M"),
+        )
+        solved = solver.earliest_for_teams((checked[i] for i in open_teams), max(k, 1))
+        for i, team_slots in zip(open_teams, solved):
+            slots[i] = team_slots
+        return slots, missing
+
+    async def find_common_times(self, student_names: List[str], k: int = 5) -> str:
+        """Finds the earliest times a proposed team is all free, returning up to ``k``."""
+        print(f"Finding common times for {', '.join(student_names)}...")
+
+        unknown = [name for name in student_names if name not in self.remote_agent_connections]
+        if unknown:
+            return f"Sorry, I couldn't find {', '.join(unknown)}. Available students: {', '.join(self.remote_agent_connections.keys())}"
+        if not student_names:
+            return "Name at least one student to schedule."
+
+        (slots,), missing = await self.common_availability([student_names], k)
+        checked = [name for name in student_names if name not in missing]
+        if not checked:
+            return f"None of {', '.join(student_names)} shared their availability, so I can't find a common time."
+
+        if slots:
+            result = f"## 📅 Earliest Common Times for {', '.join(checked)}\n\n"
+            for day, slot in slots:
+                result += f"- {day.strftime('%A')} {day.isoformat()} at {slot}\n"
+        else:
+            result = f"{', '.join(checked)} have no free time in common in the shared calendars.\n"
+        if missing:
+            result += f"\n_No availability received from: {', '.join(missing)} (not included)_\n"
+        return result
+
 
 # Global instance will be initialized by the agent
 teammate_engine: TeammateMatchingEngine = None
 
 
-def initialize_teammate_engine(remote_agent_connections: Dict[str, Any]):
+def initialize_teammate_engine(remote_agent_connections: Dict[str, Any], **engine_options: Any):
     """Initialize the global teammate matching engine."""
     global teammate_engine
-    teammate_engine = TeammateMatchingEngine(remote_agent_connections)
+    teammate_engine = TeammateMatchingEngine(remote_agent_connections, **engine_options)
+
+
+async def find_best_teammate_tool(requester_name: str, send_message_func, tool_context: ToolContext, k: int = 3) -> str:
+    """Tool function for finding the best teammates - to be used by the agent."""
+    if teammate_engine is None:
+        return "Teammate matching engine not initialized."
+    
+    return await teammate_engine.find_best_teammate(requester_name, send_message_func, tool_context, k)
+
+
+async def form_teams_tool(team_size: int, send_message_func, tool_context: ToolContext) -> str:
+    """Tool function for splitting the whole class into teams - to be used by the agent."""
+    if teammate_engine is None:
+        return "Teammate matching engine not initialized."
+    
+    return await teammate_engine.form_teams(team_size, send_message_func, tool_context)
 
 
-async def find_best_teammate_tool(requester_name: str, send_message_func, tool_context: ToolContext) -> str:
-    """Tool function for finding the best teammate - to be used by the agent."""
+async def find_common_times_tool(student_names: List[str], k: int = 5) -> str:
+    """Tool function for finding when a team is all free - to be used by the agent."""
     if teammate_engine is None:
         return "Teammate matching engine not initialized."
     
-    return await teammate_engine.find_best_teammate(requester_name, send_message_func, tool_context)
\ No newline at end of file
+    return await teammate_engine.find_common_times(student_names, k)
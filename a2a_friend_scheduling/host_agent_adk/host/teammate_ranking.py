@@ -0,0 +1,194 @@
+"""
+Top-K Teammate Retrieval over a Roster Grouped by Feature Signature
+"""
+
+import heapq
+import itertools
+from typing import Container, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .compatibility_scoring import (
+    ADVANCED,
+    BACKEND,
+    BASE_POINTS,
+    BEGINNER,
+    COMMUNICATION_BALANCE_POINTS,
+    EXPERIENCE_BALANCE_POINTS,
+    EXTROVERT,
+    FRONTEND,
+    INTEREST_OFFSET,
+    INTROVERT,
+    LEADERSHIP_BALANCE_POINTS,
+    SHARED_INTEREST_POINTS,
+    SKILL_COMPLEMENT_POINTS,
+    score_against,
+)
+
+
+class RankedCandidate(NamedTuple):
+    name: str
+    score: float
+
+
+def feature_signature(features: np.ndarray) -> int:
+    """Packs a boolean feature vector into an int so identical profiles share a key."""
+    return int.from_bytes(np.packbits(features, bitorder="little").tobytes(), "little")
+
+
+def score_upper_bound(features: np.ndarray) -> float:
+    """Highest score a profile with these features can reach against any partner.
+
+    Each rule needs at least one relevant bit on this side; leadership balance is
+    always reachable, and the base points are never above it.
+    """
+    bound = LEADERSHIP_BALANCE_POINTS
+    if features[FRONTEND] or features[BACKEND]:
+        bound += SKILL_COMPLEMENT_POINTS
+    if features[INTROVERT] or features[EXTROVERT]:
+        bound += COMMUNICATION_BALANCE_POINTS
+    if features[BEGINNER] or features[ADVANCED]:
+        bound += EXPERIENCE_BALANCE_POINTS
+    if features[INTEREST_OFFSET:].any():
+        bound += SHARED_INTEREST_POINTS
+    return float(max(bound, BASE_POINTS))
+
+
+class _SignatureGroup:
+    __slots__ = ("features", "bound", "members")
+
+    def __init__(self, features: np.ndarray):
+        self.features = features
+        self.bound = score_upper_bound(features)
+        # name -> insertion order, kept in insertion order
+        self.members: Dict[str, int] = {}
+
+
+class RosterIndex:
+    """Roster of candidates bucketed by feature signature for bounded top-K queries.
+
+    Candidates with the same feature bits always get the same score, so a query
+    scores each distinct signature once. Groups are visited in order of their score
+    upper bound and the scan stops as soon as no remaining group can enter the top K,
+    which keeps the work per query tied to the number of distinct signatures rather
+    than the roster size.
+    """
+
+    def __init__(self):
+        self._groups: Dict[int, _SignatureGroup] = {}
+        self._signature_of: Dict[str, int] = {}
+        self._order = itertools.count()
+        self._ranked_groups: List[_SignatureGroup] = []
+        self._ranked_bounds = np.zeros(0)
+        self._ranked_first = np.zeros(0, dtype=np.int64)
+        self._dirty = False
+        self.last_groups_scored = 0
+
+    def __len__(self) -> int:
+        return len(self._signature_of)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._signature_of
+
+    def update(self, name: str, features: np.ndarray) -> None:
+        """Adds a candidate or moves it to its new signature group."""
+        signature = feature_signature(features)
+        if self._signature_of.get(name) == signature:
+            return
+        self.remove(name)
+        group = self._groups.get(signature)
+        if group is None:
+            group = self._groups[signature] = _SignatureGroup(np.array(features, dtype=bool))
+            self._dirty = True
+        group.members[name] = next(self._order)
+        self._signature_of[name] = signature
+
+    def remove(self, name: str) -> None:
+        signature = self._signature_of.pop(name, None)
+        if signature is None:
+            return
+        group = self._groups[signature]
+        del group.members[name]
+        if not group.members:
+            del self._groups[signature]
+            self._dirty = True
+
+    def _ranked(self) -> List[_SignatureGroup]:
+        if self._dirty:
+            self._ranked_groups = sorted(
+                self._groups.values(),
+                key=lambda group: (-group.bound, min(group.members.values())),
+            )
+            self._ranked_bounds = np.array([group.bound for group in self._ranked_groups])
+            # Members only ever leave a group or join it with a later order, so these
+            # stay lower bounds on each group's earliest order until the next ranking
+            self._ranked_first = np.array(
+                [next(iter(group.members.values())) for group in self._ranked_groups], dtype=np.int64
+            )
+            self._dirty = False
+        return self._ranked_groups
+
+    def top_k(
+        self,
+        requester: np.ndarray,
+        k: int,
+        exclude: Iterable[str] = (),
+        candidates: Optional[Container[str]] = None,
+    ) -> List[RankedCandidate]:
+        """Returns the ``k`` best candidates for a requester, best first.
+
+        ``candidates`` optionally restricts the ranking to a subset of the roster.
+        Equal scores rank in the order candidates were added to the roster, so the
+        result matches a stable sort of the whole roster by score.
+        """
+        if k < 1:
+            return []
+        excluded = set(exclude)
+        ceiling = score_upper_bound(requester)
+        # Min-heap of (score, -order, name) holding the best k seen so far
+        heap: List[Tuple[float, int, str]] = []
+        self.last_groups_scored = 0
+        ranked = self._ranked()
+
+        stop = len(ranked)
+        for index, group in enumerate(ranked):
+            if len(heap) == k and heap[0][0] >= min(group.bound, ceiling):
+                stop = index
+                break
+            self._offer(heap, k, requester, group, excluded, candidates)
+
+        if stop < len(ranked):
+            # The groups left can at best tie the k-th score, which only matters for
+            # members added before the k-th entry. Visiting them earliest member first,
+            # the scan ends at the first group with no member before it.
+            tied = stop + np.flatnonzero(np.minimum(self._ranked_bounds[stop:], ceiling) == heap[0][0])
+            first = self._ranked_first[tied]
+            for index, order in zip(tied[np.argsort(first, kind="stable")], np.sort(first)):
+                if order >= -heap[0][1]:
+                    break
+                self._offer(heap, k, requester, ranked[index], excluded, candidates)
+
+        return [RankedCandidate(name, score) for score, _, name in sorted(heap, reverse=True)]
+
+    def _offer(
+        self,
+        heap: List[Tuple[float, int, str]],
+        k: int,
+        requester: np.ndarray,
+        group: _SignatureGroup,
+        excluded: Container[str],
+        candidates: Optional[Container[str]],
+    ) -> None:
+        """Scores a group and pushes its members into the top-k heap while they rank."""
+        score = float(score_against(requester, group.features)[0])
+        self.last_groups_scored += 1
+        for name, order in group.members.items():
+            if name in excluded or (candidates is not None and name not in candidates):
+                continue
+            entry = (score, -order, name)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+            else:
+                break
@@ -2,18 +2,8 @@ import logging
 import os
 import sys
 
-import httpx
 import uvicorn
-from a2a.server.apps import A2AStarletteApplication
-from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryPushNotifier, InMemoryTaskStore
-from a2a.types import (
-    AgentCapabilities,
-    AgentCard,
-    AgentSkill,
-)
-from app.agent import KaitlynAgent
-from app.agent_executor import KaitlynAgentExecutor
+from app.server import HOST, PORT, WORKERS
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -28,48 +18,17 @@ class MissingAPIKeyError(Exception):
 
 def main():
     """Starts Kaitlyn's Agent server."""
-    host = "localhost"
-    port = 10004
     try:
         if not os.getenv("GOOGLE_API_KEY"):
             raise MissingAPIKeyError("GOOGLE_API_KEY environment variable not set.")
 
-        capabilities = AgentCapabilities(streaming=True, pushNotifications=True)
-        skill = AgentSkill(
-            id="student_assistant",
-            name="Student Assistant - Kaitlynn",
-            description="Chat with Kaitlynn about her skills, interests, and leadership experience.",
-            tags=["student", "skills", "leadership", "project-management"],
-            examples=[
-                "What skills do you have?",
-                "Tell me about your technical abilities",
-                "What are you interested in?",
-                "What's your communication style?",
-                "How do you prefer to learn?",
-            ],
-        )
-        agent_card = AgentCard(
-            name="Kaitlynn Agent",
-            description="A confident and organized student agent representing Kaitlynn. Ask about her skills, interests, and leadership experience.",
-            url=f"http://{host}:{port}/",
-            version="1.0.0",
-            defaultInputModes=KaitlynAgent.SUPPORTED_CONTENT_TYPES,
-            defaultOutputModes=KaitlynAgent.SUPPORTED_CONTENT_TYPES,
-            capabilities=capabilities,
-            skills=[skill],
-        )
-
-        httpx_client = httpx.AsyncClient()
-        request_handler = DefaultRequestHandler(
-            agent_executor=KaitlynAgentExecutor(),
-            task_store=InMemoryTaskStore(),
-            push_notifier=InMemoryPushNotifier(httpx_client),
-        )
-        server = A2AStarletteApplication(
-            agent_card=agent_card, http_handler=request_handler
-        )
-
-        uvicorn.run(server.build(), host=host, port=port)
+        if WORKERS > 1:
+            # Workers are separate processes; keep tasks and conversation state in SQLite
+            # so any of them can continue a task
+            os.environ.setdefault("KAITLYNN_TASK_DB", "kaitlynn_tasks.sqlite")
+            os.environ.setdefault("KAITLYNN_CHECKPOINTER", "sqlite")
+        # Workers are spawned processes that import the app, so pass it by name
+        uvicorn.run("app.server:create_app", factory=True, host=HOST, port=PORT, workers=WORKERS)
 
     except MissingAPIKeyError as e:
         logger.error(f"Error: {e}")
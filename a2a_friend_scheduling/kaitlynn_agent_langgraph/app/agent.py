@@ -1,15 +1,15 @@
 from collections.abc import AsyncIterable
-from typing import Any, Literal
+from typing import Any, Literal, Optional
 
-from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.prebuilt import create_react_agent
 from pydantic import BaseModel, Field
 
-memory = MemorySaver()
+from app.checkpointer import create_checkpointer
 
 
 KAITLYNN_SKILLS = {
@@ -102,28 +102,61 @@ class KaitlynAgent:
         "Set response status to completed if the request is complete."
     )
 
-    def __init__(self):
+    def __init__(self, checkpointer: Optional[BaseCheckpointSaver] = None):
         self.model = ChatGoogleGenerativeAI(model="gemini-2.0-flash")
         self.tools = [get_kaitlynn_skills]
-
-        self.graph = create_react_agent(
-            self.model,
-            tools=self.tools,
-            checkpointer=memory,
-            prompt=self.SYSTEM_INSTRUCTION,
-            response_format=ResponseFormat,
-        )
-
-    def invoke(self, query, context_id):
+        self.checkpointer = checkpointer
+        self._graph = None
+
+    @property
+    def graph(self):
+        """The compiled graph, built on first use so the checkpointer binds to the serving loop."""
+        if self._graph is None:
+            if self.checkpointer is None:
+                self.checkpointer = create_checkpointer()
+            self._graph = create_react_agent(
+                self.model,
+                tools=self.tools,
+                checkpointer=self.checkpointer,
+                prompt=self.SYSTEM_INSTRUCTION,
+                response_format=ResponseFormat,
+            )
+        return self._graph
+
+    async def invoke(self, query, context_id):
         config: RunnableConfig = {"configurable": {"thread_id": context_id}}
-        self.graph.invoke({"messages": [("user", query)]}, config)
-        return self.get_agent_response(config)
+        await self.graph.ainvoke({"messages": [("user", query)]}, config)
+        return await self.get_agent_response(config)
 
     async def stream(self, query, context_id) -> AsyncIterable[dict[str, Any]]:
+        """Streams progress updates and the answer's tokens as the model produces them.
+
+        Token chunks are yielded with ``"partial": True``; the last item is the
+        structured final response.
+        """
         inputs = {"messages": [("user", query)]}
         config: RunnableConfig = {"configurable": {"thread_id": context_id}}
 
-        for item in self.graph.stream(inputs, config, stream_mode="values"):
+        async for mode, item in self.graph.astream(
+            inputs, config, stream_mode=["messages", "values"]
+        ):
+            if mode == "messages":
+                chunk, metadata = item
+                # Only the agent node's text; the structured-response call streams no prose
+                if (
+                    isinstance(chunk, AIMessageChunk)
+                    and metadata.get("langgraph_node") == "agent"
+                    and isinstance(chunk.content, str)
+                    and chunk.content
+                ):
+                    yield {
+                        "is_task_complete": False,
+                        "require_user_input": False,
+                        "partial": True,
+                        "content": chunk.content,
+                    }
+                continue
+
             message = item["messages"][-1]
             if (
                 isinstance(message, AIMessage)
@@ -142,10 +175,10 @@ class KaitlynAgent:
                     "content": "Processing information...",
                 }
 
-        yield self.get_agent_response(config)
+        yield await self.get_agent_response(config)
 
-    def get_agent_response(self, config):
-        current_state = self.graph.get_state(config)
+    async def get_agent_response(self, config):
+        current_state = await self.graph.aget_state(config)
         structured_response = current_state.values.get("structured_response")
         if structured_response and isinstance(structured_response, ResponseFormat):
             if structured_response.status == "input_required":
@@ -1,27 +1,34 @@
+import asyncio
 import logging
+import uuid
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.server.tasks import TaskUpdater
 from a2a.types import (
+    DataPart,
     InternalError,
     Part,
+    TaskNotCancelableError,
     TaskState,
     TextPart,
-    UnsupportedOperationError,
 )
 from a2a.utils.errors import ServerError
-from app.agent import KaitlynAgent
+from app.agent import KAITLYNN_SKILLS, KaitlynAgent
+from scheduling_common.artifacts import add_artifact_chunk
+from scheduling_common.skills import is_profile_request
+from scheduling_common.task_store import TERMINAL_STATES
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-
 class KaitlynAgentExecutor(AgentExecutor):
     """Kaitlyn's Scheduling AgentExecutor."""
 
     def __init__(self):
         self.agent = KaitlynAgent()
+        # task_id -> asyncio task streaming its graph run
+        self._running_tasks: dict[str, asyncio.Task] = {}
 
     async def execute(
         self,
@@ -38,35 +45,90 @@ class KaitlynAgentExecutor(AgentExecutor):
             await updater.submit()
         await updater.start_work()
 
+        if is_profile_request(context.message):
+            await updater.add_artifact(
+                [Part(root=DataPart(data=KAITLYNN_SKILLS))], name="profile"
+            )
+            await updater.complete()
+            return
+
         query = context.get_user_input()
+        # Answer tokens are appended to this artifact as they arrive
+        artifact_id = str(uuid.uuid4())
+        streamed = False
+        self._running_tasks[context.task_id] = asyncio.current_task()
         try:
             async for item in self.agent.stream(query, context.context_id):
                 is_task_complete = item["is_task_complete"]
                 require_user_input = item["require_user_input"]
                 parts = [Part(root=TextPart(text=item["content"]))]
 
-                if not is_task_complete and not require_user_input:
+                if item.get("partial"):
+                    # Forward answer tokens as they arrive so the caller sees text early
+                    await add_artifact_chunk(
+                        updater,
+                        parts,
+                        artifact_id,
+                        "scheduling_result",
+                        append=streamed,
+                        last_chunk=False,
+                    )
+                    streamed = True
+                elif not is_task_complete and not require_user_input:
                     await updater.update_status(
                         TaskState.working,
                         message=updater.new_agent_message(parts),
                     )
                 elif require_user_input:
+                    if streamed:
+                        # The streamed tokens were a draft of the question; close
+                        # the artifact with its full text
+                        await add_artifact_chunk(
+                            updater,
+                            parts,
+                            artifact_id,
+                            "scheduling_result",
+                            append=False,
+                            last_chunk=True,
+                        )
                     await updater.update_status(
                         TaskState.input_required,
                         message=updater.new_agent_message(parts),
                     )
                     break
                 else:
-                    await updater.add_artifact(
+                    # The structured answer replaces the streamed tokens, so
+                    # every client ends up with it as a single part
+                    await add_artifact_chunk(
+                        updater,
                         parts,
-                        name="scheduling_result",
+                        artifact_id,
+                        "scheduling_result",
+                        append=False,
+                        last_chunk=True,
                     )
                     await updater.complete()
                     break
 
+        except asyncio.CancelledError:
+            # Cancelling the stream also cancels the graph's in-flight model call
+            await updater.update_status(TaskState.canceled, final=True)
+            raise
         except Exception as e:
             logger.error(f"An error occurred while streaming the response: {e}")
             raise ServerError(error=InternalError()) from e
+        finally:
+            self._running_tasks.pop(context.task_id, None)
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
-        raise ServerError(error=UnsupportedOperationError())
+        """Cancels a task, stopping its graph run if one is in flight."""
+        task = context.current_task
+        if task is None or task.status.state in TERMINAL_STATES:
+            raise ServerError(error=TaskNotCancelableError())
+        running = self._running_tasks.pop(context.task_id, None)
+        if running is not None:
+            # The interrupted execute() publishes canceled
+            running.cancel()
+            return
+        updater = TaskUpdater(event_queue, context.task_id, context.context_id)
+        await updater.update_status(TaskState.canceled, final=True)
@@ -0,0 +1,189 @@
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Optional
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+
+# Conversation state limits for the in-memory checkpointer
+DEFAULT_MAX_THREADS = 1000
+DEFAULT_MAX_CHECKPOINTS_PER_THREAD = 20
+DEFAULT_THREAD_TTL_SECONDS = 3600.0
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """In-memory checkpointer that caps how much conversation state it keeps.
+
+    - At most ``max_threads`` threads are kept; the least recently used one is
+      evicted first.
+    - Threads idle for longer than ``ttl_seconds`` are dropped.
+    - Each thread keeps only its newest ``max_checkpoints_per_thread``
+      checkpoints, along with their pending writes and the channel values they
+      reference.
+
+    A per-thread blob index keeps eviction proportional to the size of the
+    evicted thread, instead of scanning every stored write and blob.
+    """
+
+    def __init__(
+        self,
+        max_threads: int = DEFAULT_MAX_THREADS,
+        max_checkpoints_per_thread: int = DEFAULT_MAX_CHECKPOINTS_PER_THREAD,
+        ttl_seconds: Optional[float] = DEFAULT_THREAD_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        **kwargs: Any,
+    ):
+        if max_threads < 1 or max_checkpoints_per_thread < 1:
+            raise ValueError("max_threads and max_checkpoints_per_thread must be at least 1")
+        super().__init__(**kwargs)
+        self.max_threads = max_threads
+        self.max_checkpoints_per_thread = max_checkpoints_per_thread
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # thread_id -> last access time, least recently used first
+        self._last_access: "OrderedDict[str, float]" = OrderedDict()
+        self._thread_blobs: dict[str, set[tuple]] = {}
+        # (thread_id, checkpoint_ns, checkpoint_id) -> channel versions that checkpoint reads
+        self._channel_versions: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self.evicted_threads = 0
+        self.trimmed_checkpoints = 0
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        self._evict_expired()
+        if thread_id not in self._last_access:
+            # InMemorySaver's storage is a defaultdict; do not let lookups create threads
+            return None
+        self._touch(thread_id)
+        return super().get_tuple(config)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        saved = super().put(config, checkpoint, metadata, new_versions)
+        self._thread_blobs.setdefault(thread_id, set()).update(
+            (thread_id, checkpoint_ns, channel, version)
+            for channel, version in new_versions.items()
+        )
+        self._channel_versions[(thread_id, checkpoint_ns, checkpoint["id"])] = dict(
+            checkpoint["channel_versions"]
+        )
+        self._touch(thread_id)
+        self._trim_history(thread_id, checkpoint_ns)
+        self._evict_expired()
+        while len(self._last_access) > self.max_threads:
+            self.delete_thread(next(iter(self._last_access)))
+            self.evicted_threads += 1
+        return saved
+
+    def delete_thread(self, thread_id: str) -> None:
+        # Writes and channel versions are keyed by checkpoint, so the thread's checkpoints locate them
+        for checkpoint_ns, checkpoints in self.storage.pop(thread_id, {}).items():
+            for checkpoint_id in checkpoints:
+                self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+                self._channel_versions.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+        for key in self._thread_blobs.pop(thread_id, ()):
+            self.blobs.pop(key, None)
+        self._last_access.pop(thread_id, None)
+
+    def stats(self) -> dict[str, int]:
+        """Returns how much state is held and how much has been evicted."""
+        return {
+            "threads": len(self._last_access),
+            "checkpoints": sum(
+                len(checkpoints)
+                for namespaces in self.storage.values()
+                for checkpoints in namespaces.values()
+            ),
+            "writes": len(self.writes),
+            "blobs": len(self.blobs),
+            "evicted_threads": self.evicted_threads,
+            "trimmed_checkpoints": self.trimmed_checkpoints,
+        }
+
+    def _touch(self, thread_id: str) -> None:
+        self._last_access[thread_id] = self._clock()
+        self._last_access.move_to_end(thread_id)
+
+    def _evict_expired(self) -> None:
+        if self.ttl_seconds is None:
+            return
+        deadline = self._clock() - self.ttl_seconds
+        while self._last_access:
+            thread_id, last_access = next(iter(self._last_access.items()))
+            if last_access > deadline:
+                break
+            self.delete_thread(thread_id)
+            self.evicted_threads += 1
+
+    def _trim_history(self, thread_id: str, checkpoint_ns: str) -> None:
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        excess = len(checkpoints) - self.max_checkpoints_per_thread
+        if excess <= 0:
+            return
+        # Checkpoint ids sort by creation time
+        for checkpoint_id in sorted(checkpoints)[:excess]:
+            del checkpoints[checkpoint_id]
+            key = (thread_id, checkpoint_ns, checkpoint_id)
+            self.writes.pop(key, None)
+            self._channel_versions.pop(key, None)
+        self.trimmed_checkpoints += excess
+
+        # Drop channel values that no remaining checkpoint of this namespace reads
+        referenced = {
+            (thread_id, checkpoint_ns, channel, version)
+            for checkpoint_id in checkpoints
+            for channel, version in self._channel_versions.get(
+                (thread_id, checkpoint_ns, checkpoint_id), {}
+            ).items()
+        }
+        blobs = self._thread_blobs.get(thread_id, set())
+        for key in [key for key in blobs if key[1] == checkpoint_ns and key not in referenced]:
+            blobs.discard(key)
+            self.blobs.pop(key, None)
+
+
+def create_checkpointer() -> BaseCheckpointSaver:
+    """Builds the checkpointer selected by ``KAITLYNN_CHECKPOINTER`` (``memory`` or ``sqlite``).
+
+    The SQLite saver keeps state on disk across restarts and needs the optional
+    ``langgraph-checkpoint-sqlite`` package. It binds to the running event loop,
+    so call this from inside the server's loop.
+    """
+    backend = os.getenv("KAITLYNN_CHECKPOINTER", "memory").lower()
+    if backend == "sqlite":
+        try:
+            import aiosqlite
+            from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+        except ImportError as e:
+            raise RuntimeError(
+                "KAITLYNN_CHECKPOINTER=sqlite needs the 'langgraph-checkpoint-sqlite' package"
+            ) from e
+        path = os.getenv("KAITLYNN_CHECKPOINT_DB", "kaitlynn_checkpoints.sqlite")
+        return AsyncSqliteSaver(aiosqlite.connect(path))
+    if backend != "memory":
+        raise ValueError(f"Unknown KAITLYNN_CHECKPOINTER: {backend}")
+
+    ttl_seconds = float(os.getenv("KAITLYNN_THREAD_TTL_SECONDS", DEFAULT_THREAD_TTL_SECONDS))
+    return BoundedMemorySaver(
+        max_threads=int(os.getenv("KAITLYNN_MAX_THREADS", DEFAULT_MAX_THREADS)),
+        max_checkpoints_per_thread=int(
+            os.getenv("KAITLYNN_MAX_CHECKPOINTS_PER_THREAD", DEFAULT_MAX_CHECKPOINTS_PER_THREAD)
+        ),
+        ttl_seconds=ttl_seconds if ttl_seconds > 0 else None,
+    )
@@ -0,0 +1,74 @@
+"""Builds Kaitlynn's A2A server application.
+
+Kept apart from ``__main__`` so that each uvicorn worker process can import it.
+"""
+
+import os
+
+import httpx
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryPushNotifier
+from a2a.types import (
+    AgentCapabilities,
+    AgentCard,
+    AgentSkill,
+)
+from app.agent import KaitlynAgent
+from app.agent_executor import KaitlynAgentExecutor
+from dotenv import load_dotenv
+from scheduling_common.task_store import create_task_store
+
+load_dotenv()
+
+# Bind address and number of worker processes
+HOST = os.getenv("KAITLYNN_HOST", "localhost")
+PORT = int(os.getenv("KAITLYNN_PORT", "10004"))
+WORKERS = int(os.getenv("KAITLYNN_WORKERS", "1"))
+
+
+def create_app():
+    """Builds Kaitlynn's A2A app; every uvicorn worker process calls this once."""
+    capabilities = AgentCapabilities(streaming=True, pushNotifications=True)
+    skill = AgentSkill(
+        id="student_assistant",
+        name="Student Assistant - Kaitlynn",
+        description="Chat with Kaitlynn about her skills, interests, and leadership experience.",
+        tags=["student", "skills", "leadership", "project-management"],
+        examples=[
+            "What skills do you have?",
+            "Tell me about your technical abilities",
+            "What are you interested in?",
+            "What's your communication style?",
+            "How do you prefer to learn?",
+        ],
+    )
+    profile_skill = AgentSkill(
+        id="profile",
+        name="Structured Profile - Kaitlynn",
+        description="Returns Kaitlynn's skills, interests and communication style as JSON data, without a model call. Send a data part of {\"skill\": \"profile\"}.",
+        tags=["student", "profile", "structured"],
+        inputModes=["application/json"],
+        outputModes=["application/json"],
+    )
+    agent_card = AgentCard(
+        name="Kaitlynn Agent",
+        description="A confident and organized student agent representing Kaitlynn. Ask about her skills, interests, and leadership experience.",
+        url=os.getenv("KAITLYNN_PUBLIC_URL") or f"http://{HOST}:{PORT}/",
+        version="1.0.0",
+        defaultInputModes=KaitlynAgent.SUPPORTED_CONTENT_TYPES,
+        defaultOutputModes=KaitlynAgent.SUPPORTED_CONTENT_TYPES,
+        capabilities=capabilities,
+        skills=[skill, profile_skill],
+    )
+
+    httpx_client = httpx.AsyncClient()
+    request_handler = DefaultRequestHandler(
+        agent_executor=KaitlynAgentExecutor(),
+        task_store=create_task_store("KAITLYNN"),
+        push_notifier=InMemoryPushNotifier(httpx_client),
+    )
+    server = A2AStarletteApplication(
+        agent_card=agent_card, http_handler=request_handler
+    )
+    return server.build()
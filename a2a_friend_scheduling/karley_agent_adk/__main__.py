@@ -2,21 +2,8 @@ import logging
 import os
 
 import uvicorn
-from a2a.server.apps import A2AStarletteApplication
-from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
-from a2a.types import (
-    AgentCapabilities,
-    AgentCard,
-    AgentSkill,
-)
-from agent import create_agent
-from agent_executor import KarleyAgentExecutor
 from dotenv import load_dotenv
-from google.adk.artifacts import InMemoryArtifactService
-from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
+from server import HOST, PORT, WORKERS
 
 load_dotenv()
 
@@ -32,8 +19,6 @@ class MissingAPIKeyError(Exception):
 
 def main():
     """Starts the agent server."""
-    host = "localhost"
-    port = 10002
     try:
         # Check for API key only if Vertex AI is not configured
         if not os.getenv("GOOGLE_GENAI_USE_VERTEXAI") == "TRUE":
@@ -42,51 +27,12 @@ def main():
                     "GOOGLE_API_KEY environment variable not set and GOOGLE_GENAI_USE_VERTEXAI is not TRUE."
                 )
 
-        capabilities = AgentCapabilities(streaming=True)
-        skill = AgentSkill(
-    id="student_assistant",
-    name="Student Assistant - Karley",
-    description="Chat with Karley about her skills, interests, and availability.",
-    tags=["student", "skills", "introvert", "learning"],
-    examples=[
-        "What skills do you have?",
-        "Tell me about your technical abilities",
-        "What are you interested in?",
-        "What's your communication style?"
-        "How do you prefer to learn?"
-        
-    ],
-)
-        agent_card = AgentCard(
-            name="Karley Agent",
-            description="A friendly student agent representing Karley. Ask about her skills, interests",
-            url=f"http://{host}:{port}/",
-            version="1.0.0",
-            defaultInputModes=["text/plain"],
-            defaultOutputModes=["text/plain"],
-            capabilities=capabilities,
-            skills=[skill],
-        )
-
-        adk_agent = create_agent()
-        runner = Runner(
-            app_name=agent_card.name,
-            agent=adk_agent,
-            artifact_service=InMemoryArtifactService(),
-            session_service=InMemorySessionService(),
-            memory_service=InMemoryMemoryService(),
-        )
-        agent_executor = KarleyAgentExecutor(runner)
-
-        request_handler = DefaultRequestHandler(
-            agent_executor=agent_executor,
-            task_store=InMemoryTaskStore(),
-        )
-        server = A2AStarletteApplication(
-            agent_card=agent_card, http_handler=request_handler
-        )
-
-        uvicorn.run(server.build(), host=host, port=port)
+        if WORKERS > 1:
+            # Workers are separate processes; keep tasks and sessions in SQLite so any of them can continue a task
+            os.environ.setdefault("KARLEY_TASK_DB", "karley_tasks.sqlite")
+            os.environ.setdefault("KARLEY_SESSION_DB", "karley_sessions.sqlite")
+        # Workers are spawned processes that import the app, so pass it by name
+        uvicorn.run("server:create_app", factory=True, host=HOST, port=PORT, workers=WORKERS)
     except MissingAPIKeyError as e:
         logger.error(f"Error: {e}")
         exit(1)
@@ -1,41 +1,57 @@
 import asyncio
+import base64
 import logging
+import uuid
 from collections.abc import AsyncGenerator
+from typing import Optional
 
 from a2a.server.agent_execution import AgentExecutor
 from a2a.server.agent_execution.context import RequestContext
 from a2a.server.events.event_queue import EventQueue
 from a2a.server.tasks import TaskUpdater
 from a2a.types import (
+    DataPart,
     FilePart,
     FileWithBytes,
     FileWithUri,
     Part,
+    TaskNotCancelableError,
     TaskState,
     TextPart,
-    UnsupportedOperationError,
 )
 from a2a.utils.errors import ServerError
+from agent import KARLEY_SKILLS
+from blob_store import BlobStore
 from google.adk import Runner
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.events import Event
 from google.genai import types
+from scheduling_common.artifacts import add_artifact_chunk
+from scheduling_common.skills import is_profile_request
+from scheduling_common.task_store import TERMINAL_STATES
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
-
 class KarleyAgentExecutor(AgentExecutor):
     """An AgentExecutor that runs Karley's ADK-based Agent."""
 
-    def __init__(self, runner: Runner):
+    def __init__(self, runner: Runner, blob_store: Optional[BlobStore] = None):
         self.runner = runner
-        self._running_sessions = {}
+        # Where large file parts are spilled instead of being sent inline
+        self.blob_store = blob_store
+        # task_id -> asyncio task running the agent for it
+        self._running_tasks: dict[str, asyncio.Task] = {}
 
     def _run_agent(
         self, session_id, new_message: types.Content
     ) -> AsyncGenerator[Event, None]:
         return self.runner.run_async(
-            session_id=session_id, user_id="karley_agent", new_message=new_message
+            session_id=session_id,
+            user_id="karley_agent",
+            new_message=new_message,
+            # Partial events carry the answer as the model produces it
+            run_config=RunConfig(streaming_mode=StreamingMode.SSE),
         )
 
     async def _process_request(
@@ -47,26 +63,36 @@ class KarleyAgentExecutor(AgentExecutor):
         session_obj = await self._upsert_session(session_id)
         session_id = session_obj.id
 
+        # Streamed chunks all extend one artifact, which the final response replaces
+        artifact_id = str(uuid.uuid4())
+        streamed = False
         async for event in self._run_agent(session_id, new_message):
+            parts = convert_genai_parts_to_a2a(
+                event.content.parts if event.content and event.content.parts else [],
+                self.blob_store,
+            )
+            if event.partial:
+                if parts:
+                    logger.debug("Yielding response chunk")
+                    await add_artifact_chunk(
+                        task_updater, parts, artifact_id, "response", append=streamed, last_chunk=False
+                    )
+                    streamed = True
+                continue
             if event.is_final_response():
-                parts = convert_genai_parts_to_a2a(
-                    event.content.parts if event.content and event.content.parts else []
-                )
                 logger.debug("Yielding final response: %s", parts)
-                task_updater.add_artifact(parts)
-                task_updater.complete()
+                # The final event repeats the whole answer; it replaces the streamed
+                # chunks so message/send clients get it as one part, not many
+                await add_artifact_chunk(
+                    task_updater, parts, artifact_id, "response", append=False, last_chunk=True
+                )
+                await task_updater.complete()
                 break
             if not event.get_function_calls():
                 logger.debug("Yielding update response")
-                task_updater.update_status(
+                await task_updater.update_status(
                     TaskState.working,
-                    message=task_updater.new_agent_message(
-                        convert_genai_parts_to_a2a(
-                            event.content.parts
-                            if event.content and event.content.parts
-                            else []
-                        ),
-                    ),
+                    message=task_updater.new_agent_message(parts),
                 )
             else:
                 logger.debug("Skipping event")
@@ -83,18 +109,40 @@ class KarleyAgentExecutor(AgentExecutor):
 
         updater = TaskUpdater(event_queue, context.task_id, context.context_id)
         if not context.current_task:
-            updater.submit()
-        updater.start_work()
-        await self._process_request(
-            types.UserContent(
-                parts=convert_a2a_parts_to_genai(context.message.parts),
-            ),
-            context.context_id,
-            updater,
-        )
+            await updater.submit()
+        await updater.start_work()
+        if is_profile_request(context.message):
+            await updater.add_artifact([Part(root=DataPart(data=KARLEY_SKILLS))], name="profile")
+            await updater.complete()
+            return
+        self._running_tasks[context.task_id] = asyncio.current_task()
+        try:
+            await self._process_request(
+                types.UserContent(
+                    parts=convert_a2a_parts_to_genai(context.message.parts, self.blob_store),
+                ),
+                context.context_id,
+                updater,
+            )
+        except asyncio.CancelledError:
+            # Cancelling the run also cancels the agent's in-flight model call
+            await updater.update_status(TaskState.canceled, final=True)
+            raise
+        finally:
+            self._running_tasks.pop(context.task_id, None)
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue):
-        raise ServerError(error=UnsupportedOperationError())
+        """Cancels a task, stopping its agent run if one is in flight."""
+        task = context.current_task
+        if task is None or task.status.state in TERMINAL_STATES:
+            raise ServerError(error=TaskNotCancelableError())
+        running = self._running_tasks.pop(context.task_id, None)
+        if running is not None:
+            # The interrupted execute() publishes canceled
+            running.cancel()
+            return
+        updater = TaskUpdater(event_queue, context.task_id, context.context_id)
+        await updater.update_status(TaskState.canceled, final=True)
 
     async def _upsert_session(self, session_id: str):
         session = await self.runner.session_service.get_session(
@@ -111,45 +159,75 @@ class KarleyAgentExecutor(AgentExecutor):
         return session
 
 
-def convert_a2a_parts_to_genai(parts: list[Part]) -> list[types.Part]:
+def convert_a2a_parts_to_genai(
+    parts: list[Part], blob_store: Optional[BlobStore] = None
+) -> list[types.Part]:
     """Convert a list of A2A Part types into a list of Google Gen AI Part types."""
-    return [convert_a2a_part_to_genai(part) for part in parts]
+    return [convert_a2a_part_to_genai(part, blob_store) for part in parts]
+
 
+def convert_a2a_part_to_genai(
+    part: Part, blob_store: Optional[BlobStore] = None
+) -> types.Part:
+    """Convert a single A2A Part type into a Google Gen AI Part type.
 
-def convert_a2a_part_to_genai(part: Part) -> types.Part:
-    """Convert a single A2A Part type into a Google Gen AI Part type."""
+    ``FileWithBytes`` content is base64, as the A2A spec requires. URIs of files
+    spilled to ``blob_store`` are read back, since the model cannot fetch local files.
+    """
     root = part.root
     if isinstance(root, TextPart):
         return types.Part(text=root.text)
     if isinstance(root, FilePart):
         if isinstance(root.file, FileWithUri):
+            data = blob_store.read(root.file.uri) if blob_store else None
+            if data is not None:
+                return types.Part(
+                    inline_data=types.Blob(
+                        data=data,
+                        mime_type=root.file.mimeType or "application/octet-stream",
+                        display_name=root.file.name,
+                    )
+                )
             return types.Part(
                 file_data=types.FileData(
                     file_uri=root.file.uri, mime_type=root.file.mimeType
                 )
             )
         if isinstance(root.file, FileWithBytes):
+            try:
+                data = base64.b64decode(root.file.bytes, validate=True)
+            except ValueError as e:
+                raise ValueError("File bytes are not valid base64") from e
             return types.Part(
                 inline_data=types.Blob(
-                    data=root.file.bytes.encode("utf-8"),
+                    data=data,
                     mime_type=root.file.mimeType or "application/octet-stream",
+                    display_name=root.file.name,
                 )
             )
         raise ValueError(f"Unsupported file type: {type(root.file)}")
     raise ValueError(f"Unsupported part type: {type(part)}")
 
 
-def convert_genai_parts_to_a2a(parts: list[types.Part]) -> list[Part]:
+def convert_genai_parts_to_a2a(
+    parts: list[types.Part], blob_store: Optional[BlobStore] = None
+) -> list[Part]:
     """Convert a list of Google Gen AI Part types into a list of A2A Part types."""
     return [
-        convert_genai_part_to_a2a(part)
+        convert_genai_part_to_a2a(part, blob_store)
         for part in parts
         if (part.text or part.file_data or part.inline_data)
     ]
 
 
-def convert_genai_part_to_a2a(part: types.Part) -> Part:
-    """Convert a single Google Gen AI Part type into an A2A Part type."""
+def convert_genai_part_to_a2a(
+    part: types.Part, blob_store: Optional[BlobStore] = None
+) -> Part:
+    """Convert a single Google Gen AI Part type into an A2A Part type.
+
+    Inline data is sent as base64 ``FileWithBytes``, unless it is large enough for
+    ``blob_store`` to spill it, in which case it is sent as a ``FileWithUri``.
+    """
     if part.text:
         return Part(root=TextPart(text=part.text))
     if part.file_data:
@@ -160,17 +238,31 @@ def convert_genai_part_to_a2a(part: types.Part) -> Part:
                 file=FileWithUri(
                     uri=part.file_data.file_uri,
                     mimeType=part.file_data.mime_type,
+                    name=part.file_data.display_name,
                 )
             )
         )
     if part.inline_data:
         if not part.inline_data.data:
             raise ValueError("Inline data is missing")
+        # A view lets hashing, writing and encoding read the buffer without copying it
+        data = memoryview(part.inline_data.data)
+        if blob_store is not None and blob_store.should_spill(data):
+            return Part(
+                root=FilePart(
+                    file=FileWithUri(
+                        uri=blob_store.put(data),
+                        mimeType=part.inline_data.mime_type,
+                        name=part.inline_data.display_name,
+                    )
+                )
+            )
         return Part(
             root=FilePart(
                 file=FileWithBytes(
-                    bytes=part.inline_data.data.decode("utf-8"),
+                    bytes=base64.b64encode(data).decode("ascii"),
                     mimeType=part.inline_data.mime_type,
+                    name=part.inline_data.display_name,
                 )
             )
         )
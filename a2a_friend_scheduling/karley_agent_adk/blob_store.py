@@ -0,0 +1,77 @@
+"""
+Content-Addressed Blob Store for Large File Parts
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+from urllib.parse import unquote, urlparse
+
+DEFAULT_BLOB_DIR = "karley_blobs"
+# Inline files larger than this are written to the store and sent as a file:// URI
+DEFAULT_SPILL_BYTES = 1024 * 1024
+
+
+class BlobStore:
+    """Keeps file contents on local disk under their SHA-256 digest.
+
+    Identical files are stored once, and a file is never rewritten once it
+    exists, so several server processes can share one directory. Blobs are
+    referenced by ``file://`` URIs, which are only meaningful to clients on the
+    same machine.
+    """
+
+    def __init__(self, root: str, spill_bytes: Optional[int] = DEFAULT_SPILL_BYTES):
+        self.root = Path(root).resolve()
+        self.spill_bytes = spill_bytes
+
+    def should_spill(self, data: Union[bytes, memoryview]) -> bool:
+        """True when ``data`` is too large to send inline."""
+        return self.spill_bytes is not None and len(data) > self.spill_bytes
+
+    def put(self, data: Union[bytes, memoryview]) -> str:
+        """Stores ``data`` (without copying it) and returns its ``file://`` URI."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.root / digest[:2] / digest
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write under a temporary name so readers never see a partial blob
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        return path.as_uri()
+
+    def path_for(self, uri: str) -> Optional[Path]:
+        """Returns the local path of a blob URI from this store, or None for any other URI."""
+        parsed = urlparse(uri)
+        if parsed.scheme != "file":
+            return None
+        path = Path(unquote(parsed.path)).resolve()
+        if path.parent.parent != self.root or not path.is_file():
+            return None
+        return path
+
+    def read(self, uri: str) -> Optional[bytes]:
+        """Returns the contents of a blob URI from this store, or None for any other URI."""
+        path = self.path_for(uri)
+        return path.read_bytes() if path is not None else None
+
+
+def create_blob_store(prefix: str) -> BlobStore:
+    """Builds the blob store configured by ``<prefix>_BLOB_*`` variables.
+
+    Blobs go to ``<prefix>_BLOB_DIR``; inline files over
+    ``<prefix>_BLOB_SPILL_BYTES`` are spilled there (``0`` keeps every file inline).
+    """
+    spill_bytes = int(os.getenv(f"{prefix}_BLOB_SPILL_BYTES", DEFAULT_SPILL_BYTES))
+    return BlobStore(
+        os.getenv(f"{prefix}_BLOB_DIR", DEFAULT_BLOB_DIR),
+        spill_bytes=spill_bytes if spill_bytes > 0 else None,
+    )
@@ -0,0 +1,87 @@
+"""Builds Karley's A2A server application.
+
+Kept apart from ``__main__`` so that each uvicorn worker process can import it.
+"""
+
+import os
+
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.types import (
+    AgentCapabilities,
+    AgentCard,
+    AgentSkill,
+)
+from agent import create_agent
+from agent_executor import KarleyAgentExecutor
+from blob_store import create_blob_store
+from dotenv import load_dotenv
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+from google.adk.runners import Runner
+from scheduling_common.session_store import create_session_service
+from scheduling_common.task_store import create_task_store
+
+load_dotenv()
+
+# Bind address and number of worker processes
+HOST = os.getenv("KARLEY_HOST", "localhost")
+PORT = int(os.getenv("KARLEY_PORT", "10002"))
+WORKERS = int(os.getenv("KARLEY_WORKERS", "1"))
+
+
+def create_app():
+    """Builds Karley's A2A app; every uvicorn worker process calls this once."""
+    capabilities = AgentCapabilities(streaming=True)
+    skill = AgentSkill(
+        id="student_assistant",
+        name="Student Assistant - Karley",
+        description="Chat with Karley about her skills, interests, and availability.",
+        tags=["student", "skills", "introvert", "learning"],
+        examples=[
+            "What skills do you have?",
+            "Tell me about your technical abilities",
+            "What are you interested in?",
+            "What's your communication style?",
+            "How do you prefer to learn?",
+        ],
+    )
+    profile_skill = AgentSkill(
+        id="profile",
+        name="Structured Profile - Karley",
+        description="Returns Karley's skills, interests and communication style as JSON data, without a model call. Send a data part of {\"skill\": \"profile\"}.",
+        tags=["student", "profile", "structured"],
+        inputModes=["application/json"],
+        outputModes=["application/json"],
+    )
+    agent_card = AgentCard(
+        name="Karley Agent",
+        description="A friendly student agent representing Karley. Ask about her skills, interests",
+        url=os.getenv("KARLEY_PUBLIC_URL") or f"http://{HOST}:{PORT}/",
+        version="1.0.0",
+        defaultInputModes=["text/plain"],
+        defaultOutputModes=["text/plain"],
+        capabilities=capabilities,
+        skills=[skill, profile_skill],
+    )
+
+    adk_agent = create_agent()
+    artifact_service = InMemoryArtifactService()
+    runner = Runner(
+        app_name=agent_card.name,
+        agent=adk_agent,
+        artifact_service=artifact_service,
+        # One session per A2A context; bounded in memory unless KARLEY_SESSION_DB is set
+        session_service=create_session_service("KARLEY", artifact_service=artifact_service),
+        memory_service=InMemoryMemoryService(),
+    )
+    agent_executor = KarleyAgentExecutor(runner, blob_store=create_blob_store("KARLEY"))
+
+    request_handler = DefaultRequestHandler(
+        agent_executor=agent_executor,
+        task_store=create_task_store("KARLEY"),
+    )
+    server = A2AStarletteApplication(
+        agent_card=agent_card, http_handler=request_handler
+    )
+    return server.build()
@@ -8,17 +8,8 @@ import logging
 import os
 
 import uvicorn
-from a2a.server.apps import A2AStarletteApplication
-from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
-from a2a.types import (
-    AgentCapabilities,
-    AgentCard,
-    AgentSkill,
-)
-from agent import SchedulingAgent
-from agent_executor import SchedulingAgentExecutor
 from dotenv import load_dotenv
+from server import HOST, PORT, WORKERS
 
 load_dotenv()
 
@@ -32,48 +23,15 @@ class MissingAPIKeyError(Exception):
 
 def main():
     """Entry point for Nate's Scheduling Agent."""
-    host = "localhost"
-    port = 10003
     try:
         if not os.getenv("GOOGLE_API_KEY"):
             raise MissingAPIKeyError("GOOGLE_API_KEY environment variable not set.")
 
-        capabilities = AgentCapabilities(streaming=False)
-        skill = AgentSkill(
-    id="student_assistant",
-    name="Student Assistant - Nate",
-    description="Chat with Nate about his skills, interests, and availability.",
-    tags=["student", "skills", "schedule", "availability"],
-    examples=[
-        "What skills do you have?",
-        "Tell me about your technical abilities",
-        "What are you interested in?",
-        "Are you free tomorrow?",
-    ],
-)
-
-
-        agent_host_url = os.getenv("HOST_OVERRIDE") or f"http://{host}:{port}/"
-        agent_card = AgentCard(
-            name="Nate Agent",
-            description="A friendly student agent representing Nate. Ask about his skills, interests, or schedule!",
-            url=agent_host_url,
-            version="1.0.0",
-            defaultInputModes=SchedulingAgent.SUPPORTED_CONTENT_TYPES,
-            defaultOutputModes=SchedulingAgent.SUPPORTED_CONTENT_TYPES,
-            capabilities=capabilities,
-            skills=[skill],
-        )
-
-        request_handler = DefaultRequestHandler(
-            agent_executor=SchedulingAgentExecutor(),
-            task_store=InMemoryTaskStore(),
-        )
-        server = A2AStarletteApplication(
-            agent_card=agent_card, http_handler=request_handler
-        )
-
-        uvicorn.run(server.build(), host=host, port=port)
+        if WORKERS > 1:
+            # Workers are separate processes; keep tasks in SQLite so any of them can continue one
+            os.environ.setdefault("NATE_TASK_DB", "nate_tasks.sqlite")
+        # Workers are spawned processes that import the app, so pass it by name
+        uvicorn.run("server:create_app", factory=True, host=HOST, port=PORT, workers=WORKERS)
 
     except MissingAPIKeyError as e:
         logger.error(f"Error: {e}")
@@ -1,9 +1,17 @@
 import os
 import random
-from datetime import date, datetime, timedelta
-from typing import Type
-
-from crewai import LLM, Agent, Crew, Process, Task
+import re
+import threading
+from datetime import date, timedelta
+from typing import Any, Optional, Type
+
+from calendar_index import (
+    DEFAULT_HORIZON_DAYS,
+    AvailabilityCalendar,
+    generate_calendar,
+    slot_names,
+)
+from crewai import LLM, Agent, BaseLLM, Crew, Process, Task
 from crewai.tools import BaseTool
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
@@ -11,24 +19,23 @@ from pydantic import BaseModel, Field
 load_dotenv()
 
 
-def generate_calendar() -> dict[str, list[str]]:
-    """Generates a random calendar for the next 7 days."""
-    calendar = {}
-    today = date.today()
-    possible_times = [f"{h:02}:00" for h in range(8, 21)]  # 8 AM to 8 PM
+# Days ahead covered by Nate's calendar
+CALENDAR_DAYS = int(os.getenv("NATE_CALENDAR_DAYS", DEFAULT_HORIZON_DAYS))
+# Seeds the generated calendar so every server worker builds the same one
+CALENDAR_SEED = os.getenv("NATE_CALENDAR_SEED", "nate")
+
 
-    for i in range(7):
-        current_date = today + timedelta(days=i)
-        date_str = current_date.strftime("%Y-%m-%d")
-        available_slots = sorted(random.sample(possible_times, 8))
-        calendar[date_str] = available_slots
+def print_calendar(calendar: AvailabilityCalendar, days: int = 7) -> None:
+    """Prints the first ``days`` days of ``calendar``."""
     print("---- Nate's Generated Calendar ----")
-    print(calendar)
+    for day, mask in calendar.range(calendar.start, calendar.start + timedelta(days=days - 1)):
+        print(f"{day.isoformat()}: {', '.join(slot_names(mask))}")
+    print(f"... {len(calendar)} days in all, through {calendar.end.isoformat()}")
     print("---------------------------------")
-    return calendar
 
 
-MY_CALENDAR = generate_calendar()
+MY_CALENDAR = generate_calendar(CALENDAR_DAYS, rng=random.Random(CALENDAR_SEED))
+print_calendar(MY_CALENDAR)
 
 
 # Add this before the SchedulingAgent class
@@ -55,52 +62,61 @@ class AvailabilityToolInput(BaseModel):
 
     date_range: str = Field(
         ...,
-        description="The date or date range to check for availability, e.g., '2024-07-28' or '2024-07-28 to 2024-07-30'.",
+        description=(
+            "The date or date range to check for availability, e.g., '2024-07-28' or '2024-07-28 to 2024-07-30'. "
+            "Several can be checked at once, separated by commas, e.g., '2024-07-28, 2024-08-01 to 2024-08-03'."
+        ),
     )
 
 
+# Separates the ranges of a bulk availability query
+RANGE_SEPARATOR = re.compile(r"[,;\n]")
+
+
+def parse_date_ranges(date_range: str) -> list[tuple[date, date]]:
+    """Parses ``'YYYY-MM-DD'`` or ``'YYYY-MM-DD to YYYY-MM-DD'`` items, comma-separated."""
+    ranges = []
+    for item in RANGE_SEPARATOR.split(date_range):
+        if not item.strip():
+            continue
+        dates_to_check = [d.strip() for d in item.split("to")]
+        start = date.fromisoformat(dates_to_check[0])
+        end = date.fromisoformat(dates_to_check[-1])
+        ranges.append((start, end))
+    if not ranges:
+        raise ValueError("No dates given")
+    return ranges
+
+
 class AvailabilityTool(BaseTool):
     name: str = "Calendar Availability Checker"
     description: str = (
-        "Checks my availability for a given date or date range. "
+        "Checks my availability for a given date or date range, or several of them at once. "
         "Use this to find out when I am free."
     )
     args_schema: Type[BaseModel] = AvailabilityToolInput
 
     def _run(self, date_range: str) -> str:
-        """Checks my availability for a given date range."""
-        dates_to_check = [d.strip() for d in date_range.split("to")]
-        start_date_str = dates_to_check[0]
-        end_date_str = dates_to_check[-1]
-
+        """Checks my availability for the given date ranges."""
         try:
-            start = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-            end = datetime.strptime(end_date_str, "%Y-%m-%d").date()
-
-            if start > end:
-                return (
-                    "Invalid date range. The start date cannot be after the end date."
-                )
-
-            results = []
-            delta = end - start
-            for i in range(delta.days + 1):
-                day = start + timedelta(days=i)
-                date_str = day.strftime("%Y-%m-%d")
-                available_slots = MY_CALENDAR.get(date_str, [])
-                if available_slots:
-                    availability = f"On {date_str}, I am available at: {', '.join(available_slots)}."
-                    results.append(availability)
-                else:
-                    results.append(f"I am not available on {date_str}.")
-
-            return "\n".join(results)
-
+            ranges = parse_date_ranges(date_range)
         except ValueError:
             return (
                 "I couldn't understand the date. "
                 "Please ask to check availability for a date like 'YYYY-MM-DD'."
             )
+        if any(start > end for start, end in ranges):
+            return "Invalid date range. The start date cannot be after the end date."
+
+        results = []
+        for days in MY_CALENDAR.query(ranges):
+            for day, mask in days:
+                if mask:
+                    results.append(f"On {day.isoformat()}, I am available at: {', '.join(slot_names(mask))}.")
+                else:
+                    results.append(f"I am not available on {day.isoformat()}.")
+        return "\n".join(results)
+
 
 class SkillsToolInput(BaseModel):
     """Input schema for SkillsTool."""
@@ -134,14 +150,35 @@ class SkillsTool(BaseTool):
             return "I can tell you about my skills, interests, communication style, or all of them!"
 
 
+# Per-step crew logging is costly on every request, so it is opt-in
+CREW_VERBOSE = os.getenv("NATE_CREW_VERBOSE", "false").lower() in ("1", "true", "yes")
+
+
+class CrewCancelledError(TimeoutError):
+    """Raised inside a running crew once its request has been cancelled.
+
+    A ``TimeoutError``, because CrewAI retries a failed agent step for any other error.
+    """
+
+
 class SchedulingAgent:
     """Agent that handles scheduling tasks."""
 
     SUPPORTED_CONTENT_TYPES = ["text/plain"]
 
-    def __init__(self):
-        """Initializes the SchedulingAgent."""
-        if os.getenv("GOOGLE_API_KEY"):
+    # Filled in per request by Crew.kickoff(inputs=...)
+    TASK_DESCRIPTION = (
+        "Answer the user's question about Nate. The user asked: '{question}'. "
+        "You can discuss Nate's skills, interests, availability, or anything else about him. "
+        "Today's date is {today}. "
+        "Be friendly and enthusiastic in your response, just like Nate would be."
+    )
+
+    def __init__(self, llm: Optional[BaseLLM] = None, verbose: bool = CREW_VERBOSE):
+        """Initializes the SchedulingAgent and builds the crew template once."""
+        if llm is not None:
+            self.llm = llm
+        elif os.getenv("GOOGLE_API_KEY"):
             self.llm = LLM(
                 model="gemini/gemini-2.0-flash",
                 api_key=os.getenv("GOOGLE_API_KEY"),
@@ -149,43 +186,65 @@ class SchedulingAgent:
         else:
             raise ValueError("GOOGLE_API_KEY environment variable not set.")
 
-        self.student_agent = Agent(
-    role="Student Representative - Nate",
-    goal="Share information about Nate's skills, interests, and availability as a student.",
-    backstory=(
-        "You are Nate, a friendly and enthusiastic student. You love talking about "
-        "your technical skills, academic interests, and what you're passionate about. "
-        "You're knowledgeable about programming, scheduling, and always eager to help. "
-        "You can check your calendar when needed, but you're also great at discussing "
-        "your abilities and what you're learning."
-    ),
-
-            verbose=True,
+        self.verbose = verbose
+        self.crew_template = self._build_crew()
+        # Crew.kickoff rebinds its agents to the running crew, so each worker thread
+        # runs its own copy of the template
+        self._local = threading.local()
+
+    def _build_crew(self) -> Crew:
+        student_agent = Agent(
+            role="Student Representative - Nate",
+            goal="Share information about Nate's skills, interests, and availability as a student.",
+            backstory=(
+                "You are Nate, a friendly and enthusiastic student. You love talking about "
+                "your technical skills, academic interests, and what you're passionate about. "
+                "You're knowledgeable about programming, scheduling, and always eager to help. "
+                "You can check your calendar when needed, but you're also great at discussing "
+                "your abilities and what you're learning."
+            ),
+            verbose=self.verbose,
             allow_delegation=False,
             tools=[AvailabilityTool(), SkillsTool()],
             llm=self.llm,
         )
-
-    def invoke(self, question: str) -> str:
-        """Kicks off the crew to answer questions about Nate."""
-        task_description = (
-        f"Answer the user's question about Nate. The user asked: '{question}'. "
-        f"You can discuss Nate's skills, interests, availability, or anything else about him. "
-        f"Today's date is {date.today().strftime('%Y-%m-%d')}. "
-        f"Be friendly and enthusiastic in your response, just like Nate would be."
-    )
-
         response_task = Task(
-        description=task_description,
-        expected_output="A friendly and informative response about Nate, using the appropriate tools when needed.",
-        agent=self.student_agent,  # Note: changed from scheduling_assistant
-    )
+            description=self.TASK_DESCRIPTION,
+            expected_output="A friendly and informative response about Nate, using the appropriate tools when needed.",
+            agent=student_agent,
+        )
+        return Crew(
+            agents=[student_agent],
+            tasks=[response_task],
+            process=Process.sequential,
+            verbose=self.verbose,
+            # Runs after every agent step, which is where a cancelled request stops
+            step_callback=self._check_cancelled,
+        )
 
-        crew = Crew(
-        agents=[self.student_agent],  # Note: changed from scheduling_assistant
-        tasks=[response_task],
-        process=Process.sequential,
-        verbose=True,
-    )
-        result = crew.kickoff()
+    @property
+    def crew(self) -> Crew:
+        """The calling thread's copy of the crew template, created on first use."""
+        crew = getattr(self._local, "crew", None)
+        if crew is None:
+            crew = self._local.crew = self.crew_template.copy()
+        return crew
+
+    def _check_cancelled(self, step: Any = None) -> None:
+        cancel_event = getattr(self._local, "cancel_event", None)
+        if cancel_event is not None and cancel_event.is_set():
+            raise CrewCancelledError()
+
+    def invoke(self, question: str, cancel_event: Optional[threading.Event] = None) -> str:
+        """Kicks off the crew to answer questions about Nate.
+
+        Blocking; safe to call from several worker threads at once. Setting
+        ``cancel_event`` stops the crew after its current step with
+        ``CrewCancelledError``, so no further model calls are made.
+        """
+        self._local.cancel_event = cancel_event
+        self._check_cancelled()
+        result = self.crew.kickoff(
+            inputs={"question": question, "today": date.today().strftime("%Y-%m-%d")}
+        )
         return str(result)
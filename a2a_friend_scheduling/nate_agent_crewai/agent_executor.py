@@ -1,23 +1,62 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.server.tasks import TaskUpdater
 from a2a.types import (
+    DataPart,
     InternalError,
     InvalidParamsError,
     Part,
+    TaskState,
+    TaskNotCancelableError,
     TextPart,
-    UnsupportedOperationError,
 )
 from a2a.utils.errors import ServerError
-from agent import SchedulingAgent
+from agent import MY_CALENDAR, NATE_SKILLS, CrewCancelledError, SchedulingAgent
+from calendar_index import ALL_SLOTS, AvailabilityCalendar
+from scheduling_common.skills import is_profile_request, skill_request
+from scheduling_common.task_store import TERMINAL_STATES
+
+
+# Crews run on worker threads so a kickoff never blocks the server's event loop
+MAX_WORKERS = int(os.getenv("NATE_MAX_WORKERS", "4"))
+# Requests allowed to wait for a free worker before new ones are turned away
+MAX_QUEUE_DEPTH = int(os.getenv("NATE_MAX_QUEUE_DEPTH", "16"))
+BUSY_MESSAGE = "Nate is answering too many questions right now. Please try again in a moment."
+
+# AgentSkill id answered straight from MY_CALENDAR, without running the model
+AVAILABILITY_SKILL_ID = "availability"
+
+
+def availability_window(request: dict) -> AvailabilityCalendar:
+    """Nate's calendar between the request's optional ``start`` and ``end`` dates.
+
+    Defaults to today through the end of the calendar, and never reaches past
+    either end of it. Raises ValueError for malformed dates.
+    """
+    start = date.fromisoformat(request["start"]) if request.get("start") else date.today()
+    end = date.fromisoformat(request["end"]) if request.get("end") else MY_CALENDAR.end
+    requested = AvailabilityCalendar(start, [ALL_SLOTS] * max((end - start).days + 1, 0))
+    return MY_CALENDAR.intersect(requested)
 
 
 class SchedulingAgentExecutor(AgentExecutor):
     """AgentExecutor for the scheduling agent."""
 
-    def __init__(self):
+    def __init__(self, max_workers: int = MAX_WORKERS, max_queue_depth: int = MAX_QUEUE_DEPTH):
         """Initializes the SchedulingAgentExecutor."""
         self.agent = SchedulingAgent()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="nate-crew")
+        self._capacity = max_workers + max_queue_depth
+        # Only touched from the event loop, so no lock is needed
+        self._in_flight = 0
+        # task_id -> cancel flag of the crew answering it
+        self._running_crews: dict[str, threading.Event] = {}
 
     async def execute(
         self,
@@ -38,13 +77,56 @@ class SchedulingAgentExecutor(AgentExecutor):
         if self._validate_request(context):
             raise ServerError(error=InvalidParamsError())
 
+        if is_profile_request(context.message):
+            await updater.add_artifact(
+                [Part(root=DataPart(data=NATE_SKILLS))], name="profile"
+            )
+            await updater.complete()
+            return
+
+        availability = skill_request(context.message, AVAILABILITY_SKILL_ID)
+        if availability is not None:
+            try:
+                window = availability_window(availability)
+            except ValueError as e:
+                raise ServerError(error=InvalidParamsError(message=str(e))) from e
+            await updater.add_artifact(
+                [Part(root=DataPart(data=window.to_dict()))], name="availability"
+            )
+            await updater.complete()
+            return
+
+        if self._in_flight >= self._capacity:
+            # Backpressure: refuse right away instead of queueing without bound
+            await updater.reject(
+                message=updater.new_agent_message([Part(root=TextPart(text=BUSY_MESSAGE))])
+            )
+            return
+
         query = context.get_user_input()
+        cancel_event = self._running_crews[context.task_id] = threading.Event()
+        loop = asyncio.get_running_loop()
+        self._in_flight += 1
+        crew_run = self._pool.submit(self.agent.invoke, query, cancel_event)
+        # A cancelled crew keeps its worker until its current step ends, so it
+        # stays counted until the thread is actually free
+        crew_run.add_done_callback(lambda _: loop.call_soon_threadsafe(self._crew_finished))
         try:
-            result = self.agent.invoke(query)
+            result = await asyncio.wrap_future(crew_run)
             print(f"Final Result ===> {result}")
+        except asyncio.CancelledError:
+            # A crew already running on its thread stops after its current step
+            cancel_event.set()
+            await updater.update_status(TaskState.canceled, final=True)
+            raise
+        except CrewCancelledError:
+            await updater.update_status(TaskState.canceled, final=True)
+            return
         except Exception as e:
             print(f"Error invoking agent: {e}")
             raise ServerError(error=InternalError()) from e
+        finally:
+            self._running_crews.pop(context.task_id, None)
 
         parts = [Part(root=TextPart(text=result))]
 
@@ -52,8 +134,20 @@ class SchedulingAgentExecutor(AgentExecutor):
         await updater.complete()
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
-        """Handles task cancellation."""
-        raise ServerError(error=UnsupportedOperationError())
+        """Cancels a task, stopping its crew if one is running."""
+        task = context.current_task
+        if task is None or task.status.state in TERMINAL_STATES:
+            raise ServerError(error=TaskNotCancelableError())
+        cancel_event = self._running_crews.get(context.task_id)
+        if cancel_event is not None:
+            # The request handler interrupts execute() next, which publishes canceled
+            cancel_event.set()
+            return
+        updater = TaskUpdater(event_queue, context.task_id, context.context_id)
+        await updater.update_status(TaskState.canceled, final=True)
+
+    def _crew_finished(self) -> None:
+        self._in_flight -= 1
 
     def _validate_request(self, context: RequestContext) -> bool:
         """Validates the request context."""
@@ -0,0 +1,102 @@
+"""
+Bitmask Availability Calendar for Nate's Agent
+"""
+
+import random
+from array import array
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Iterable, Optional
+
+# Bookable slots in a day; bit i of a day's mask is set when SLOT_TIMES[i] is free
+SLOT_TIMES = tuple(f"{h:02}:00" for h in range(8, 21))  # 8 AM to 8 PM
+# Mask of a day with every slot free
+ALL_SLOTS = (1 << len(SLOT_TIMES)) - 1
+# Unsigned 16-bit masks, which fit the 13 daily slots
+MASK_TYPECODE = "H"
+
+DEFAULT_HORIZON_DAYS = 90
+DEFAULT_SLOTS_PER_DAY = 8
+
+
+@lru_cache(maxsize=None)
+def slot_names(mask: int) -> tuple[str, ...]:
+    """The slot times set in ``mask``, earliest first."""
+    return tuple(slot for i, slot in enumerate(SLOT_TIMES) if mask >> i & 1)
+
+
+class AvailabilityCalendar:
+    """Free slots for consecutive days, one bitmask per day.
+
+    Masks live in a flat array indexed by day offset from ``start``, so a range
+    of days is one slice and intersecting calendars is an AND per day. Days
+    outside the horizon have no free slots.
+    """
+
+    def __init__(self, start: date, masks: Iterable[int] = ()):
+        self.start = start
+        self.masks = array(MASK_TYPECODE, masks)
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    @property
+    def end(self) -> date:
+        """The last day covered (the day before ``start`` when empty)."""
+        return self.start + timedelta(days=len(self.masks) - 1)
+
+    def range(self, start: date, end: date) -> list[tuple[date, int]]:
+        """``(day, mask)`` for every day from ``start`` to ``end`` inclusive.
+
+        Days outside the horizon are included with a mask of 0; the masks inside
+        it are read as one slice of the array.
+        """
+        days = (end - start).days + 1
+        if days <= 0:
+            return []
+        first = (start - self.start).days
+        lo, hi = max(first, 0), min(first + days, len(self.masks))
+        masks = [0] * days
+        if lo < hi:
+            masks[lo - first : hi - first] = self.masks[lo:hi]
+        return [(start + timedelta(days=i), mask) for i, mask in enumerate(masks)]
+
+    def query(self, ranges: Iterable[tuple[date, date]]) -> list[list[tuple[date, int]]]:
+        """Answers several ``(start, end)`` ranges in one call."""
+        return [self.range(start, end) for start, end in ranges]
+
+    def intersect(self, other: "AvailabilityCalendar") -> "AvailabilityCalendar":
+        """Slots free in both calendars, over the days both cover."""
+        start = max(self.start, other.start)
+        end = min(self.end, other.end)
+        days = (end - start).days + 1
+        if days <= 0:
+            return AvailabilityCalendar(start)
+        a = (start - self.start).days
+        b = (start - other.start).days
+        return AvailabilityCalendar(
+            start, map(int.__and__, self.masks[a : a + days], other.masks[b : b + days])
+        )
+
+    def to_dict(self) -> dict:
+        """JSON-ready form: the first day, the slot times and one mask per day."""
+        return {
+            "start": self.start.isoformat(),
+            "slot_times": list(SLOT_TIMES),
+            "masks": self.masks.tolist(),
+        }
+
+
+
+def generate_calendar(
+    days: int = DEFAULT_HORIZON_DAYS,
+    slots_per_day: int = DEFAULT_SLOTS_PER_DAY,
+    start: Optional[date] = None,
+    rng: random.Random = random,
+) -> AvailabilityCalendar:
+    """A calendar with ``slots_per_day`` random free slots on each of the next ``days`` days."""
+    indices = range(len(SLOT_TIMES))
+    return AvailabilityCalendar(
+        start or date.today(),
+        (sum(1 << i for i in rng.sample(indices, slots_per_day)) for _ in range(days)),
+    )
@@ -0,0 +1,80 @@
+"""Builds Nate's A2A server application.
+
+Kept apart from ``__main__`` so that each uvicorn worker process can import it.
+"""
+
+import os
+
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.types import (
+    AgentCapabilities,
+    AgentCard,
+    AgentSkill,
+)
+from agent import SchedulingAgent
+from agent_executor import SchedulingAgentExecutor
+from dotenv import load_dotenv
+from scheduling_common.task_store import create_task_store
+
+load_dotenv()
+
+# Bind address and number of worker processes
+HOST = os.getenv("NATE_HOST", "localhost")
+PORT = int(os.getenv("NATE_PORT", "10003"))
+WORKERS = int(os.getenv("NATE_WORKERS", "1"))
+
+
+def create_app():
+    """Builds Nate's A2A app; every uvicorn worker process calls this once."""
+    capabilities = AgentCapabilities(streaming=False)
+    skill = AgentSkill(
+        id="student_assistant",
+        name="Student Assistant - Nate",
+        description="Chat with Nate about his skills, interests, and availability.",
+        tags=["student", "skills", "schedule", "availability"],
+        examples=[
+            "What skills do you have?",
+            "Tell me about your technical abilities",
+            "What are you interested in?",
+            "Are you free tomorrow?",
+        ],
+    )
+    profile_skill = AgentSkill(
+        id="profile",
+        name="Structured Profile - Nate",
+        description="Returns Nate's skills, interests and communication style as JSON data, without a model call. Send a data part of {\"skill\": \"profile\"}.",
+        tags=["student", "profile", "structured"],
+        inputModes=["application/json"],
+        outputModes=["application/json"],
+    )
+    availability_skill = AgentSkill(
+        id="availability",
+        name="Structured Availability - Nate",
+        description="Returns Nate's free hourly slots as JSON data, one bitmask per day, without a model call. Send a data part of {\"skill\": \"availability\"}, optionally with \"start\" and \"end\" dates (YYYY-MM-DD).",
+        tags=["student", "availability", "schedule", "structured"],
+        inputModes=["application/json"],
+        outputModes=["application/json"],
+    )
+
+
+    agent_host_url = os.getenv("HOST_OVERRIDE") or os.getenv("NATE_PUBLIC_URL") or f"http://{HOST}:{PORT}/"
+    agent_card = AgentCard(
+        name="Nate Agent",
+        description="A friendly student agent representing Nate. Ask about his skills, interests, or schedule!",
+        url=agent_host_url,
+        version="1.0.0",
+        defaultInputModes=SchedulingAgent.SUPPORTED_CONTENT_TYPES,
+        defaultOutputModes=SchedulingAgent.SUPPORTED_CONTENT_TYPES,
+        capabilities=capabilities,
+        skills=[skill, profile_skill, availability_skill],
+    )
+
+    request_handler = DefaultRequestHandler(
+        agent_executor=SchedulingAgentExecutor(),
+        task_store=create_task_store("NATE"),
+    )
+    server = A2AStarletteApplication(
+        agent_card=agent_card, http_handler=request_handler
+    )
+    return server.build()